@@ -0,0 +1,124 @@
+import pygame
+from typing import List, Optional, Sequence, Tuple
+from src.controllers.frame_profiler import FrameProfiler
+
+
+class AIScheduler:
+    """
+    Level-of-detail scheduler for enemy AI updates.
+
+    Enemies are sorted into tiers by their distance outside the camera view,
+    which is computed like GameView.update_camera (centered on the player and
+    clamped to the map). A tier with period 1 updates every tick; a tier with
+    period N splits its enemies into N rotating buckets by their `ai_slot`, so
+    each enemy is updated every Nth tick with the dt accumulated meanwhile.
+    An enemy's tier is re-evaluated only when it is updated, so a skipped
+    enemy costs a modulo and an addition, and per-tick AI cost for far
+    enemies drops to about 1/N.
+
+    Slots are handed out in group order per level, so schedules are
+    deterministic and replays stay in sync.
+
+    Attributes:
+        tiers (Tuple[Tuple[Optional[float], int], ...]): (max distance outside
+            the view in pixels or None for unlimited, update period in ticks).
+        view_size (Tuple[int, int]): Camera view size in pixels.
+        tick (int): Ticks since the level started.
+        next_slot (int): Slot the next newly scheduled enemy gets.
+    """
+
+    def __init__(self, tiers: Sequence[Tuple[Optional[float], int]], view_size: Tuple[int, int],
+                 profiler: Optional[FrameProfiler] = None) -> None:
+        if not tiers or tiers[-1][0] is not None:
+            raise ValueError("The last AI tier must have an unlimited distance (None)")
+        self.tiers = tuple(tiers)
+        self.view_size = view_size
+        self.profiler = profiler
+        self.tick: int = 0
+        self.bounds: Optional[pygame.Rect] = None
+        self._limits: List[Optional[float]] = [None if limit is None else limit * limit for limit, _ in self.tiers]
+        self.next_slot: int = 0
+        if profiler:
+            profiler.info["ai lod"] = ", ".join(
+                f"tier{i} {'<=' + str(limit) + 'px' if limit is not None else 'beyond'} every {period}"
+                for i, (limit, period) in enumerate(self.tiers)
+            )
+
+    def reset(self, bounds: pygame.Rect) -> None:
+        """
+        Restart the schedule for a new level.
+
+        Args:
+            bounds (pygame.Rect): Map area the camera is clamped to.
+        """
+        self.bounds = bounds
+        self.tick = 0
+        self.next_slot = 0
+
+    def view_rect(self, center: Tuple[float, float]) -> pygame.Rect:
+        """
+        Return the camera view for a player position.
+
+        Args:
+            center (Tuple[float, float]): Player center.
+
+        Returns:
+            pygame.Rect: View rectangle in map coordinates.
+        """
+        view = pygame.Rect((0, 0), self.view_size)
+        view.center = (int(center[0]), int(center[1]))
+        if self.bounds is not None:
+            view.clamp_ip(self.bounds)
+        return view
+
+    def update(self, enemies: Sequence[pygame.sprite.Sprite], target: Tuple[float, float], dt: float) -> List[Tuple[pygame.sprite.Sprite, str]]:
+        """
+        Update the enemies that are due this tick.
+
+        Args:
+            enemies (Sequence[pygame.sprite.Sprite]): Enemies with `ai_slot`, `ai_period` and `ai_dt`.
+            target (Tuple[float, float]): Player position passed to Enemy.update.
+            dt (float): Delta time of this tick (seconds).
+
+        Returns:
+            List[Tuple[pygame.sprite.Sprite, str]]: (enemy, event) for every update that returned an event.
+        """
+        self.tick += 1
+        tick = self.tick
+        view = self.view_rect(target)
+        left, top, right, bottom = view.left, view.top, view.right, view.bottom
+        limits = self._limits
+        tiers = self.tiers
+        updated = [0] * len(tiers)
+        events: List[Tuple[pygame.sprite.Sprite, str]] = []
+
+        for enemy in enemies:
+            enemy.ai_dt += dt
+            period = enemy.ai_period
+            if period != 1 and (tick + enemy.ai_slot) % period:
+                continue
+            if enemy.ai_slot < 0:
+                enemy.ai_slot = self.next_slot
+                self.next_slot += 1
+
+            event = enemy.update(target, enemy.ai_dt)
+            enemy.ai_dt = 0.0
+            if event:
+                events.append((enemy, event))
+
+            # Pick the tier for the next updates from the new position
+            x, y = enemy.rect.center
+            dx = left - x if x < left else (x - right if x > right else 0)
+            dy = top - y if y < top else (y - bottom if y > bottom else 0)
+            distance_sq = dx * dx + dy * dy
+            index = 0
+            while limits[index] is not None and distance_sq > limits[index]:
+                index += 1
+            enemy.ai_period = tiers[index][1]
+            updated[index] += 1
+
+        if self.profiler:
+            self.profiler.count("ai.enemies", len(enemies))
+            for index, count in enumerate(updated):
+                self.profiler.count(f"ai.tier{index}.updated", count)
+        return events
@@ -1,50 +1,211 @@
+import os
+import sys
+import threading
 import pygame
-from typing import Optional
-from src.models.settings import DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME
+from typing import Dict, List, Optional, Tuple
+from src.models.settings import (
+    DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME, SFX_CHANNEL_POOLS, SFX_PRIORITIES, SFX_MAX_INSTANCES, SFX_DIR,
+    MUSIC_CROSSFADE_MS, MUSIC_CACHE_SIZE
+)
+from src.controllers.sfx_mixer import SfxMixer
+from src.controllers.music_controller import MusicController
 
 
 class AudioManager:
     """
     Manages music and sound effects playback, volume control,
     and caching of loaded sounds.
+
+    Sound effects are played through an SfxMixer, which bounds the number of
+    simultaneous voices per category and per sound. They can be decoded on a
+    background thread with load_manifest_async(); playing a sound that is not
+    loaded yet is a silent no-op, so callers never block on loading.
+
+    Music is played by a MusicController on dedicated channels: tracks are
+    decoded in the background (see prefetch_music) and switched with crossfades.
     """
 
     _music_volume: float = DEFAULT_MUSIC_VOLUME
     _sfx_volume: float = DEFAULT_SFX_VOLUME
 
-    _current_music: Optional[str] = None
     _sfx_cache: dict[str, pygame.mixer.Sound] = {}
     _weapon_sfx: dict[str, pygame.mixer.Sound] = {}
     _enemy_spawn_sfx: dict[str, pygame.mixer.Sound] = {}
     _boss_spawn_sfx: dict[str, pygame.mixer.Sound] = {}
     _step_sfx: Optional[pygame.mixer.Sound] = None
     _step_channel: Optional[pygame.mixer.Channel] = None
+    _mixer: Optional[SfxMixer] = None
+    _music: Optional[MusicController] = None
+    _sfx_lock: threading.Lock = threading.Lock()
+    _loader_thread: Optional[threading.Thread] = None
 
     @classmethod
     def init(cls) -> None:
-        """Initialize the pygame mixer and set initial music volume."""
+        """Initialize the pygame mixer, the voice pools and the music channels."""
         pygame.mixer.init()
-        pygame.mixer.music.set_volume(cls._music_volume)
+        cls._mixer = SfxMixer(SFX_CHANNEL_POOLS, SFX_PRIORITIES, SFX_MAX_INSTANCES)
+        cls._music = MusicController(sum(SFX_CHANNEL_POOLS.values()), cls._music_volume, MUSIC_CACHE_SIZE)
 
     @classmethod
-    def play_music(cls, music_path: str, loops: int = -1) -> None:
+    def _play(cls, category: str, name: str, sound: pygame.mixer.Sound, loops: int = 0) -> Optional[pygame.mixer.Channel]:
         """
-        Load and play background music if not already playing the same track.
+        Play a sound through the voice-limited mixer.
+
+        Args:
+            category (str): Mixer pool to play in.
+            name (str): Sound identifier for per-sound voice limits.
+            sound (pygame.mixer.Sound): Sound to play.
+            loops (int): Extra repetitions (-1 to loop forever).
+
+        Returns:
+            Optional[pygame.mixer.Channel]: Channel used, or None if the sound was dropped.
+        """
+        if cls._mixer is None:
+            return sound.play(loops=loops)
+        return cls._mixer.play(category, name, sound, loops=loops)
+
+    @classmethod
+    def _store_sfx(cls, store: Dict[str, pygame.mixer.Sound], key: str, filepath: str) -> None:
+        """
+        Decode a sound and add it to a cache, applying the current volume.
+
+        Decoding happens outside the lock so it can run on the loader thread
+        while the main thread keeps playing already loaded sounds.
+
+        Args:
+            store (Dict[str, pygame.mixer.Sound]): Cache to add the sound to.
+            key (str): Cache key.
+            filepath (str): Path to the sound file.
+        """
+        if key in store:
+            return
+        sound = pygame.mixer.Sound(filepath)
+        with cls._sfx_lock:
+            sound.set_volume(cls._sfx_volume)
+            store[key] = sound
+
+    @classmethod
+    def load_manifest(cls, manifest: List[Tuple[str, str, str]], sfx_dir: str = SFX_DIR) -> None:
+        """
+        Load every sound listed in a manifest, in order.
+
+        A sound that fails to load is reported on stderr and skipped, so one bad
+        file does not keep the rest of the manifest from loading.
+
+        Args:
+            manifest (List[Tuple[str, str, str]]): (category, name, filename) entries.
+            sfx_dir (str): Directory the filenames are relative to.
+        """
+        loaders = {
+            "ui": cls.load_sfx,
+            "weapons": cls.load_weapon_sfx,
+            "spawns": cls.load_enemy_spawn_sfx,
+            "bosses": cls.load_boss_spawn_sfx,
+        }
+        for category, name, filename in manifest:
+            if not pygame.mixer.get_init():
+                return  # Mixer shut down (e.g. game quit while still loading)
+            filepath = os.path.join(sfx_dir, filename)
+            if category != "steps" and category not in loaders:
+                print(f"Cannot load sound {name}: unknown category '{category}'", file=sys.stderr)
+                continue
+            try:
+                if category == "steps":
+                    cls.load_step_sfx(filepath)
+                else:
+                    loaders[category](name, filepath)
+            except (pygame.error, OSError) as e:
+                print(f"Cannot load sound {category}/{name} from {filepath}: {e}", file=sys.stderr)
+
+    @classmethod
+    def load_manifest_async(cls, manifest: List[Tuple[str, str, str]], sfx_dir: str = SFX_DIR) -> threading.Thread:
+        """
+        Load a manifest on a background thread and return immediately.
+
+        Args:
+            manifest (List[Tuple[str, str, str]]): (category, name, filename) entries, highest priority first.
+            sfx_dir (str): Directory the filenames are relative to.
+
+        Returns:
+            threading.Thread: The started loader thread.
+        """
+        cls._loader_thread = threading.Thread(
+            target=cls.load_manifest, args=(manifest, sfx_dir), name="sfx-loader", daemon=True
+        )
+        cls._loader_thread.start()
+        return cls._loader_thread
+
+    @classmethod
+    def sfx_loading_done(cls) -> bool:
+        """Return True once no background sound loading is in progress."""
+        return cls._loader_thread is None or not cls._loader_thread.is_alive()
+
+    @classmethod
+    def get_sfx_stats(cls) -> Dict[str, Dict[str, int]]:
+        """
+        Return per-category mixer counters.
+
+        Returns:
+            Dict[str, Dict[str, int]]: 'played', 'stolen' and 'dropped' counts per category.
+        """
+        return cls._mixer.stats if cls._mixer else {}
+
+    @classmethod
+    def play_music(cls, music_path: str, loops: int = -1, fade_ms: int = MUSIC_CROSSFADE_MS) -> None:
+        """
+        Crossfade to a background music track if not already playing it.
+
+        Never reads from disk on the calling thread: a track that was not
+        prefetched starts once the background decode has finished.
 
         Args:
             music_path (str): Path to music file.
             loops (int): Number of loops (-1 for infinite).
+            fade_ms (int): Crossfade duration in milliseconds.
+        """
+        if cls._music:
+            cls._music.play(music_path, loops=loops, fade_ms=fade_ms)
+
+    @classmethod
+    def prefetch_music(cls, music_path: str) -> None:
+        """
+        Decode a music track in the background so switching to it is instant.
+
+        Args:
+            music_path (str): Path to music file.
+        """
+        if cls._music:
+            cls._music.prefetch(music_path)
+
+    @classmethod
+    def queue_music(cls, music_path: str) -> None:
+        """
+        Play a music track after the current one finishes.
+
+        Args:
+            music_path (str): Path to music file.
         """
-        if cls._current_music != music_path:
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.play(loops=loops)
-            cls._current_music = music_path
+        if cls._music:
+            cls._music.queue(music_path)
+
+    @classmethod
+    def update_music(cls) -> None:
+        """Start decoded tracks and advance the music queue. Call once per frame."""
+        if cls._music:
+            cls._music.update()
 
     @classmethod
     def stop_music(cls) -> None:
         """Stop the background music playback."""
-        pygame.mixer.music.stop()
-        cls._current_music = None
+        if cls._music:
+            cls._music.stop()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the music and its loader thread. Call before pygame.quit()."""
+        if cls._music:
+            cls._music.shutdown()
+            cls._music = None
 
     @classmethod
     def set_music_volume(cls, volume: float) -> None:
@@ -55,7 +216,8 @@ class AudioManager:
             volume (float): Volume level.
         """
         cls._music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(cls._music_volume)
+        if cls._music:
+            cls._music.set_volume(cls._music_volume)
 
     @classmethod
     def get_music_volume(cls) -> float:
@@ -71,9 +233,7 @@ class AudioManager:
             name (str): Identifier for the sound effect.
             filepath (str): Path to the sound file.
         """
-        if name not in cls._sfx_cache:
-            cls._sfx_cache[name] = pygame.mixer.Sound(filepath)
-            cls._sfx_cache[name].set_volume(cls._sfx_volume)
+        cls._store_sfx(cls._sfx_cache, name, filepath)
 
     @classmethod
     def play_sfx(cls, name: str) -> None:
@@ -84,7 +244,7 @@ class AudioManager:
             name (str): Identifier of the sound effect.
         """
         if name in cls._sfx_cache:
-            cls._sfx_cache[name].play()
+            cls._play("ui", name, cls._sfx_cache[name])
 
     @classmethod
     def set_sfx_volume(cls, volume: float) -> None:
@@ -94,15 +254,18 @@ class AudioManager:
         Args:
             volume (float): Volume level.
         """
-        cls._sfx_volume = max(0.0, min(1.0, volume))
-        for sfx_dict in (
-            cls._sfx_cache,
-            cls._weapon_sfx,
-            cls._enemy_spawn_sfx,
-            cls._boss_spawn_sfx,
-        ):
-            for sfx in sfx_dict.values():
-                sfx.set_volume(cls._sfx_volume)
+        with cls._sfx_lock:
+            cls._sfx_volume = max(0.0, min(1.0, volume))
+            for sfx_dict in (
+                cls._sfx_cache,
+                cls._weapon_sfx,
+                cls._enemy_spawn_sfx,
+                cls._boss_spawn_sfx,
+            ):
+                for sfx in sfx_dict.values():
+                    sfx.set_volume(cls._sfx_volume)
+            if cls._step_sfx:
+                cls._step_sfx.set_volume(cls._sfx_volume)
 
     @classmethod
     def get_sfx_volume(cls) -> float:
@@ -120,9 +283,7 @@ class AudioManager:
             weapon_name (str): Name of the weapon.
             filepath (str): Path to sound file.
         """
-        if weapon_name not in cls._weapon_sfx:
-            cls._weapon_sfx[weapon_name] = pygame.mixer.Sound(filepath)
-            cls._weapon_sfx[weapon_name].set_volume(cls._sfx_volume)
+        cls._store_sfx(cls._weapon_sfx, weapon_name, filepath)
 
     @classmethod
     def play_weapon_sfx(cls, weapon_name: str) -> None:
@@ -133,7 +294,7 @@ class AudioManager:
             weapon_name (str): Name of the weapon.
         """
         if weapon_name in cls._weapon_sfx:
-            cls._weapon_sfx[weapon_name].play()
+            cls._play("weapons", weapon_name, cls._weapon_sfx[weapon_name])
 
     # ===== Enemy spawn sound effects =====
 
@@ -146,9 +307,7 @@ class AudioManager:
             enemy_type (str): Type of enemy.
             filepath (str): Path to sound file.
         """
-        if enemy_type not in cls._enemy_spawn_sfx:
-            cls._enemy_spawn_sfx[enemy_type] = pygame.mixer.Sound(filepath)
-            cls._enemy_spawn_sfx[enemy_type].set_volume(cls._sfx_volume)
+        cls._store_sfx(cls._enemy_spawn_sfx, enemy_type, filepath)
 
     @classmethod
     def play_enemy_spawn_sfx(cls, enemy_type: str) -> None:
@@ -159,7 +318,7 @@ class AudioManager:
             enemy_type (str): Type of enemy.
         """
         if enemy_type in cls._enemy_spawn_sfx:
-            cls._enemy_spawn_sfx[enemy_type].play()
+            cls._play("spawns", enemy_type, cls._enemy_spawn_sfx[enemy_type])
 
     # ===== Boss spawn sound effects =====
 
@@ -172,9 +331,7 @@ class AudioManager:
             boss_type (str): Type of boss.
             filepath (str): Path to sound file.
         """
-        if boss_type not in cls._boss_spawn_sfx:
-            cls._boss_spawn_sfx[boss_type] = pygame.mixer.Sound(filepath)
-            cls._boss_spawn_sfx[boss_type].set_volume(cls._sfx_volume)
+        cls._store_sfx(cls._boss_spawn_sfx, boss_type, filepath)
 
     @classmethod
     def play_boss_spawn_sfx(cls, boss_type: str) -> None:
@@ -185,7 +342,7 @@ class AudioManager:
             boss_type (str): Type of boss.
         """
         if boss_type in cls._boss_spawn_sfx:
-            cls._boss_spawn_sfx[boss_type].play()
+            cls._play("bosses", boss_type, cls._boss_spawn_sfx[boss_type])
 
     # ===== Step sound effect =====
 
@@ -198,8 +355,10 @@ class AudioManager:
             filepath (str): Path to sound file.
         """
         if cls._step_sfx is None:
-            cls._step_sfx = pygame.mixer.Sound(filepath)
-            cls._step_sfx.set_volume(cls._sfx_volume)
+            sound = pygame.mixer.Sound(filepath)
+            with cls._sfx_lock:
+                sound.set_volume(cls._sfx_volume)
+                cls._step_sfx = sound
 
     @classmethod
     def play_step_sfx(cls) -> None:
@@ -207,7 +366,7 @@ class AudioManager:
         Play looping step sound effect if not already playing.
         """
         if cls._step_sfx and (cls._step_channel is None or not cls._step_channel.get_busy()):
-            cls._step_channel = cls._step_sfx.play(loops=-1)
+            cls._step_channel = cls._play("steps", "steps", cls._step_sfx, loops=-1)
 
     @classmethod
     def stop_step_sfx(cls) -> None:
@@ -0,0 +1,138 @@
+import pygame
+from typing import Dict, List, Optional, Sequence, Union
+from src.models.projectile import EnemyProjectile
+from src.models.settings import ENEMY_PROJECTILE_SPEED
+
+
+class EnemyFireSystem:
+    """
+    Spawns and resolves hostile projectiles from a preallocated pool.
+
+    Shooting enemies only report a "shoot" event from update(); the level
+    manager collects those events for the tick and hands them over in one
+    batch. Bullets come from a fixed pool of EnemyProjectile sprites, live in
+    their own group, and go back to the pool when they leave the level or hit
+    the player, so heavy boss patterns never allocate sprites mid-fight.
+
+    Attributes:
+        group (pygame.sprite.Group): Active hostile projectiles.
+        bounds (pygame.Rect): Area outside of which bullets are recycled.
+        pool_size (int): Number of preallocated projectiles.
+        stats (Dict[str, int]): 'fired', 'dropped' (pool exhausted) and 'hits' counters.
+    """
+
+    def __init__(self, pool_size: int) -> None:
+        self.group: pygame.sprite.Group = pygame.sprite.Group()
+        self.bounds: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+        self.pool_size = pool_size
+        self.stats: Dict[str, int] = {"fired": 0, "dropped": 0, "hits": 0}
+        self._free: List[EnemyProjectile] = []
+
+    def reset(self, bounds: pygame.Rect) -> None:
+        """
+        Return every bullet to the pool and set the level bounds.
+
+        The pool is allocated on the first call, once a display mode exists
+        for the projectile image to be converted.
+
+        Args:
+            bounds (pygame.Rect): Level area; bullets leaving it are recycled.
+        """
+        if not self._free and not self.group:
+            self._free = [EnemyProjectile() for _ in range(self.pool_size)]
+        for bullet in self.group.sprites():
+            self.release(bullet)
+        self.bounds = bounds
+
+    def release(self, bullet: EnemyProjectile) -> None:
+        """
+        Remove a bullet from play and return it to the pool.
+
+        Args:
+            bullet (EnemyProjectile): Active bullet.
+        """
+        bullet.kill()
+        self._free.append(bullet)
+
+    def fire(self, shooters: Sequence[pygame.sprite.Sprite], target: Union[tuple[float, float], pygame.Vector2]) -> None:
+        """
+        Fire one volley for each shooter of this tick.
+
+        A volley of `volley_size` bullets is spread evenly around the
+        direction from the shooter to the target.
+
+        Args:
+            shooters (Sequence[pygame.sprite.Sprite]): Enemies that reported "shoot".
+            target (tuple[float, float] | pygame.Vector2): Position to aim at.
+        """
+        target = pygame.Vector2(target)
+        for shooter in shooters:
+            aim = target - shooter.pos
+            if aim.length_squared() == 0:
+                aim.update(0, 1)
+            aim.scale_to_length(ENEMY_PROJECTILE_SPEED)
+            volley = getattr(shooter, "volley_size", 1)
+            step = 360 / volley
+            for i in range(volley):
+                if self.spawn(shooter.pos, aim.rotate(i * step)) is None:
+                    self.stats["dropped"] += volley - i
+                    break
+                self.stats["fired"] += 1
+
+    def spawn(self, pos: Union[tuple[float, float], pygame.Vector2], velocity: pygame.Vector2) -> Optional[EnemyProjectile]:
+        """
+        Put one bullet from the pool in play, e.g. a shot or a bullet restored from a snapshot.
+
+        Args:
+            pos (tuple[float, float] | pygame.Vector2): Starting position.
+            velocity (pygame.Vector2): Velocity in pixels per second.
+
+        Returns:
+            Optional[EnemyProjectile]: The bullet, or None if the pool is exhausted.
+        """
+        if not self._free:
+            return None
+        bullet = self._free.pop()
+        bullet.launch(pos, velocity)
+        self.group.add(bullet)
+        return bullet
+
+    def update(self, dt: float) -> None:
+        """
+        Move all bullets and recycle those that left the level.
+
+        Args:
+            dt (float): Delta time since last update (seconds).
+        """
+        self.group.update(dt)
+        bounds = self.bounds
+        for bullet in self.group.sprites():
+            if not bounds.colliderect(bullet.rect):
+                self.release(bullet)
+
+    def hit_player(self, player: pygame.sprite.Sprite) -> int:
+        """
+        Damage the player with every bullet touching them.
+
+        A single Rect.collidelistall call over all bullet rects is the
+        broadphase; only its candidates get a mask test.
+
+        Args:
+            player (pygame.sprite.Sprite): Player with `rect`, `mask` and `take_damage`.
+
+        Returns:
+            int: Total damage dealt this tick.
+        """
+        bullets = self.group.sprites()
+        if not bullets:
+            return 0
+        damage = 0
+        for index in player.rect.collidelistall([bullet.rect for bullet in bullets]):
+            bullet = bullets[index]
+            if pygame.sprite.collide_mask(player, bullet):
+                damage += bullet.damage
+                self.stats["hits"] += 1
+                self.release(bullet)
+        if damage:
+            player.take_damage(damage)
+        return damage
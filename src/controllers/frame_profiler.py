@@ -0,0 +1,128 @@
+import time
+from collections import deque
+from typing import Deque, Dict, List
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.add_time(self.name, (time.perf_counter() - self.start) * 1000)
+
+
+class _NullSection:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """
+    Per-frame timings of named sections plus per-frame counters.
+
+    Subsystems time their work with `section(name)` and report what they did
+    with `count(name, amount)`; `end_frame()` closes the frame. Timings keep a
+    rolling window of recent frames for percentiles. A disabled profiler
+    hands out a shared no-op section, so instrumented code costs next to
+    nothing when profiling is off.
+
+    Attributes:
+        enabled (bool): Whether timings and counters are collected.
+        frames (int): Number of completed frames.
+        info (Dict[str, str]): Static configuration shown at the top of the report.
+    """
+
+    def __init__(self, enabled: bool = True, window: int = 3600) -> None:
+        self.enabled = enabled
+        self.frames: int = 0
+        self.info: Dict[str, str] = {}
+        self._window = window
+        self._current: Dict[str, float] = {}
+        self._times: Dict[str, Deque[float]] = {}
+        self._counters: Dict[str, int] = {}
+        self._frame_counters: Dict[str, int] = {}
+        self._peaks: Dict[str, int] = {}
+
+    def section(self, name: str):
+        """
+        Return a context manager that adds the enclosed block's time to a section.
+
+        Args:
+            name (str): Section name, e.g. "ai" or "draw".
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def add_time(self, name: str, ms: float) -> None:
+        """
+        Add time to a section of the current frame.
+
+        Args:
+            name (str): Section name.
+            ms (float): Milliseconds spent.
+        """
+        self._current[name] = self._current.get(name, 0.0) + ms
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Add to a counter of the current frame.
+
+        Args:
+            name (str): Counter name, e.g. "ai.updated".
+            amount (int): Amount to add.
+        """
+        if self.enabled:
+            self._frame_counters[name] = self._frame_counters.get(name, 0) + amount
+
+    def end_frame(self) -> None:
+        """
+        Close the current frame and fold its timings and counters into the totals.
+        """
+        if not self.enabled:
+            return
+        self.frames += 1
+        for name, ms in self._current.items():
+            times = self._times.get(name)
+            if times is None:
+                times = self._times[name] = deque(maxlen=self._window)
+            times.append(ms)
+        for name, amount in self._frame_counters.items():
+            self._counters[name] = self._counters.get(name, 0) + amount
+            if amount > self._peaks.get(name, 0):
+                self._peaks[name] = amount
+        self._current.clear()
+        self._frame_counters.clear()
+
+    def report(self) -> str:
+        """
+        Format the collected data.
+
+        Returns:
+            str: Configuration lines, then section timings (mean/p95/max ms over
+            the window) and counters (mean and peak per frame).
+        """
+        lines: List[str] = [f"{name}: {value}" for name, value in self.info.items()]
+        lines.append(f"frames: {self.frames}")
+        lines.append(f"{'section':<24} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        for name, times in sorted(self._times.items()):
+            ordered = sorted(times)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            lines.append(f"{name:<24} {sum(ordered) / len(ordered):8.3f} {p95:8.3f} {ordered[-1]:8.3f}")
+        if self._counters:
+            lines.append(f"{'counter':<24} {'per frame':>9} {'peak':>8}")
+            for name, total in sorted(self._counters.items()):
+                lines.append(f"{name:<24} {total / max(self.frames, 1):9.1f} {self._peaks.get(name, 0):8d}")
+        return "\n".join(lines)
@@ -0,0 +1,42 @@
+from typing import Optional
+from src.controllers.input_handler import InputHandler
+from src.controllers.latency_tracker import LatencyTracker
+from src.controllers.level_manager import LevelManager
+from src.models.player import Player
+
+
+def update_gameplay(
+    player: Player,
+    level_manager: LevelManager,
+    input_handler: InputHandler,
+    dt: float,
+    current_time: int,
+    latency_tracker: Optional[LatencyTracker] = None,
+) -> None:
+    """
+    Advance the simulation by one gameplay tick using only the input handler state.
+
+    Shared by the main loop and the replay/benchmark tools so that a recorded
+    session drives exactly the same code path as live play.
+
+    Args:
+        player (Player): The player sprite.
+        level_manager (LevelManager): Level manager owning enemies and projectiles.
+        input_handler (InputHandler): Input state for this tick.
+        dt (float): Delta time in seconds.
+        current_time (int): Game time in milliseconds, used for weapon cooldowns.
+        latency_tracker (Optional[LatencyTracker]): Tagged when a move or shot takes effect.
+    """
+    previous_pos = player.rect.topleft
+    player.update(input_handler.get_movement_vector(), dt=dt)
+    if latency_tracker and player.rect.topleft != previous_pos:
+        latency_tracker.effect("move")
+
+    level_manager.update(dt, player)
+
+    # Shooting while the fire button is held
+    if input_handler.is_shooting:
+        previous_shot = player.last_shot_time
+        player.shoot(input_handler.mouse_pos, current_time, level_manager.get_projectile_group())
+        if latency_tracker and player.last_shot_time != previous_shot:
+            latency_tracker.effect("shoot")
@@ -1,11 +1,62 @@
 import pygame
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+from src.controllers.latency_tracker import LatencyTracker
+
+# Input actions are the InputHandler attributes they drive. Held actions follow
+# the key/button state; trigger actions are set for one frame on press only.
+HELD_ACTIONS = ("move_up", "move_down", "move_left", "move_right", "is_shooting")
+TRIGGER_ACTIONS = ("pause_requested", "latency_overlay_requested")
+
+# Input kinds reported to the latency tracker for each action
+LATENCY_KINDS: Dict[str, str] = {
+    "move_up": "move",
+    "move_down": "move",
+    "move_left": "move",
+    "move_right": "move",
+    "is_shooting": "shoot",
+}
+
+DEFAULT_KEY_BINDINGS: Dict[int, str] = {
+    pygame.K_ESCAPE: "pause_requested",
+    pygame.K_w: "move_up",
+    pygame.K_s: "move_down",
+    pygame.K_a: "move_left",
+    pygame.K_d: "move_right",
+    pygame.K_SPACE: "is_shooting",
+    pygame.K_F3: "latency_overlay_requested",
+}
+
+DEFAULT_MOUSE_BINDINGS: Dict[int, str] = {
+    1: "is_shooting",  # Left mouse button
+}
+
+# Event types anything in the game consumes; all others are dropped by SDL
+CONSUMED_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.WINDOWCLOSE,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+]
 
 
 class InputHandler:
     """
     Handles keyboard and mouse input state for player movement,
     shooting, and game control such as pause and quit.
+
+    Keys and mouse buttons are mapped to actions through rebindable
+    dictionaries, and events are dispatched by type through a lookup table.
+
+    Attributes:
+        key_bindings (Dict[int, str]): Key code to action mapping.
+        mouse_bindings (Dict[int, str]): Mouse button to action mapping.
+        ui_events (List[pygame.event.Event]): Mouse events from the last
+            process_events() call for menus, with motion bursts coalesced.
+        latency_tracker (Optional[LatencyTracker]): If set, stamped with every
+            movement or shooting input as it arrives.
     """
 
     def __init__(self) -> None:
@@ -24,57 +75,140 @@ class InputHandler:
         # Flags for menu control and quitting the game
         self.pause_requested: bool = False
         self.quit_requested: bool = False
+        self.latency_overlay_requested: bool = False
+
+        self.key_bindings: Dict[int, str] = dict(DEFAULT_KEY_BINDINGS)
+        self.mouse_bindings: Dict[int, str] = dict(DEFAULT_MOUSE_BINDINGS)
+        self.ui_events: List[pygame.event.Event] = []
+        self.latency_tracker: Optional[LatencyTracker] = None
+
+        self._handlers: Dict[int, Callable[[pygame.event.Event], None]] = {
+            pygame.QUIT: self._on_quit,
+            pygame.WINDOWCLOSE: self._on_quit,  # the SDL2 backend window; a hidden display window stays open
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.KEYUP: self._on_key_up,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+        }
+
+    @staticmethod
+    def install_event_filter() -> None:
+        """
+        Make SDL drop every event type the game does not consume,
+        so they never reach the Python-side event queue.
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(CONSUMED_EVENT_TYPES)
+
+    def bind_key(self, key: int, action: str) -> None:
+        """
+        Bind a key to an action, replacing the key's previous binding.
+
+        Args:
+            key (int): pygame key code.
+            action (str): One of HELD_ACTIONS or TRIGGER_ACTIONS.
+
+        Raises:
+            ValueError: If the action is unknown.
+        """
+        if action not in HELD_ACTIONS and action not in TRIGGER_ACTIONS:
+            raise ValueError(f"Unknown input action: {action}")
+        self.key_bindings[key] = action
+
+    def unbind_key(self, key: int) -> None:
+        """
+        Remove a key binding if present.
+
+        Args:
+            key (int): pygame key code.
+        """
+        self.key_bindings.pop(key, None)
 
-    def process_events(self, events: List[pygame.event.Event]) -> None:
+    def process_events(self, events: List[pygame.event.Event]) -> List[pygame.event.Event]:
         """
-        Process a list of pygame events to update input states.
+        Process a list of pygame events to update input states in a single pass.
+
+        Consecutive MOUSEMOTION events are coalesced to the latest one.
 
         Args:
             events (List[pygame.event.Event]): List of events to process.
+
+        Returns:
+            List[pygame.event.Event]: Mouse events for menus (also kept in ui_events).
         """
-        self.pause_requested = False  # reset before processing new events
+        for action in TRIGGER_ACTIONS:  # reset before processing new events
+            setattr(self, action, False)
         self.quit_requested = False
+        self.ui_events = []
 
+        handlers = self._handlers
+        pending_motion = None
         for event in events:
-            if event.type == pygame.QUIT:
-                self.quit_requested = True
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.pause_requested = True
-                elif event.key == pygame.K_w:
-                    self.move_up = True
-                elif event.key == pygame.K_s:
-                    self.move_down = True
-                elif event.key == pygame.K_a:
-                    self.move_left = True
-                elif event.key == pygame.K_d:
-                    self.move_right = True
-                elif event.key == pygame.K_SPACE:
-                    self.is_shooting = True
-
-            elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_w:
-                    self.move_up = False
-                elif event.key == pygame.K_s:
-                    self.move_down = False
-                elif event.key == pygame.K_a:
-                    self.move_left = False
-                elif event.key == pygame.K_d:
-                    self.move_right = False
-                elif event.key == pygame.K_SPACE:
-                    self.is_shooting = False
-
-            elif event.type == pygame.MOUSEMOTION:
-                self.mouse_pos = event.pos
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left mouse button for shooting
-                    self.is_shooting = True
-
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
-                    self.is_shooting = False
+            if event.type == pygame.MOUSEMOTION:
+                pending_motion = event
+                continue
+            if pending_motion is not None:
+                self._on_mouse_motion(pending_motion)
+                pending_motion = None
+            handler = handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+        if pending_motion is not None:
+            self._on_mouse_motion(pending_motion)
+
+        return self.ui_events
+
+    def _on_quit(self, event: pygame.event.Event) -> None:
+        self.quit_requested = True
+
+    def _on_key_down(self, event: pygame.event.Event) -> None:
+        action = self.key_bindings.get(event.key)
+        if action is not None:
+            setattr(self, action, True)
+            self._stamp_latency(action)
+
+    def _on_key_up(self, event: pygame.event.Event) -> None:
+        action = self.key_bindings.get(event.key)
+        if action in HELD_ACTIONS:
+            setattr(self, action, False)
+
+    def _on_mouse_motion(self, event: pygame.event.Event) -> None:
+        self.mouse_pos = event.pos
+        self.ui_events.append(event)
+
+    def _on_mouse_button_down(self, event: pygame.event.Event) -> None:
+        action = self.mouse_bindings.get(event.button)
+        if action is not None:
+            setattr(self, action, True)
+            self._stamp_latency(action)
+        self.ui_events.append(event)
+
+    def _stamp_latency(self, action: str) -> None:
+        if self.latency_tracker is not None and action in LATENCY_KINDS:
+            self.latency_tracker.input_received(LATENCY_KINDS[action])
+
+    def _on_mouse_button_up(self, event: pygame.event.Event) -> None:
+        action = self.mouse_bindings.get(event.button)
+        if action in HELD_ACTIONS:
+            setattr(self, action, False)
+        self.ui_events.append(event)
+
+    def apply_state(self, movement_vector: Tuple[int, int], mouse_pos: Tuple[int, int], is_shooting: bool) -> None:
+        """
+        Overwrite the gameplay input state directly, e.g. from a recorded session.
+
+        Args:
+            movement_vector (Tuple[int, int]): Movement direction (x, y), components -1, 0 or 1.
+            mouse_pos (Tuple[int, int]): Aim position.
+            is_shooting (bool): Whether the fire button is held.
+        """
+        dx, dy = movement_vector
+        self.move_left = dx < 0
+        self.move_right = dx > 0
+        self.move_up = dy < 0
+        self.move_down = dy > 0
+        self.mouse_pos = mouse_pos
+        self.is_shooting = is_shooting
 
     def get_movement_vector(self) -> Tuple[int, int]:
         """
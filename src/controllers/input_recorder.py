@@ -0,0 +1,307 @@
+import struct
+from typing import Any, List, Optional, Tuple
+from src.controllers.input_handler import InputHandler
+
+# Recording layout (little-endian): a header, then for every session a session
+# header followed by one fixed-size record per tick.
+RECORDING_MAGIC = b"DSIR"
+RECORDING_VERSION = 4
+
+_HEADER = struct.Struct("<4sHH")  # magic, version, session count
+_PREAMBLE = struct.Struct("<4sH")  # magic, version: the part every version shares
+# starting level, session seed, tick count, then the starting state:
+# game time (ms), boss index, player health, player x, player y, weapon name
+_SESSION = struct.Struct("<HIIIBHhh16s")
+_TICK = struct.Struct("<HhhB")  # dt (ms), aim x, aim y, flags
+
+# Flag bits: two bits per movement axis (1 = negative, 2 = positive), then fire
+_FLAG_LEFT = 0x01
+_FLAG_RIGHT = 0x02
+_FLAG_UP = 0x04
+_FLAG_DOWN = 0x08
+_FLAG_FIRE = 0x10
+
+TickRecord = Tuple[int, int, int, int]
+
+
+class InputRecordingError(ValueError):
+    """Raised when an input recording is malformed or from an unsupported version."""
+
+
+def _pack_flags(movement: Tuple[int, int], is_shooting: bool) -> int:
+    dx, dy = movement
+    flags = 0
+    if dx < 0:
+        flags |= _FLAG_LEFT
+    elif dx > 0:
+        flags |= _FLAG_RIGHT
+    if dy < 0:
+        flags |= _FLAG_UP
+    elif dy > 0:
+        flags |= _FLAG_DOWN
+    if is_shooting:
+        flags |= _FLAG_FIRE
+    return flags
+
+
+class StartState:
+    """
+    Game state a recording starts from, besides the level and seed.
+
+    A new game always starts the same way, but Continue restores health and
+    weapon from the save, so the replay has to restore them too.
+
+    Attributes:
+        game_time (int): Gameplay time in milliseconds, which weapon cooldowns compare against.
+        boss_index (int): LevelManager boss index.
+        health (int): Player health.
+        pos (Tuple[int, int]): Player center.
+        weapon (str): Name of the equipped weapon.
+    """
+
+    def __init__(self, game_time: int = 0, boss_index: int = 0, health: int = 0,
+                 pos: Tuple[int, int] = (0, 0), weapon: str = "Pistol") -> None:
+        self.game_time = game_time
+        self.boss_index = boss_index
+        self.health = health
+        self.pos = pos
+        self.weapon = weapon
+
+    @classmethod
+    def capture(cls, level_manager: Any, player: Any, game_time: int) -> "StartState":
+        """
+        Capture the starting state of a session.
+
+        Args:
+            level_manager (LevelManager): Level manager of the session.
+            player (Player): The player.
+            game_time (int): Current gameplay time in milliseconds.
+
+        Returns:
+            StartState: The captured state.
+        """
+        return cls(game_time, level_manager.boss_index, player.health, player.rect.center, player.weapon.name)
+
+    def apply(self, level_manager: Any, player: Any) -> None:
+        """
+        Restore the captured state; the level itself must already be started.
+
+        Args:
+            level_manager (LevelManager): Level manager to restore the boss index of.
+            player (Player): Player to restore.
+        """
+        level_manager.boss_index = self.boss_index
+        player.move_to(self.pos)
+        player.health = self.health
+        player.switch_weapon(self.weapon)
+        player.last_shot_time = 0
+
+
+class RecordedSession:
+    """
+    One session of a recording: from New Game or Continue until death or quit.
+
+    Attributes:
+        level (int): Level the session starts on.
+        seed (int): LevelManager seed of the session.
+        start (StartState): State the session starts from.
+        ticks (List[TickRecord]): Recorded (dt_ms, aim x, aim y, flags) tuples.
+    """
+
+    def __init__(self, level: int = 1, seed: int = 0, start: Optional[StartState] = None,
+                 ticks: Optional[List[TickRecord]] = None) -> None:
+        self.level: int = level
+        self.seed: int = seed
+        self.start: StartState = start if start is not None else StartState()
+        self.ticks: List[TickRecord] = ticks if ticks is not None else []
+
+
+class InputRecorder:
+    """
+    Records per-tick gameplay input state into a compact binary log.
+
+    Each tick stores the frame delta time, aim position, movement direction
+    and fire button, which is everything the gameplay update consumes. Every
+    New Game or Continue of the run begins a new session with the level, seed
+    and StartState it started from, so a replay can restart the level where
+    the player did.
+
+    Attributes:
+        sessions (List[RecordedSession]): Recorded sessions, the current one last.
+    """
+
+    def __init__(self) -> None:
+        self.sessions: List[RecordedSession] = []
+
+    def begin(self, level_manager: Any, player: Any, game_time: int) -> None:
+        """
+        Begin a new session, taking its level, seed and starting state.
+
+        A previous session without ticks is replaced rather than kept.
+
+        Args:
+            level_manager (LevelManager): Level manager with the level already started.
+            player (Player): The player, with its starting health and weapon set.
+            game_time (int): Current gameplay time in milliseconds.
+        """
+        if self.sessions and not self.sessions[-1].ticks:
+            self.sessions.pop()
+        self.sessions.append(RecordedSession(level_manager.current_level, level_manager.seed,
+                                             StartState.capture(level_manager, player, game_time)))
+
+    def record(self, input_handler: InputHandler, dt_ms: int) -> None:
+        """
+        Append the current input state as one tick of the current session.
+
+        Args:
+            input_handler (InputHandler): Handler holding the live input state.
+            dt_ms (int): Delta time used for this tick in milliseconds.
+        """
+        x, y = input_handler.mouse_pos
+        flags = _pack_flags(input_handler.get_movement_vector(), input_handler.is_shooting)
+        self.sessions[-1].ticks.append((dt_ms, x, y, flags))
+
+    def to_bytes(self) -> bytes:
+        """Return the recording as bytes."""
+        sessions = [session for session in self.sessions if session.ticks]
+        size = _HEADER.size + sum(_SESSION.size + _TICK.size * len(session.ticks) for session in sessions)
+        buffer = bytearray(size)
+        _HEADER.pack_into(buffer, 0, RECORDING_MAGIC, RECORDING_VERSION, len(sessions))
+        offset = _HEADER.size
+        for session in sessions:
+            start = session.start
+            _SESSION.pack_into(buffer, offset, session.level, session.seed, len(session.ticks),
+                               start.game_time, start.boss_index, start.health, *start.pos,
+                               start.weapon.encode("ascii"))
+            offset += _SESSION.size
+            for tick in session.ticks:
+                _TICK.pack_into(buffer, offset, *tick)
+                offset += _TICK.size
+        return bytes(buffer)
+
+    def save(self, path: str) -> None:
+        """
+        Write the recording to a file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class InputReplayer:
+    """
+    Feeds a recorded input log back through an InputHandler tick by tick.
+
+    Sessions are replayed in order: next_session() moves to the next one,
+    whose level must then be started and whose `start` applied to the level
+    manager and player before apply_next() feeds its first tick.
+
+    Attributes:
+        sessions (List[RecordedSession]): Recorded sessions.
+        session (Optional[RecordedSession]): Session being replayed.
+        index (int): Index of the next tick in the current session.
+    """
+
+    def __init__(self, sessions: List[RecordedSession]) -> None:
+        self.sessions = sessions
+        self.session: Optional[RecordedSession] = None
+        self._next_session: int = 0
+        self.index: int = 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputReplayer":
+        """
+        Parse a recording produced by InputRecorder.
+
+        Args:
+            data (bytes): Recording contents.
+
+        Returns:
+            InputReplayer: Replayer positioned before the first session.
+
+        Raises:
+            InputRecordingError: If the data is truncated or has a bad header.
+        """
+        if len(data) < _PREAMBLE.size:
+            raise InputRecordingError("Recording is truncated")
+        magic, version = _PREAMBLE.unpack_from(data, 0)
+        if magic != RECORDING_MAGIC:
+            raise InputRecordingError("Not an input recording")
+        if version != RECORDING_VERSION:
+            raise InputRecordingError(f"Unsupported recording version {version}")
+        if len(data) < _HEADER.size:
+            raise InputRecordingError("Recording is truncated")
+        count = _HEADER.unpack_from(data, 0)[2]
+        view = memoryview(data)
+        offset = _HEADER.size
+        sessions = []
+        for _ in range(count):
+            if len(data) < offset + _SESSION.size:
+                raise InputRecordingError("Recording is truncated")
+            level, seed, ticks, game_time, boss_index, health, x, y, weapon = _SESSION.unpack_from(data, offset)
+            offset += _SESSION.size
+            end = offset + _TICK.size * ticks
+            if len(data) < end:
+                raise InputRecordingError("Recording is truncated")
+            start = StartState(game_time, boss_index, health, (x, y), weapon.rstrip(b"\0").decode("ascii"))
+            sessions.append(RecordedSession(level, seed, start, list(_TICK.iter_unpack(view[offset:end]))))
+            offset = end
+        if offset != len(data):
+            raise InputRecordingError("Recording size does not match its tick counts")
+        return cls(sessions)
+
+    @classmethod
+    def load(cls, path: str) -> "InputReplayer":
+        """
+        Load a recording from a file.
+
+        Args:
+            path (str): Recording file path.
+
+        Returns:
+            InputReplayer: Replayer positioned before the first session.
+        """
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def next_session(self) -> Optional[RecordedSession]:
+        """
+        Move on to the next session.
+
+        Returns:
+            Optional[RecordedSession]: The session to start, or None when all were replayed.
+        """
+        if self._next_session >= len(self.sessions):
+            self.session = None
+            return None
+        self.session = self.sessions[self._next_session]
+        self._next_session += 1
+        self.index = 0
+        return self.session
+
+    @property
+    def finished(self) -> bool:
+        """Whether every tick of the current session has been replayed."""
+        return self.session is None or self.index >= len(self.session.ticks)
+
+    def apply_next(self, input_handler: InputHandler) -> Optional[int]:
+        """
+        Apply the next recorded tick of the current session to the input handler.
+
+        Args:
+            input_handler (InputHandler): Handler to overwrite with recorded state.
+
+        Returns:
+            Optional[int]: Recorded delta time in milliseconds, or None when the session is finished.
+        """
+        if self.finished:
+            return None
+        dt_ms, x, y, flags = self.session.ticks[self.index]
+        self.index += 1
+
+        dx = -1 if flags & _FLAG_LEFT else (1 if flags & _FLAG_RIGHT else 0)
+        dy = -1 if flags & _FLAG_UP else (1 if flags & _FLAG_DOWN else 0)
+        input_handler.apply_state((dx, dy), (x, y), bool(flags & _FLAG_FIRE))
+        return dt_ms
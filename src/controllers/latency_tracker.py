@@ -0,0 +1,133 @@
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+
+
+class LatencyTracker:
+    """
+    Measures input-to-photon latency: the time from an input event reaching
+    InputHandler until the frame showing its effect has been presented.
+
+    Inputs are stamped per kind ("move", "shoot") when they arrive. When the
+    simulation produces the matching effect the stamp is tagged, and at the next
+    present the elapsed time is recorded into a fixed-bin histogram.
+
+    Attributes:
+        bin_ms (float): Histogram bin width in milliseconds.
+        bins (List[int]): Sample counts per bin; the last bin collects overflow.
+        counts (Dict[str, int]): Number of samples per input kind.
+    """
+
+    def __init__(self, max_ms: float = 250.0, bin_ms: float = 1.0) -> None:
+        self.bin_ms = bin_ms
+        self.max_ms = max_ms
+        self.bins: List[int] = [0] * (int(max_ms / bin_ms) + 1)
+        self.counts: Dict[str, int] = {}
+        self._total_ms: float = 0.0
+        self._pending: Dict[str, float] = {}
+        self._tagged: List[Tuple[str, float]] = []
+
+    def input_received(self, kind: str) -> None:
+        """
+        Stamp an input of the given kind, keeping the earliest unanswered one.
+
+        Args:
+            kind (str): Input kind, e.g. "move" or "shoot".
+        """
+        self._pending.setdefault(kind, time.perf_counter())
+
+    def effect(self, kind: str) -> None:
+        """
+        Tag the pending input of this kind as reflected in the simulation.
+
+        Args:
+            kind (str): Input kind whose effect just happened.
+        """
+        stamp = self._pending.pop(kind, None)
+        if stamp is not None:
+            self._tagged.append((kind, stamp))
+
+    def frame_presented(self) -> None:
+        """
+        Record tagged inputs as presented. Call right after pygame.display.flip().
+
+        Inputs that produced no effect within max_ms (e.g. moving into a wall)
+        are discarded so they do not inflate a later measurement.
+        """
+        now = time.perf_counter()
+        for kind, stamp in self._tagged:
+            self._record(kind, (now - stamp) * 1000)
+        self._tagged.clear()
+
+        expired = [kind for kind, stamp in self._pending.items() if (now - stamp) * 1000 > self.max_ms]
+        for kind in expired:
+            del self._pending[kind]
+
+    def _record(self, kind: str, latency_ms: float) -> None:
+        index = min(int(latency_ms / self.bin_ms), len(self.bins) - 1)
+        self.bins[index] += 1
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self._total_ms += latency_ms
+
+    @property
+    def sample_count(self) -> int:
+        """Total number of recorded samples."""
+        return sum(self.counts.values())
+
+    def mean(self) -> float:
+        """Return the mean latency in milliseconds (0.0 without samples)."""
+        count = self.sample_count
+        return self._total_ms / count if count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Return an approximate latency percentile from the histogram.
+
+        Args:
+            pct (float): Percentile in the range 0-100.
+
+        Returns:
+            float: Upper edge of the bin holding the percentile, in milliseconds.
+        """
+        count = self.sample_count
+        if not count:
+            return 0.0
+        target = pct / 100 * count
+        seen = 0
+        for index, bin_count in enumerate(self.bins):
+            seen += bin_count
+            if seen >= target:
+                return (index + 1) * self.bin_ms
+        return len(self.bins) * self.bin_ms
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the headline statistics.
+
+        Returns:
+            Dict[str, float]: 'count', 'mean', 'p50', 'p95' and 'p99' (milliseconds).
+        """
+        return {
+            'count': self.sample_count,
+            'mean': self.mean(),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+    def export(self, path: str) -> None:
+        """
+        Write the histogram and summary to a JSON file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                'bin_ms': self.bin_ms,
+                'bins': self.bins,
+                'counts': self.counts,
+                'summary': self.summary(),
+            }, f, indent=2)
@@ -0,0 +1,206 @@
+import gc
+import sys
+import tracemalloc
+import pygame
+from typing import Any, Dict, List, Optional, TextIO
+from src.models.enemy import Enemy
+from src.models.projectile import Projectile
+
+# Allocations made by the import system, tracemalloc and the detector itself are not the game's
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def count_instances(watched: Dict[str, type]) -> Dict[str, int]:
+    """
+    Count live instances of the watched types.
+
+    Objects tracked by the garbage collector are found directly. Others, like
+    pygame.Surface and pygame.Mask, are found through the references held by
+    tracked objects (looking inside untracked containers such as tuples of
+    surfaces); instances referenced only from C code are not seen.
+
+    Args:
+        watched (Dict[str, type]): Name -> type to count.
+
+    Returns:
+        Dict[str, int]: Name -> number of live instances.
+    """
+    names = list(watched)
+    types = tuple(watched[name] for name in names)
+    counts = dict.fromkeys(names, 0)
+
+    def add(obj: Any) -> None:
+        for name, cls in zip(names, types):
+            if isinstance(obj, cls):
+                counts[name] += 1
+
+    seen = set()
+    stack = []
+    for obj in gc.get_objects():
+        if isinstance(obj, types):
+            add(obj)
+        stack.extend(gc.get_referents(obj))
+        while stack:
+            ref = stack.pop()
+            if gc.is_tracked(ref) or id(ref) in seen:
+                continue
+            if isinstance(ref, types):
+                seen.add(id(ref))
+                add(ref)
+            elif isinstance(ref, (tuple, list, dict, set, frozenset)):
+                seen.add(id(ref))
+                stack.extend(gc.get_referents(ref))
+    return counts
+
+
+class LeakDetector:
+    """
+    Memory leak diagnostics taken at level transitions.
+
+    checkpoint() collects garbage, takes a tracemalloc snapshot and counts
+    live instances of the watched types. It then logs the traced heap size,
+    the counts and the allocation sites that grew most since the previous
+    checkpoint. Instances the game legitimately holds at that point, such as
+    the queued enemies of a new level, are passed as `expected`, so only
+    unexplained instances count as growth. The first `warmup` checkpoints
+    fill one-off caches and come before the baseline; failures() compares
+    the latest checkpoint against the baseline.
+
+    Tracing with tracemalloc slows the game down considerably, so the
+    detector is only created in diagnostics mode.
+
+    Attributes:
+        watched (Dict[str, type]): Types whose instances are counted, by name.
+        top (int): Allocation sites logged per checkpoint.
+        max_growth_kb (float): Traced heap growth since the baseline that counts as a leak.
+        max_instance_growth (Dict[str, int]): Allowed growth of unexplained instances per watched name.
+        warmup (int): Checkpoints before the baseline.
+        checkpoints (List[Dict[str, Any]]): 'label', 'traced_kb', 'counts' and 'unexplained' per checkpoint.
+    """
+
+    def __init__(
+        self,
+        top: int = 10,
+        max_growth_kb: float = 1024.0,
+        max_instance_growth: Optional[Dict[str, int]] = None,
+        warmup: int = 1,
+        log: Optional[TextIO] = None,
+        watched: Optional[Dict[str, type]] = None,
+    ) -> None:
+        self.watched = watched if watched is not None else {
+            "Enemy": Enemy, "Projectile": Projectile, "Surface": pygame.Surface, "Mask": pygame.mask.Mask,
+        }
+        self.top = top
+        self.max_growth_kb = max_growth_kb
+        self.max_instance_growth = max_instance_growth or {}
+        self.warmup = warmup
+        self.checkpoints: List[Dict[str, Any]] = []
+        self._log = log if log is not None else sys.stderr
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+
+    def close(self) -> None:
+        """
+        Stop tracing if this detector started it and drop the kept snapshots.
+        """
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started = False
+        self._previous = self._baseline = None
+
+    def checkpoint(self, label: str, expected: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        Snapshot memory and instance counts, and log what grew since the previous checkpoint.
+
+        Args:
+            label (str): Name of the checkpoint in the log, e.g. "level 3".
+            expected (Optional[Dict[str, int]]): Watched instances the game is known to hold, by name.
+
+        Returns:
+            Dict[str, Any]: The checkpoint record.
+        """
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+        counts = count_instances(self.watched)
+        expected = expected or {}
+        record = {
+            "label": label,
+            "traced_kb": sum(stat.size for stat in snapshot.statistics("filename")) / 1024,
+            "counts": counts,
+            "unexplained": {name: count - expected.get(name, 0) for name, count in counts.items()},
+        }
+
+        previous = self.checkpoints[-1] if self.checkpoints else None
+        change = f" ({record['traced_kb'] - previous['traced_kb']:+.0f})" if previous else ""
+        instances = ", ".join(
+            f"{name} {count}" + (f" ({record['unexplained'][name]} unexplained)" if name in expected else "")
+            for name, count in counts.items()
+        )
+        print(f"[leaks] {label}: traced {record['traced_kb']:.0f} KB{change}; {instances}", file=self._log)
+        if self._previous is not None:
+            self._log_diffs(snapshot, self._previous)
+
+        self.checkpoints.append(record)
+        self._previous = snapshot
+        if len(self.checkpoints) == self.warmup + 1:
+            self._baseline = snapshot
+        return record
+
+    def _log_diffs(self, snapshot: tracemalloc.Snapshot, since: tracemalloc.Snapshot) -> None:
+        grown = [stat for stat in snapshot.compare_to(since, "lineno") if stat.size_diff > 0][:self.top]
+        for stat in grown:
+            frame = stat.traceback[0]
+            print(f"[leaks]   {stat.size_diff / 1024:+8.1f} KB {stat.count_diff:+6d} blocks  "
+                  f"{frame.filename}:{frame.lineno}", file=self._log)
+
+    def failures(self) -> List[str]:
+        """
+        Compare the latest checkpoint with the baseline against the growth limits.
+
+        Returns:
+            List[str]: One message per exceeded limit; empty if none, or if there is no baseline yet.
+        """
+        if len(self.checkpoints) <= self.warmup + 1:
+            return []
+        baseline, latest = self.checkpoints[self.warmup], self.checkpoints[-1]
+        messages = []
+        growth = latest["traced_kb"] - baseline["traced_kb"]
+        if growth > self.max_growth_kb:
+            messages.append(f"traced heap grew {growth:.0f} KB from {baseline['label']} to {latest['label']} "
+                            f"(limit {self.max_growth_kb:.0f} KB)")
+        for name, limit in self.max_instance_growth.items():
+            grown = latest["unexplained"][name] - baseline["unexplained"][name]
+            if grown > limit:
+                messages.append(f"{grown} more unexplained {name} instances at {latest['label']} "
+                                f"than at {baseline['label']} (limit {limit})")
+        return messages
+
+    def report(self) -> str:
+        """
+        Summarize all checkpoints and the allocation sites that grew since the baseline.
+
+        Returns:
+            str: Printable report; instance columns are unexplained instances.
+        """
+        names = list(self.watched)
+        lines = [f"{'checkpoint':16} {'traced KB':>10} " + " ".join(f"{name:>10}" for name in names)]
+        for index, record in enumerate(self.checkpoints):
+            marker = " (baseline)" if index == self.warmup else ""
+            lines.append(f"{record['label']:16} {record['traced_kb']:10.0f} "
+                         + " ".join(f"{record['unexplained'][name]:10d}" for name in names) + marker)
+        if self._baseline is not None and self._previous is not self._baseline:
+            lines.append("grown since the baseline:")
+            grown = [stat for stat in self._previous.compare_to(self._baseline, "lineno") if stat.size_diff > 0]
+            for stat in grown[:self.top]:
+                frame = stat.traceback[0]
+                lines.append(f"  {stat.size_diff / 1024:+8.1f} KB {stat.count_diff:+6d} blocks  {frame.filename}:{frame.lineno}")
+        return "\n".join(lines)
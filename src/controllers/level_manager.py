@@ -1,30 +1,81 @@
 import pygame
+import random
+import time
 from typing import Optional, Dict, Any
 from src.controllers.wave_manager import WaveManager
+from src.controllers.enemy_fire import EnemyFireSystem
+from src.controllers.summon_pipeline import SummonPipeline
+from src.controllers.ai_scheduler import AIScheduler
+from src.controllers.frame_profiler import FrameProfiler
+from src.controllers.leak_detector import LeakDetector
 from src.controllers.audio_controller import AudioManager
-from src.models.settings import MAP_IMG
+from src.models.enemy import BossShooter, BossTank, BossSummoner
+from src.models.sprite_cache import SpriteCache
+from src.models.settings import (
+    MAP_IMG, CONTACT_DAMAGE, ENEMY_PROJECTILE_POOL_SIZE, ENTITY_BUDGET, SUMMON_POLICY,
+    AI_LOD_TIERS, SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WALL_COLOR, MAP_WALL_THRESHOLD
+)
 
 
 class LevelManager:
     """
     Manages game levels including enemy waves, bosses, map loading,
     and projectiles.
+
+    Each update spawns queued enemies, moves enemies towards the player
+    (distant ones time-sliced by the AIScheduler),
+    fires the tick's batch of enemy shots and summons, resolves projectile
+    hits and enemy contacts, and advances the level:
+    cleared wave -> next wave -> boss -> next level.
+
+    Attributes:
+        BOSS_CLASSES (dict): Mapping of boss type identifiers to their classes.
+        seed (int): Session seed; each level derives its own RNG from it.
+        rng (random.Random): RNG for the current level, shared with the wave manager.
+        enemy_fire (EnemyFireSystem): Pooled hostile projectiles.
+        summons (SummonPipeline): Batched summoning within the level's entity budget.
+        ai_scheduler (AIScheduler): Level-of-detail scheduling of regular enemy updates.
+        profiler (FrameProfiler): Receives section timings and counters; disabled by default.
+        load_ms (float): Time the last start_level took, in milliseconds.
+        map_rect (pygame.Rect): World area of the level's map; projectiles leaving it are removed.
+        leak_detector (Optional[LeakDetector]): Takes a memory checkpoint on the first update of each level;
+            None outside diagnostics mode.
+        wave_params (Dict[str, Any]): Keyword arguments for every level's WaveManager; empty for the settings.
     """
 
-    def __init__(self) -> None:
+    BOSS_CLASSES = {
+        'ShooterBoss': BossShooter,
+        'TankBoss': BossTank,
+        'SummonerBoss': BossSummoner,
+    }
+
+    def __init__(self, seed: Optional[int] = None, profiler: Optional[FrameProfiler] = None,
+                 leak_detector: Optional[LeakDetector] = None, wave_params: Optional[Dict[str, Any]] = None) -> None:
         self.current_level: int = 1
-        self.wave_manager: WaveManager = WaveManager(level=self.current_level)
+        self.seed: int = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng: random.Random = self.create_level_rng(self.current_level)
+        self.wave_params: Dict[str, Any] = dict(wave_params or {})
+        self.wave_manager: WaveManager = WaveManager(level=self.current_level, rng=self.rng, **self.wave_params)
         self.boss_sequence: list[str] = ['ShooterBoss', 'TankBoss', 'SummonerBoss']
         self.boss_index: int = 0
+        self.boss_spawned: bool = False
         self.enemies_multiplier: float = 1.0
 
         self.map_image: Optional[pygame.Surface] = None
+        self.map_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)  # World area; projectiles leaving it are removed
+        self.load_ms: float = 0.0
         self.collision_mask: Optional[pygame.Mask] = None
 
         # Sprite groups for enemies, bosses, and projectiles
         self.enemy_group: pygame.sprite.Group = pygame.sprite.Group()
         self.boss_group: pygame.sprite.Group = pygame.sprite.Group()
         self.projectiles: pygame.sprite.Group = pygame.sprite.Group()
+        self.enemy_fire: EnemyFireSystem = EnemyFireSystem(ENEMY_PROJECTILE_POOL_SIZE)
+        self.summons: SummonPipeline = SummonPipeline(ENTITY_BUDGET, SUMMON_POLICY)
+        self.profiler: FrameProfiler = profiler if profiler is not None else FrameProfiler(enabled=False)
+        self.ai_scheduler: AIScheduler = AIScheduler(AI_LOD_TIERS, (SCREEN_WIDTH, SCREEN_HEIGHT), profiler)
+        self.leak_detector: Optional[LeakDetector] = leak_detector
+        self._leak_checkpoint_due: bool = False
 
     def start_level(self, level: Optional[int] = None) -> None:
         """
@@ -33,12 +84,15 @@ class LevelManager:
         Args:
             level (Optional[int]): Level to start. Defaults to current_level.
         """
+        started = time.perf_counter()
         if level is not None:
             self.current_level = level
 
         self.enemies_multiplier = 1.0 + 0.5 * ((self.current_level - 1) // 3)
-        self.wave_manager = WaveManager(level=self.current_level)
+        self.rng = self.create_level_rng(self.current_level)
+        self.wave_manager = WaveManager(level=self.current_level, rng=self.rng, **self.wave_params)
         self.wave_manager.start_level()
+        self.boss_spawned = False
 
         groups = self.wave_manager.get_sprite_groups()
         self.enemy_group = groups["enemies"]
@@ -49,16 +103,142 @@ class LevelManager:
         map_index = (self.current_level - 1) % len(MAP_IMG)
         map_path = MAP_IMG[map_index]
         self.map_image = pygame.image.load(map_path).convert()
-        self.collision_mask = pygame.mask.from_surface(self.map_image)
+        self.collision_mask = pygame.mask.from_threshold(self.map_image, MAP_WALL_COLOR, MAP_WALL_THRESHOLD)
+        self.map_rect = self.map_image.get_rect()
+        self.enemy_fire.reset(self.map_rect)
+        self.summons.reset()
+        self.ai_scheduler.reset(self.map_rect)
+        self.load_ms = (time.perf_counter() - started) * 1000
+        self._leak_checkpoint_due = self.leak_detector is not None
+
+    def held_instances(self) -> Dict[str, int]:
+        """
+        Count the instances of the leak detector's watched types that the level is known to hold.
+
+        Returns:
+            Dict[str, int]: 'Enemy' (live and queued enemies and bosses), 'Projectile' (player projectiles),
+                'Surface' and 'Mask' (those held by the SpriteCache and the map).
+        """
+        held = SpriteCache.cached_instances()
+        held["Surface"] += self.map_image is not None
+        held["Mask"] += self.collision_mask is not None
+        held["Enemy"] = len(self.enemy_group) + len(self.boss_group) + len(self.wave_manager.enemies_to_spawn)
+        held["Projectile"] = len(self.projectiles)
+        return held
+
+    def create_level_rng(self, level: int) -> random.Random:
+        """
+        Create the RNG for a level, derived from the session seed.
+
+        Args:
+            level (int): Level number.
+
+        Returns:
+            random.Random: Generator seeded from (seed, level).
+        """
+        return random.Random(f"{self.seed}:{level}")
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, player: Optional[pygame.sprite.Sprite] = None) -> None:
         """
-        Update projectiles and level state.
+        Update projectiles, enemies and level state.
 
         Args:
             dt (float): Delta time since last update.
+            player (Optional[pygame.sprite.Sprite]): Player that enemies chase and damage.
+                Without it only projectiles, spawning and progression are updated.
+        """
+        if self._leak_checkpoint_due:
+            # Taken here rather than in start_level, which may run inside the previous
+            # level's update while its killed boss is still referenced from the stack
+            self._leak_checkpoint_due = False
+            self.leak_detector.checkpoint(f"level {self.current_level}", self.held_instances())
+
+        profiler = self.profiler
+        self.projectiles.update(dt, self.map_rect)
+        self.wave_manager.update(dt)
+
+        if player is not None:
+            target = player.rect.center
+            with profiler.section("ai"):
+                # Bosses always run at full rate; regular enemies go through the LOD scheduler
+                events = self.ai_scheduler.update(self.enemy_group.sprites(), target, dt)
+                for boss in self.boss_group.sprites():
+                    event = boss.update(target, dt)
+                    if event:
+                        events.append((boss, event))
+
+            shooters = [enemy for enemy, event in events if event == "shoot"]
+            summoners = [enemy for enemy, event in events if event == "summon"]
+            with profiler.section("enemy fire"):
+                self.enemy_fire.fire(shooters, target)
+            with profiler.section("summons"):
+                self.summons.process(summoners, self.wave_manager, len(self.enemy_group) + len(self.boss_group), self.rng)
+
+        with profiler.section("enemy fire"):
+            self.enemy_fire.update(dt)
+
+        with profiler.section("collisions"):
+            if player is not None:
+                self.enemy_fire.hit_player(player)
+                self.resolve_player_contacts(player)
+            self.resolve_projectile_hits()
+
+        self.update_progression()
+
+    def resolve_projectile_hits(self) -> None:
+        """
+        Apply projectile damage to the first enemy or boss each projectile touches.
+
+        Two phases: a rect broadphase (Rect.collidelistall) finds candidate
+        targets per projectile, and only those pairs are tested pixel-exactly
+        with the sprites' cached masks.
+        """
+        for group in (self.enemy_group, self.boss_group):
+            targets = group.sprites()
+            if not targets:
+                continue
+            rects = [target.rect for target in targets]
+            for projectile in self.projectiles.sprites():
+                for index in projectile.rect.collidelistall(rects):
+                    target = targets[index]
+                    if target.alive() and pygame.sprite.collide_mask(projectile, target):
+                        target.take_damage(projectile.damage)
+                        projectile.kill()
+                        break
+
+    def resolve_player_contacts(self, player: pygame.sprite.Sprite) -> None:
+        """
+        Regular enemies touching the player deal contact damage and die.
+
+        Args:
+            player (pygame.sprite.Sprite): The player.
+        """
+        for _ in pygame.sprite.spritecollide(player, self.enemy_group, True):
+            player.take_damage(CONTACT_DAMAGE)
+
+    def update_progression(self) -> None:
+        """
+        Advance to the next wave, the boss or the next level when the current one is cleared.
         """
-        self.projectiles.update(dt)
+        if self.boss_spawned:
+            if not self.boss_group:
+                self.on_boss_defeated()
+        elif self.wave_manager.wave_cleared():
+            if self.on_wave_cleared():
+                self.spawn_boss()
+
+    def spawn_boss(self) -> pygame.sprite.Sprite:
+        """
+        Spawn the boss for the current level.
+
+        Returns:
+            pygame.sprite.Sprite: The spawned boss.
+        """
+        boss_class = self.BOSS_CLASSES[self.get_current_boss_type()]
+        boss = boss_class(self.wave_manager.get_spawn_position())
+        self.boss_group.add(boss)
+        self.boss_spawned = True
+        return boss
 
     def on_wave_cleared(self) -> bool:
         """
@@ -104,12 +284,13 @@ class LevelManager:
         Returns dictionary of sprite groups.
 
         Returns:
-            Dict[str, pygame.sprite.Group]: Groups for enemies, bosses, and projectiles.
+            Dict[str, pygame.sprite.Group]: Groups for enemies, bosses, projectiles and enemy projectiles.
         """
         return {
             "enemies": self.enemy_group,
             "bosses": self.boss_group,
-            "projectiles": self.projectiles
+            "projectiles": self.projectiles,
+            "enemy_projectiles": self.enemy_fire.group
         }
 
     def get_entities(self) -> Dict[str, Any]:
@@ -134,6 +315,15 @@ class LevelManager:
         """
         return self.projectiles
 
+    def get_enemy_projectile_group(self) -> pygame.sprite.Group:
+        """
+        Returns the hostile projectiles sprite group.
+
+        Returns:
+            pygame.sprite.Group: Group of enemy projectiles.
+        """
+        return self.enemy_fire.group
+
     def get_map_surface(self) -> Optional[pygame.Surface]:
         """
         Returns the loaded map surface.
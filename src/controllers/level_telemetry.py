@@ -0,0 +1,172 @@
+import gc
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from src.models.telemetry import TelemetryStore
+
+
+class _Histogram:
+    """Fixed-bin histogram of millisecond values; the last bin collects overflow."""
+
+    def __init__(self, max_ms: float, bin_ms: float) -> None:
+        self.bin_ms = bin_ms
+        self.bins: List[int] = [0] * (int(max_ms / bin_ms) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, value_ms: float) -> None:
+        self.bins[min(int(value_ms / self.bin_ms), len(self.bins) - 1)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        target = pct / 100 * self.count
+        seen = 0
+        for index, bin_count in enumerate(self.bins):
+            seen += bin_count
+            if seen >= target and seen:
+                return min((index + 1) * self.bin_ms, self.max)
+        return self.max
+
+
+class LevelTelemetry:
+    """
+    Collects per-level performance statistics and writes them to a TelemetryStore.
+
+    The main loop reports every gameplay frame; at the end of a level the
+    summary (frame time percentiles, entity peaks, level load time and GC
+    pauses) is written in one transaction. Frame times go into fixed 0.5 ms
+    bins, so a level of any length costs the same memory. GC pauses are
+    timed through gc.callbacks while a level is running.
+
+    Attributes:
+        store (TelemetryStore): Destination of the summaries.
+        session_info (Dict[str, Any]): Session row values, written with the first finished level.
+        session_id (Optional[int]): Id of the session row once written.
+        level (Optional[int]): Level being recorded, None between levels.
+    """
+
+    BIN_MS: float = 0.5
+    MAX_MS: float = 250.0
+
+    def __init__(self, store: TelemetryStore, session_info: Dict[str, Any]) -> None:
+        self.store = store
+        self.session_info = session_info
+        self.session_id: Optional[int] = None
+        self.level: Optional[int] = None
+        self._reset(0.0)
+
+    def _reset(self, load_ms: float) -> None:
+        self._started = time.perf_counter()
+        self._load_ms = load_ms
+        self._frames = _Histogram(self.MAX_MS, self.BIN_MS)
+        self._work = _Histogram(self.MAX_MS, self.BIN_MS)
+        self._peaks: Dict[str, int] = {"enemies": 0, "projectiles": 0, "enemy_projectiles": 0}
+        self._min_scale = 1.0
+        self._gc_collections = 0
+        self._gc_pause_ms = 0.0
+        self._gc_max_pause_ms = 0.0
+        self._gc_start: Optional[float] = None
+
+    def begin_level(self, level: int, load_ms: float) -> None:
+        """
+        Start recording a level, finishing the previous one as quit if still open.
+
+        Args:
+            level (int): Level number.
+            load_ms (float): Time it took to load the level.
+        """
+        if self.level is not None:
+            self.end_level("quit")
+        self.level = level
+        self._reset(load_ms)
+        gc.callbacks.append(self._on_gc)
+
+    def frame(self, frame_ms: float, work_ms: float, enemies: int, projectiles: int, enemy_projectiles: int, render_scale: float = 1.0) -> None:
+        """
+        Record one gameplay frame.
+
+        Args:
+            frame_ms (float): Time since the previous frame, as seen by the player.
+            work_ms (float): Time the frame spent updating and drawing, excluding the frame cap delay.
+            enemies (int): Live enemies and bosses.
+            projectiles (int): Live player projectiles.
+            enemy_projectiles (int): Live hostile projectiles.
+            render_scale (float): World render scale used for the frame.
+        """
+        if self.level is None:
+            return
+        self._frames.add(frame_ms)
+        self._work.add(work_ms)
+        peaks = self._peaks
+        if enemies > peaks["enemies"]:
+            peaks["enemies"] = enemies
+        if projectiles > peaks["projectiles"]:
+            peaks["projectiles"] = projectiles
+        if enemy_projectiles > peaks["enemy_projectiles"]:
+            peaks["enemy_projectiles"] = enemy_projectiles
+        if render_scale < self._min_scale:
+            self._min_scale = render_scale
+
+    def end_level(self, outcome: str) -> Optional[int]:
+        """
+        Finish the current level and write its summary.
+
+        Args:
+            outcome (str): "cleared", "died" or "quit".
+
+        Returns:
+            Optional[int]: Id of the written level row, or None if no level was recorded.
+        """
+        if self.level is None:
+            return None
+        gc.callbacks.remove(self._on_gc)
+        level, self.level = self.level, None
+        if not self._frames.count:
+            return None
+
+        if self.session_id is None:
+            self.session_id = self.store.start_session(self.session_info)
+        frames, work = self._frames, self._work
+        summary = {
+            "level": level,
+            "outcome": outcome,
+            "duration_s": time.perf_counter() - self._started,
+            "frames": frames.count,
+            "load_ms": self._load_ms,
+            "frame_mean_ms": frames.mean(),
+            "frame_p50_ms": frames.percentile(50),
+            "frame_p95_ms": frames.percentile(95),
+            "frame_p99_ms": frames.percentile(99),
+            "frame_max_ms": frames.max,
+            "work_mean_ms": work.mean(),
+            "work_p95_ms": work.percentile(95),
+            "work_p99_ms": work.percentile(99),
+            "peak_enemies": self._peaks["enemies"],
+            "peak_projectiles": self._peaks["projectiles"],
+            "peak_enemy_projectiles": self._peaks["enemy_projectiles"],
+            "min_render_scale": self._min_scale,
+            "gc_collections": self._gc_collections,
+            "gc_pause_ms": self._gc_pause_ms,
+            "gc_max_pause_ms": self._gc_max_pause_ms,
+        }
+        histogram: List[Tuple[float, int]] = [
+            (index * frames.bin_ms, count) for index, count in enumerate(frames.bins) if count
+        ]
+        return self.store.record_level(self.session_id, summary, histogram)
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause_ms = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            self._gc_collections += 1
+            self._gc_pause_ms += pause_ms
+            if pause_ms > self._gc_max_pause_ms:
+                self._gc_max_pause_ms = pause_ms
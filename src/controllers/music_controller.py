@@ -0,0 +1,170 @@
+import sys
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+
+class MusicController:
+    """
+    Background music player with prefetching, crossfades and a track queue.
+
+    Tracks are decoded into memory on a worker thread (prefetch), and played on
+    two dedicated mixer channels so the outgoing and incoming tracks can overlap
+    during a crossfade. A transition therefore never touches the disk on the frame
+    thread: if the requested track is not decoded yet, it starts as soon as it is,
+    from update(). A track that fails to decode is reported on stderr and its
+    request dropped, leaving the music silent rather than stopping the game.
+
+    Attributes:
+        current (Optional[str]): Path of the track currently requested.
+        volume (float): Music volume applied to both music channels.
+        cache_size (int): Maximum number of decoded tracks kept in memory.
+    """
+
+    def __init__(self, first_channel: int, volume: float, cache_size: int = 3) -> None:
+        if pygame.mixer.get_num_channels() < first_channel + 2:
+            pygame.mixer.set_num_channels(first_channel + 2)
+        pygame.mixer.set_reserved(first_channel + 2)
+        self._channels: Tuple[pygame.mixer.Channel, pygame.mixer.Channel] = (
+            pygame.mixer.Channel(first_channel),
+            pygame.mixer.Channel(first_channel + 1),
+        )
+        self._active: int = 0
+
+        self.current: Optional[str] = None
+        self.volume: float = volume
+        self.cache_size: int = cache_size
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music-loader")
+        self._tracks: Dict[str, pygame.mixer.Sound] = {}
+        self._pending: Dict[str, Future] = {}
+        self._queue: List[str] = []
+
+        # Start request waiting for its track to finish decoding: (loops, fade_ms)
+        self._start_request: Optional[Tuple[int, int]] = None
+
+    def prefetch(self, path: str) -> None:
+        """
+        Decode a track into memory in the background so a later play() is instant.
+
+        Args:
+            path (str): Path to the music file.
+        """
+        if path not in self._tracks and path not in self._pending:
+            self._pending[path] = self._executor.submit(pygame.mixer.Sound, path)
+
+    def _ready(self, path: str) -> Optional[pygame.mixer.Sound]:
+        """Return the decoded track if available, collecting finished prefetches."""
+        if path in self._tracks:
+            return self._tracks[path]
+        future = self._pending.get(path)
+        if future is None or not future.done():
+            return None
+        del self._pending[path]
+        try:
+            sound = future.result()
+        except (pygame.error, OSError) as e:
+            print(f"Cannot load music {path}: {e}", file=sys.stderr)
+            if path == self.current:
+                self._start_request = None
+            return None
+        self._tracks[path] = sound
+        self._evict()
+        return sound
+
+    def _evict(self) -> None:
+        """Drop the oldest decoded tracks beyond cache_size, never the current one."""
+        for path in list(self._tracks):
+            if len(self._tracks) <= self.cache_size:
+                break
+            if path != self.current:
+                del self._tracks[path]
+
+    def play(self, path: str, loops: int = -1, fade_ms: int = 0) -> None:
+        """
+        Switch to a track, crossfading from the current one.
+
+        Args:
+            path (str): Path to the music file.
+            loops (int): Number of extra repetitions (-1 for infinite).
+            fade_ms (int): Crossfade duration in milliseconds.
+        """
+        if path == self.current:
+            return
+        outgoing = self._channels[self._active]
+        if fade_ms > 0:
+            outgoing.fadeout(fade_ms)
+        else:
+            outgoing.stop()
+
+        self.current = path
+        self._start_request = (loops, fade_ms)
+        self.prefetch(path)
+        self._try_start()
+
+    def _try_start(self) -> None:
+        """Start the requested track if it has been decoded."""
+        if self._start_request is None or self.current is None:
+            return
+        sound = self._ready(self.current)
+        if sound is None:
+            return
+        loops, fade_ms = self._start_request
+        self._start_request = None
+        self._active = 1 - self._active
+        channel = self._channels[self._active]
+        channel.set_volume(self.volume)
+        channel.play(sound, loops=loops, fade_ms=fade_ms)
+
+    def queue(self, path: str) -> None:
+        """
+        Play a track once the current one ends, prefetching it now.
+
+        Args:
+            path (str): Path to the music file.
+        """
+        self._queue.append(path)
+        self.prefetch(path)
+
+    def update(self) -> None:
+        """
+        Advance pending starts and the queue. Call once per frame.
+        """
+        if self._start_request is not None:
+            self._try_start()
+        elif self._queue and not self._channels[self._active].get_busy():
+            self.current = None
+            self.play(self._queue.pop(0), loops=0)
+
+    def stop(self) -> None:
+        """Stop both music channels and clear the queue."""
+        for channel in self._channels:
+            channel.stop()
+        self.current = None
+        self._start_request = None
+        self._queue.clear()
+
+    def shutdown(self) -> None:
+        """
+        Stop playback and the loader thread, abandoning decodes that have not started.
+
+        Waits for a decode already running: it uses the mixer, which must
+        outlive it, so this has to return before pygame.quit().
+        """
+        self.stop()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Set the music volume on both music channels.
+
+        Args:
+            volume (float): Volume level between 0.0 and 1.0.
+        """
+        # Channel.set_volume locks the audio device, so skip redundant calls
+        if volume == self.volume:
+            return
+        self.volume = volume
+        for channel in self._channels:
+            channel.set_volume(volume)
@@ -0,0 +1,99 @@
+from collections import deque
+from typing import Deque, Sequence
+
+
+class ResolutionScaler:
+    """
+    Picks the world render scale from the measured frame time.
+
+    Frame times are averaged over a window of frames. When the average
+    exceeds the frame budget the scale steps down one level. It steps back up
+    when the average, projected to the next larger scale by pixel count,
+    stays below `up_ratio` of the budget. Every decision uses a
+    full window of samples taken at the current scale. The gap between the
+    two thresholds and a step-up cooldown, which doubles whenever a step up
+    is quickly undone, keep the scale from oscillating.
+
+    Attributes:
+        scales (Sequence[float]): Render scales from full resolution downwards.
+        budget_ms (float): Frame time budget in milliseconds.
+        level (int): Index of the current scale in `scales`.
+        scale (float): Current render scale.
+        changes (int): Number of scale changes so far.
+    """
+
+    def __init__(
+        self,
+        scales: Sequence[float],
+        budget_ms: float,
+        window: int = 30,
+        up_ratio: float = 0.85,
+        cooldown: int = 60,
+    ) -> None:
+        self.scales = scales
+        self.budget_ms = budget_ms
+        self.up_ratio = up_ratio
+        self.cooldown = cooldown
+        self.level: int = 0
+        self.scale: float = scales[0]
+        self.changes: int = 0
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._total: float = 0.0
+        self._up_wait: int = 0
+        self._up_cooldown: int = cooldown
+        self._since_up: int = -1
+
+    @property
+    def average_ms(self) -> float:
+        """Moving average of the recorded frame times in milliseconds."""
+        return self._total / len(self._samples) if self._samples else 0.0
+
+    def record(self, frame_ms: float) -> bool:
+        """
+        Add one frame time and adjust the scale if needed.
+
+        Args:
+            frame_ms (float): Time the frame took to update and draw, excluding the frame cap delay.
+
+        Returns:
+            bool: True if the scale changed.
+        """
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self._total -= samples[0]
+        samples.append(frame_ms)
+        self._total += frame_ms
+        if self._since_up >= 0:
+            self._since_up += 1
+        if self._up_wait:
+            self._up_wait -= 1
+        if len(samples) < samples.maxlen:
+            return False
+
+        average = self._total / len(samples)
+        if average > self.budget_ms and self.level < len(self.scales) - 1:
+            # A step up that had to be undone soon waits twice as long next time
+            if 0 <= self._since_up <= 2 * self.cooldown:
+                self._up_cooldown = min(self._up_cooldown * 2, 16 * self.cooldown)
+            self._since_up = -1
+            self._set_level(self.level + 1)
+        elif self.level > 0 and not self._up_wait and self._projected_up(average) < self.budget_ms * self.up_ratio:
+            self._since_up = 0
+            self._set_level(self.level - 1)
+        else:
+            return False
+        return True
+
+    def _projected_up(self, average: float) -> float:
+        # Drawing cost grows with the pixel count; treating all of the frame
+        # time that way overestimates, which errs on the side of staying down
+        return average * (self.scales[self.level - 1] / self.scale) ** 2
+
+    def _set_level(self, level: int) -> None:
+        self.level = level
+        self.scale = self.scales[level]
+        self.changes += 1
+        # Decide on fresh samples only, and never step up right after a change
+        self._samples.clear()
+        self._total = 0.0
+        self._up_wait = self._up_cooldown
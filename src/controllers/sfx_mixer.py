@@ -0,0 +1,117 @@
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+
+class SfxMixer:
+    """
+    Voice-limited sound effect mixer built on fixed pygame channel pools.
+
+    Each category (weapons, spawns, bosses, ...) owns a contiguous range of
+    mixer channels, so a burst in one category can never starve another and the
+    total number of voices being mixed is bounded. Within a pool a sound may only
+    have `max_instances` voices at once; above that its oldest voice is restarted.
+    When a pool is full, the lowest-priority (then oldest) voice is stolen if the
+    new sound's priority is at least as high, otherwise the new sound is dropped.
+
+    Attributes:
+        pools (Dict[str, List[pygame.mixer.Channel]]): Channels owned by each category.
+        priorities (Dict[str, int]): Default voice priority per category.
+        max_instances (int): Maximum simultaneous voices of one sound within a pool.
+        stats (Dict[str, Dict[str, int]]): Per-category 'played', 'stolen' and 'dropped' counters.
+    """
+
+    def __init__(self, pool_sizes: Dict[str, int], priorities: Dict[str, int], max_instances: int) -> None:
+        total = sum(pool_sizes.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Keep pygame's automatic channel picking away from the pooled channels
+        pygame.mixer.set_reserved(total)
+
+        self.pools: Dict[str, List[pygame.mixer.Channel]] = {}
+        self._voices: Dict[str, List[Optional[Tuple[str, int, int]]]] = {}
+        index = 0
+        for category, size in pool_sizes.items():
+            self.pools[category] = [pygame.mixer.Channel(i) for i in range(index, index + size)]
+            self._voices[category] = [None] * size
+            index += size
+
+        self.priorities = priorities
+        self.max_instances = max_instances
+        self.stats: Dict[str, Dict[str, int]] = {
+            category: {"played": 0, "stolen": 0, "dropped": 0} for category in pool_sizes
+        }
+        self._sequence: int = 0
+
+    def play(self, category: str, name: str, sound: pygame.mixer.Sound, loops: int = 0, priority: Optional[int] = None) -> Optional[pygame.mixer.Channel]:
+        """
+        Play a sound on a channel from the category's pool, respecting voice limits.
+
+        Args:
+            category (str): Pool to play in.
+            name (str): Identifier of the sound, used for the per-sound cap.
+            sound (pygame.mixer.Sound): Sound to play.
+            loops (int): Extra repetitions (-1 to loop forever).
+            priority (Optional[int]): Voice priority. Defaults to the category priority.
+
+        Returns:
+            Optional[pygame.mixer.Channel]: Channel the sound plays on, or None if dropped.
+        """
+        channels = self.pools.get(category)
+        if not channels:
+            return None
+        voices = self._voices[category]
+        stats = self.stats[category]
+        if priority is None:
+            priority = self.priorities.get(category, 0)
+
+        free_slot = -1
+        instances = 0
+        oldest_same = -1
+        victim = -1
+        for i, channel in enumerate(channels):
+            voice = voices[i]
+            if voice is None or not channel.get_busy():
+                if free_slot < 0:
+                    free_slot = i
+                voices[i] = None
+                continue
+            if voice[0] == name:
+                instances += 1
+                if oldest_same < 0 or voice[2] < voices[oldest_same][2]:
+                    oldest_same = i
+            if victim < 0 or (voice[1], voice[2]) < (voices[victim][1], voices[victim][2]):
+                victim = i
+
+        if instances >= self.max_instances:
+            slot = oldest_same
+            stats["stolen"] += 1
+        elif free_slot >= 0:
+            slot = free_slot
+        elif victim >= 0 and voices[victim][1] <= priority:
+            slot = victim
+            stats["stolen"] += 1
+        else:
+            stats["dropped"] += 1
+            return None
+
+        self._sequence += 1
+        channel = channels[slot]
+        channel.play(sound, loops=loops)
+        voices[slot] = (name, priority, self._sequence)
+        stats["played"] += 1
+        return channel
+
+    def stop_category(self, category: str) -> None:
+        """
+        Stop every voice in a category's pool.
+
+        Args:
+            category (str): Pool to silence.
+        """
+        for i, channel in enumerate(self.pools.get(category, [])):
+            channel.stop()
+            self._voices[category][i] = None
+
+    def active_voices(self) -> int:
+        """Return the number of pooled channels currently playing."""
+        return sum(channel.get_busy() for channels in self.pools.values() for channel in channels)
@@ -0,0 +1,65 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+
+class StartupTimeline:
+    """
+    Records how long each initialization step takes, relative to startup.
+
+    Attributes:
+        origin (float): perf_counter() value the timeline is measured from.
+        steps (List[Tuple[str, float, float]]): (name, start offset, duration) in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.origin: float = time.perf_counter()
+        self.steps: List[Tuple[str, float, float]] = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block as one named step.
+
+        Args:
+            name (str): Step name shown in the report.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, start - self.origin, time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        """
+        Record an instant event, e.g. the first frame being presented.
+
+        Args:
+            name (str): Event name shown in the report.
+        """
+        self.steps.append((name, time.perf_counter() - self.origin, 0.0))
+
+    def report(self) -> str:
+        """
+        Format the timeline as a table.
+
+        Returns:
+            str: One line per step with start offset and duration in milliseconds.
+        """
+        lines = [f"{'start ms':>9} {'took ms':>9}  step"]
+        for name, start, duration in self.steps:
+            lines.append(f"{start * 1000:9.1f} {duration * 1000:9.1f}  {name}")
+        return "\n".join(lines)
+
+    def write_log(self, path: str) -> None:
+        """
+        Append the report to a log file, creating its directory if needed.
+
+        Args:
+            path (str): Log file path.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"=== startup {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+            f.write(self.report() + "\n")
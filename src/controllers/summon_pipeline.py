@@ -0,0 +1,112 @@
+import random
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Tuple, Type
+from src.controllers.audio_controller import AudioManager
+
+SUMMON_POLICIES = ("queue", "drop", "merge")
+
+
+class SummonPipeline:
+    """
+    Turns the summon events of one tick into minions, within an entity budget.
+
+    Summoners only report "summon" from update(); the level manager gathers
+    the tick's summoners and passes them to process() in one batch. Minions are
+    created while the level holds fewer than `budget` live enemies and bosses.
+    Requests above the budget are handled by `policy`:
+
+    - "queue": kept in a FIFO and spawned in later ticks as room frees up
+      (the queue itself is capped at `budget` entries, the rest are dropped).
+    - "drop": discarded.
+    - "merge": folded into a minion of the same type, which gains the
+      summoned minion's health instead of a new sprite being created. The
+      host is a minion of this batch if there is one, else the live summoned
+      minion with the least health; wave enemies never absorb summons.
+
+    Minions are ordinary enemies tagged `summoned`, so they share their type's
+    cached image and mask.
+
+    Attributes:
+        budget (int): Maximum live enemies plus bosses on the level.
+        policy (str): One of SUMMON_POLICIES.
+        pending (Deque[Tuple[type, Tuple[float, float]]]): Queued minions and their positions.
+        stats (Dict[str, int]): 'requested', 'spawned', 'queued', 'dropped' and 'merged' counters.
+    """
+
+    def __init__(self, budget: int, policy: str) -> None:
+        if policy not in SUMMON_POLICIES:
+            raise ValueError(f"Unknown summon policy: {policy!r}")
+        self.budget = budget
+        self.policy = policy
+        self.pending: Deque[Tuple[Type[pygame.sprite.Sprite], Tuple[float, float]]] = deque()
+        self.stats: Dict[str, int] = {key: 0 for key in ("requested", "spawned", "queued", "dropped", "merged")}
+
+    def reset(self) -> None:
+        """
+        Discard queued minions, e.g. when a new level starts.
+        """
+        self.pending.clear()
+
+    def process(self, summoners: Sequence[pygame.sprite.Sprite], wave_manager, live_count: int, rng: random.Random) -> List[pygame.sprite.Sprite]:
+        """
+        Spawn the queued minions and this tick's summons as far as the budget allows.
+
+        Args:
+            summoners (Sequence[pygame.sprite.Sprite]): Enemies that reported "summon" this tick.
+            wave_manager (WaveManager): Wave manager whose enemy group receives the minions.
+            live_count (int): Live enemies plus bosses before this batch.
+            rng (random.Random): Level RNG used for minion placement.
+
+        Returns:
+            List[pygame.sprite.Sprite]: Minions created in this batch.
+        """
+        room = self.budget - live_count
+        spawned: List[pygame.sprite.Sprite] = []
+
+        while self.pending and room > 0:
+            minion_class, pos = self.pending.popleft()
+            spawned.append(minion_class(pos))
+            room -= 1
+
+        hosts: Dict[Type[pygame.sprite.Sprite], pygame.sprite.Sprite] = {}
+        for summoner in summoners:
+            minion_class = summoner.minion_class
+            for _ in range(summoner.summon_count):
+                self.stats["requested"] += 1
+                pos = (summoner.pos.x + rng.uniform(-40, 40), summoner.pos.y + rng.uniform(-40, 40))
+                if room > 0:
+                    minion = minion_class(pos)
+                    spawned.append(minion)
+                    hosts[minion_class] = minion
+                    room -= 1
+                elif self.policy == "queue" and len(self.pending) < self.budget:
+                    self.pending.append((minion_class, pos))
+                    self.stats["queued"] += 1
+                elif self.policy == "merge" and self._merge(minion_class, hosts, wave_manager.enemy_group):
+                    self.stats["merged"] += 1
+                else:
+                    self.stats["dropped"] += 1
+
+        if spawned:
+            for minion in spawned:
+                minion.summoned = True
+            wave_manager.track(*spawned)
+            self.stats["spawned"] += len(spawned)
+            # One sound for the whole batch
+            AudioManager.play_enemy_spawn_sfx(type(spawned[0]).__name__.lower())
+        return spawned
+
+    def _merge(self, minion_class: Type[pygame.sprite.Sprite], hosts: Dict[Type[pygame.sprite.Sprite], pygame.sprite.Sprite],
+               enemy_group: pygame.sprite.Group) -> bool:
+        # Prefer a minion of this batch, then the weakest live summoned one of the type
+        host = hosts.get(minion_class)
+        if host is None:
+            candidates = [enemy for enemy in enemy_group if enemy.summoned and type(enemy) is minion_class]
+            host = min(candidates, key=lambda enemy: enemy.health, default=None)
+            if host is None:
+                return False
+            hosts[minion_class] = host
+        host.health += minion_class.base_health
+        host.max_health += minion_class.base_health
+        return True
@@ -2,21 +2,44 @@ import pygame
 import random
 from typing import Optional, Type, Dict, List, Union
 from src.models.enemy import Jumper, Shooter, Warrior, Tank, Summoner
-from src.models.settings import WAVES_PER_LEVEL, ENEMY_SCALE_FACTOR
+from src.models.settings import WAVES_PER_LEVEL, ENEMY_SCALE_FACTOR, ENEMY_SPAWN_INTERVAL
 from src.controllers.audio_controller import AudioManager
 
 
 class WaveManager:
     """
     Manages enemy waves for a given level, including spawning and tracking active enemies.
+
+    Live enemies are counted, not listed: every enemy added to the wave goes
+    through track(), which hooks its on_death callback, and each death
+    decrements the count. Killed sprites are therefore referenced only by
+    whatever still holds them, and wave_cleared() is O(1).
+
+    All randomness goes through `rng`, so a WaveManager created with an
+    identically seeded generator produces an identical spawn sequence.
+
+    The wave parameters default to the settings; tools such as the balance
+    simulator pass their own values instead.
+
+    Attributes:
+        level (int): Level being played.
+        rng (random.Random): Generator for enemy spawn positions.
+        enemy_scale_factor (float): Growth of the wave size every 3 levels.
+        waves_per_level (int): Regular waves before the boss.
+        spawn_interval (float): Seconds between enemy spawns within a wave.
     """
 
-    def __init__(self, level: int = 1) -> None:
+    def __init__(self, level: int = 1, rng: Optional[random.Random] = None,
+                 enemy_scale_factor: float = ENEMY_SCALE_FACTOR, waves_per_level: int = WAVES_PER_LEVEL,
+                 spawn_interval: float = ENEMY_SPAWN_INTERVAL) -> None:
         self.level: int = level
-        self.waves_per_level: int = WAVES_PER_LEVEL  # Number of waves per level
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        self.waves_per_level: int = waves_per_level  # Number of waves per level
+        self.enemy_scale_factor: float = enemy_scale_factor
         self.current_wave: int = 0
         self.enemies_to_spawn: List[pygame.sprite.Sprite] = []
-        self.active_enemies: List[pygame.sprite.Sprite] = []
+        self.alive_count: int = 0  # Live enemies of the current wave
+        self.killed_count: int = 0  # Enemies of the current wave killed so far
 
         # Sprite groups for enemies and bosses
         self.enemy_group: pygame.sprite.Group = pygame.sprite.Group()
@@ -25,6 +48,10 @@ class WaveManager:
         # Base enemy count, grows with level scaling
         self.base_enemy_count: int = 5
 
+        # Timed spawning of the queued enemies
+        self.spawn_interval: float = spawn_interval
+        self.spawn_timer: float = 0.0
+
     def start_level(self) -> None:
         """
         Initializes the first wave of the current level.
@@ -40,8 +67,12 @@ class WaveManager:
         enemy_count: int = self.calculate_enemy_count()
 
         self.enemies_to_spawn = [self.create_enemy(enemy_type) for _ in range(enemy_count)]
-        self.active_enemies = []
+        # Enemies left over from the previous wave no longer report to it
+        for enemy in self.enemy_group:
+            enemy.on_death = None
         self.enemy_group.empty()
+        self.alive_count = 0
+        self.killed_count = 0
 
     def get_enemy_type_for_wave(self, wave_idx: int) -> Type[pygame.sprite.Sprite]:
         """
@@ -60,10 +91,13 @@ class WaveManager:
         """
         Calculates the number of enemies to spawn, scaling with level.
 
+        Levels 1-3 have no regular enemies (only the boss); from level 4 the
+        count grows by `enemy_scale_factor` times the base every 3 levels.
+
         Returns:
             int: Number of enemies to spawn.
         """
-        multiplier = ENEMY_SCALE_FACTOR * ((self.level - 1) // 3)
+        multiplier = self.enemy_scale_factor * ((self.level - 1) // 3)
         return int(self.base_enemy_count * multiplier)
 
     def create_enemy(self, enemy_class: Type[pygame.sprite.Sprite]) -> pygame.sprite.Sprite:
@@ -76,7 +110,7 @@ class WaveManager:
         Returns:
             pygame.sprite.Sprite: Created enemy instance.
         """
-        enemy = enemy_class(x=0, y=0)  # Initial position placeholder
+        enemy = enemy_class(pos=(0, 0))  # Initial position placeholder
         return enemy
 
     def spawn_next_enemy(self) -> Optional[pygame.sprite.Sprite]:
@@ -89,8 +123,8 @@ class WaveManager:
         if self.enemies_to_spawn:
             enemy = self.enemies_to_spawn.pop(0)
             enemy.rect.x, enemy.rect.y = self.get_spawn_position()
-            self.active_enemies.append(enemy)
-            self.enemy_group.add(enemy)
+            enemy.pos.update(enemy.rect.center)
+            self.track(enemy)
 
             enemy_type = type(enemy).__name__.lower()  # e.g., "jumper"
             AudioManager.play_enemy_spawn_sfx(enemy_type)
@@ -98,31 +132,54 @@ class WaveManager:
             return enemy
         return None
 
+    def track(self, *enemies: pygame.sprite.Sprite) -> None:
+        """
+        Add enemies to the current wave: they join the enemy group and count as live until killed.
+
+        Args:
+            *enemies (pygame.sprite.Sprite): Enemies to add.
+        """
+        for enemy in enemies:
+            enemy.on_death = self._on_enemy_death
+        self.enemy_group.add(*enemies)
+        self.alive_count += len(enemies)
+
+    def _on_enemy_death(self, enemy: pygame.sprite.Sprite) -> None:
+        self.alive_count -= 1
+        self.killed_count += 1
+
     def get_spawn_position(self) -> tuple[int, int]:
         """
-        Returns a random spawn position for an enemy.
+        Returns a random spawn position for an enemy, drawn from the wave RNG.
 
         Returns:
             tuple[int, int]: (x, y) spawn coordinates.
         """
-        x = random.randint(50, 750)
-        y = random.randint(50, 550)
+        x = self.rng.randint(50, 750)
+        y = self.rng.randint(50, 550)
         return x, y
 
-    def update(self) -> None:
+    def update(self, dt: float = 0.0) -> None:
         """
-        Update method called each game loop iteration. Can be used for timed spawning or other logic.
+        Update method called each game loop iteration. Spawns the next queued
+        enemy every `spawn_interval` seconds.
+
+        Args:
+            dt (float): Delta time since last update (seconds).
         """
-        pass
+        self.spawn_timer += dt
+        if self.enemies_to_spawn and self.spawn_timer >= self.spawn_interval:
+            self.spawn_timer = 0.0
+            self.spawn_next_enemy()
 
     def wave_cleared(self) -> bool:
         """
         Checks if the current wave has been cleared.
 
         Returns:
-            bool: True if no active enemies and no enemies left to spawn.
+            bool: True if no living enemies and no enemies left to spawn.
         """
-        return not self.active_enemies and not self.enemies_to_spawn
+        return not self.alive_count and not self.enemies_to_spawn
 
     def next_wave(self) -> bool:
         """
@@ -0,0 +1,429 @@
+import argparse
+import json
+import platform
+import sys
+import pygame
+from typing import Callable, List, Optional, Tuple
+from src.models.settings import *
+from src.controllers.input_handler import InputHandler
+from src.controllers.audio_controller import AudioManager
+from src.controllers.level_manager import LevelManager
+from src.controllers.input_recorder import InputRecorder
+from src.controllers.gameplay import update_gameplay
+from src.controllers.startup_timeline import StartupTimeline
+from src.controllers.latency_tracker import LatencyTracker
+from src.controllers.frame_profiler import FrameProfiler
+from src.controllers.resolution_scaler import ResolutionScaler
+from src.controllers.level_telemetry import LevelTelemetry
+from src.controllers.leak_detector import LeakDetector
+from src.views.menu_view import MainMenu
+from src.views.pause_view import PauseMenu
+from src.views.game_over_view import GameOverMenu
+from src.views.game_view import GameView
+from src.views.sdl2_backend import Sdl2Backend
+from src.models.player import Player
+from src.models.database import SaveManager
+from src.models.telemetry import TelemetryStore
+
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Main game loop and initialization.
+
+    Args:
+        args (argparse.Namespace): Options parsed by main.parse_args; the settings are already configured.
+    """
+    timeline = StartupTimeline()
+
+    # Only what the first menu frame needs is done before it is drawn;
+    # the rest runs one step per frame afterwards (see deferred_steps).
+    with timeline.step("pygame init"):
+        pygame.init()
+    with timeline.step("create window"):
+        backend: Optional[Sdl2Backend] = None
+        if RENDER_BACKEND == "sdl2":
+            backend = Sdl2Backend.create((SCREEN_WIDTH, SCREEN_HEIGHT), "DemonShock", SDL2_RENDER_DRIVER)
+        if backend:
+            # Image conversion needs a display mode; the backend window shows the game,
+            # and menus are composed on an off-screen surface
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        else:
+            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("DemonShock")
+        clock = pygame.time.Clock()
+        InputHandler.install_event_filter()
+    with timeline.step("load icon"):
+        icon_surface = pygame.image.load(ICON_PATH).convert_alpha()
+        if backend:
+            backend.window.set_icon(icon_surface)
+        else:
+            pygame.display.set_icon(icon_surface)
+
+    # Initialize audio and play menu music; tracks decode in the background
+    with timeline.step("audio init"):
+        AudioManager.init()
+        AudioManager.play_music(MUSIC_DIR + '/menu.ogg')
+        AudioManager.prefetch_music(MUSIC_DIR + '/abyss.ogg')
+
+    # Decode sound effects in the background; sounds not loaded yet play nothing
+    with timeline.step("start sfx loader"):
+        AudioManager.load_manifest_async(SFX_MANIFEST)
+
+    input_handler = InputHandler()
+    latency_tracker: Optional[LatencyTracker] = None
+    if args.latency or args.latency_export:
+        latency_tracker = LatencyTracker()
+        input_handler.latency_tracker = latency_tracker
+    profiler = FrameProfiler(enabled=args.profile)
+    leak_detector: Optional[LeakDetector] = None
+    if LEAK_DIAGNOSTICS:
+        leak_detector = LeakDetector(
+            top=LEAK_TOP_DIFFS,
+            max_growth_kb=LEAK_MAX_GROWTH_KB,
+            max_instance_growth=LEAK_MAX_INSTANCE_GROWTH,
+            warmup=LEAK_WARMUP_LEVELS,
+        )
+    level_manager = LevelManager(seed=args.seed, profiler=profiler, leak_detector=leak_detector)
+    resolution_scaler: Optional[ResolutionScaler] = None
+    if DYNAMIC_RESOLUTION:
+        resolution_scaler = ResolutionScaler(
+            RESOLUTION_SCALES, 1000 / FPS, RESOLUTION_WINDOW, RESOLUTION_UP_RATIO, RESOLUTION_COOLDOWN
+        )
+        profiler.info["dynamic resolution"] = ", ".join(f"{scale:g}" for scale in RESOLUTION_SCALES)
+    # Created by deferred initialization after the first frame
+    save_manager: Optional[SaveManager] = None
+    player: Optional[Player] = None
+    pause_menu: Optional[PauseMenu] = None
+    game_over_menu: Optional[GameOverMenu] = None
+    telemetry: Optional[LevelTelemetry] = None
+    game_view: Optional[GameView] = None  # Initialized after starting level
+    recorder: Optional[InputRecorder] = InputRecorder() if args.record else None
+    game_time: int = 0  # Gameplay time in milliseconds, stops while paused
+
+    game_state: str = 'menu'  # Possible states: menu, playing, paused, game_over
+    running: bool = True
+
+    def start_game() -> None:
+        """
+        Starts a new game, initializes level and player.
+        """
+        nonlocal game_state, game_view
+        run_deferred_init(all_steps=True)
+        game_state = 'playing'
+        AudioManager.play_music(MUSIC_DIR + '/abyss.ogg')
+        player.reset((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        level_manager.boss_index = 0
+        level_manager.start_level(1)
+        begin_level_telemetry()
+        if recorder:
+            recorder.begin(level_manager, player, game_time)
+
+        map_surface = level_manager.get_map_surface()
+        player.set_collision_mask(level_manager.get_collision_mask())
+
+        game_view = GameView(
+            screen=screen,
+            map=map_surface,
+            player=player,
+            enemies=level_manager.get_sprite_groups()["enemies"],
+            projectiles=level_manager.get_projectile_group(),
+            boss=level_manager.get_entities()["boss"],
+            latency_tracker=latency_tracker,
+            enemy_projectiles=level_manager.get_enemy_projectile_group(),
+            scaler=resolution_scaler,
+            backend=backend
+        )
+
+    def continue_game() -> None:
+        """
+        Continues from the last saved game state if available.
+        """
+        nonlocal game_state, game_view
+        run_deferred_init(all_steps=True)
+        saved = save_manager.load_last_game()
+        if saved:
+            if args.seed is None and saved['seed'] is not None:
+                level_manager.seed = saved['seed']
+            # One boss per level, in order, so the saved level decides whose turn it is
+            level_manager.boss_index = (saved['level'] - 1) % len(level_manager.boss_sequence)
+            level_manager.start_level(saved['level'])
+            begin_level_telemetry()
+            player.reset((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            player.health = saved['health']
+            player.switch_weapon(saved['weapon'])
+            if recorder:
+                recorder.begin(level_manager, player, game_time)
+            AudioManager.set_music_volume(saved['music_volume'])
+            AudioManager.play_music(MUSIC_DIR + '/abyss.ogg')
+
+            map_surface = level_manager.get_map_surface()
+            player.set_collision_mask(level_manager.get_collision_mask())
+
+            game_view = GameView(
+                screen=screen,
+                map=map_surface,
+                player=player,
+                enemies=level_manager.get_sprite_groups()["enemies"],
+                projectiles=level_manager.get_projectile_group(),
+                boss=level_manager.get_entities()["boss"],
+                latency_tracker=latency_tracker,
+                enemy_projectiles=level_manager.get_enemy_projectile_group(),
+                scaler=resolution_scaler,
+                backend=backend
+            )
+            game_state = 'playing'
+
+    def quit_game() -> None:
+        """
+        Quits the game loop.
+        """
+        nonlocal running
+        running = False
+
+    def resume_game() -> None:
+        """
+        Resumes the game from pause.
+        """
+        nonlocal game_state
+        game_state = 'playing'
+        AudioManager.set_music_volume(0.7)
+
+    def save_game() -> None:
+        """
+        Saves the current game state.
+        """
+        run_deferred_init(all_steps=True)
+        current_weapon = player.weapon.name if player.weapon else "Pistol"
+        save_manager.save_game(
+            level=level_manager.current_level,
+            health=player.health,
+            weapon_name=current_weapon,
+            music_volume=AudioManager.get_music_volume(),
+            seed=level_manager.seed
+        )
+
+    def quit_to_menu() -> None:
+        """
+        Returns to the main menu.
+        """
+        nonlocal game_state
+        game_state = 'menu'
+        end_level_telemetry()
+        AudioManager.play_music(MUSIC_DIR + '/menu.ogg')
+        AudioManager.prefetch_music(MUSIC_DIR + '/abyss.ogg')
+
+    def on_player_death(_player: Player) -> None:
+        """
+        Ends the run; the game over screen opens once the frame has been drawn.
+        """
+        nonlocal game_state
+        game_state = 'game_over'
+        end_level_telemetry("died")
+
+    def init_player() -> None:
+        nonlocal player
+        player = Player(pos=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        player.on_death = on_player_death
+
+    def init_save_manager() -> None:
+        nonlocal save_manager
+        save_manager = SaveManager()
+
+    def init_telemetry() -> None:
+        nonlocal telemetry
+        if not TELEMETRY_ENABLED:
+            return
+        telemetry = LevelTelemetry(TelemetryStore(TELEMETRY_DB_PATH), {
+            "platform": platform.platform(),
+            "pygame_version": pygame.version.ver,
+            "render_backend": "sdl2" if backend else "software",
+            "screen_width": SCREEN_WIDTH,
+            "screen_height": SCREEN_HEIGHT,
+            "fps": FPS,
+            "config": json.dumps(CONFIG_OVERRIDES, sort_keys=True),
+        })
+
+    def begin_level_telemetry() -> None:
+        """
+        Starts recording performance telemetry for the level just started.
+        """
+        if telemetry:
+            telemetry.session_info["seed"] = level_manager.seed
+            telemetry.begin_level(level_manager.current_level, level_manager.load_ms)
+
+    def end_level_telemetry(outcome: Optional[str] = None) -> None:
+        """
+        Writes the telemetry of the level being played, if any.
+
+        Args:
+            outcome (Optional[str]): How the level ended. Defaults to "died" or "quit" by player health.
+        """
+        if telemetry:
+            telemetry.end_level(outcome or ("died" if player.health <= 0 else "quit"))
+
+    def init_pause_menu() -> None:
+        nonlocal pause_menu
+        pause_menu = PauseMenu(screen, on_resume=resume_game, on_save=save_game, on_quit_to_menu=quit_to_menu)
+
+    def init_game_over_menu() -> None:
+        nonlocal game_over_menu
+        game_over_menu = GameOverMenu(screen, on_new_game=start_game, on_quit_to_menu=quit_to_menu)
+
+    deferred_steps: List[Tuple[str, Callable[[], None]]] = [
+        ("create player", init_player),
+        ("init save database", init_save_manager),
+        ("create pause menu", init_pause_menu),
+        ("create game over menu", init_game_over_menu),
+        ("init telemetry database", init_telemetry),
+    ]
+
+    def run_deferred_init(all_steps: bool = False) -> None:
+        """
+        Runs the next deferred initialization step, or all remaining ones
+        when something needs them right away (e.g. New Game on the first frame).
+        """
+        while deferred_steps:
+            name, step = deferred_steps.pop(0)
+            with timeline.step(name):
+                step()
+            if not all_steps:
+                break
+        if not deferred_steps:
+            finish_startup_timeline()
+
+    startup_logged: bool = False
+
+    def finish_startup_timeline() -> None:
+        """
+        Writes the startup timeline to the log once, and prints it if requested.
+        """
+        nonlocal startup_logged
+        if startup_logged:
+            return
+        startup_logged = True
+        timeline.write_log(STARTUP_LOG_PATH)
+        if args.startup_report:
+            print(timeline.report())
+
+    # Initialize the main menu; the pause menu is deferred
+    with timeline.step("create main menu"):
+        menu = MainMenu(screen, on_new_game=start_game, on_continue_game=continue_game, on_quit=quit_game)
+    first_frame: bool = True
+
+    frame_index: int = 0
+    last_tick_frame: int = -1  # frame on which the gameplay clock last ticked
+
+    while running:
+        frame_index += 1
+        world_drawn: bool = False  # GameView drew this frame (through the backend, if any)
+        event_list = pygame.event.get()
+        AudioManager.update_music()
+
+        # Single dispatch pass; menus only receive the (coalesced) mouse events
+        ui_events = input_handler.process_events(event_list)
+        if input_handler.quit_requested:
+            running = False
+
+        if game_state == 'menu':
+            menu.handle_events(ui_events)
+            menu.draw()
+
+        elif game_state == 'playing':
+            if input_handler.pause_requested:
+                game_state = 'paused'
+                AudioManager.set_music_volume(0.3)
+            if input_handler.latency_overlay_requested and game_view:
+                game_view.show_latency = not game_view.show_latency
+
+            dt_ms = clock.tick(FPS)
+            # The raw time covers one frame of work only if the clock also ticked on the previous frame
+            consecutive_frame = last_tick_frame == frame_index - 1
+            work_ms = clock.get_rawtime()
+            if resolution_scaler and consecutive_frame:
+                resolution_scaler.record(work_ms)
+            last_tick_frame = frame_index
+            if not consecutive_frame:
+                # The clock did not tick in the menu or while paused; that time is not gameplay
+                dt_ms = 1000 // FPS
+            dt_ms = min(dt_ms, MAX_FRAME_MS)
+            game_time += dt_ms
+            if recorder:
+                recorder.record(input_handler, dt_ms)
+
+            with profiler.section("update"):
+                update_gameplay(player, level_manager, input_handler, dt_ms / 1000, game_time, latency_tracker)
+
+            # Update game view
+            if game_view:
+                if game_view.map is not level_manager.get_map_surface():
+                    # A new level was started by the level manager
+                    game_view.update_map_image(level_manager.get_map_surface())
+                    player.set_collision_mask(level_manager.get_collision_mask())
+                    end_level_telemetry("cleared")
+                    begin_level_telemetry()
+                game_view.enemies = level_manager.get_sprite_groups()["enemies"]
+                game_view.projectiles = level_manager.get_projectile_group()
+                game_view.boss = level_manager.get_entities()["boss"]
+                with profiler.section("draw"):
+                    game_view.draw()
+                world_drawn = True
+                if telemetry and consecutive_frame:
+                    telemetry.frame(
+                        dt_ms, work_ms,
+                        len(level_manager.enemy_group) + len(level_manager.boss_group),
+                        len(level_manager.projectiles),
+                        len(level_manager.get_enemy_projectile_group()),
+                        game_view.render_scale,
+                    )
+                if game_state in ('paused', 'game_over'):
+                    # Freeze the frame just drawn behind the menu
+                    if backend:
+                        backend.read_pixels(screen)
+                    if game_state == 'paused':
+                        pause_menu.open()
+                    else:
+                        game_over_menu.open(level_manager.current_level)
+            profiler.end_frame()
+
+        elif game_state == 'paused':
+            pause_menu.handle_events(ui_events)
+            pause_menu.draw()
+
+        elif game_state == 'game_over':
+            game_over_menu.handle_events(ui_events)
+            game_over_menu.draw()
+
+        if backend is None:
+            pygame.display.flip()
+        elif world_drawn:
+            backend.present()
+        else:
+            backend.present_surface(screen)
+        if latency_tracker:
+            latency_tracker.frame_presented()
+
+        if first_frame:
+            timeline.mark("first frame presented")
+            first_frame = False
+        elif deferred_steps:
+            run_deferred_init()
+
+    if game_state != 'menu':
+        end_level_telemetry()
+    AudioManager.shutdown()
+    pygame.quit()
+
+    if recorder:
+        recorder.save(args.record)
+    if latency_tracker and args.latency_export:
+        latency_tracker.export(args.latency_export)
+    if args.profile:
+        if resolution_scaler:
+            profiler.info["dynamic resolution"] += f" (ended at {resolution_scaler.scale:g} after {resolution_scaler.changes} changes)"
+        print(profiler.report())
+    if leak_detector:
+        print(leak_detector.report(), file=sys.stderr)
+        for failure in leak_detector.failures():
+            print(f"possible leak: {failure}", file=sys.stderr)
+        leak_detector.close()
@@ -0,0 +1,224 @@
+import argparse
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+# Default user config file; a missing default file is not an error
+DEFAULT_CONFIG_PATH = os.path.join("saves", "config.json")
+
+# Quality presets: settings overrides that trade visual fidelity for throughput.
+# "medium" is the stock settings.py.
+PRESETS: Dict[str, Dict[str, Any]] = {
+    "low": {
+        "SCREEN_WIDTH": 960,
+        "SCREEN_HEIGHT": 540,
+        "FPS": 30,
+        "ENTITY_BUDGET": 40,
+        "ENEMY_PROJECTILE_POOL_SIZE": 256,
+        "AI_LOD_TIERS": ((100, 1), (300, 3), (None, 6)),
+        "ROTATION_STEPS": 32,
+        "RENDER_Y_SORT": False,
+        "PAUSE_BLUR_FACTOR": 1,
+        "MUSIC_CACHE_SIZE": 1,
+        "SFX_CHANNEL_POOLS": {"ui": 1, "weapons": 4, "spawns": 3, "bosses": 1, "steps": 1},
+        "SFX_MAX_INSTANCES": 2,
+    },
+    "medium": {},
+    "high": {
+        "SCREEN_WIDTH": 1920,
+        "SCREEN_HEIGHT": 1080,
+        "FPS": 120,
+        "ENTITY_BUDGET": 100,
+        "ENEMY_PROJECTILE_POOL_SIZE": 1024,
+        "AI_LOD_TIERS": ((400, 1), (800, 2), (None, 3)),
+        "ROTATION_STEPS": 128,
+        "RENDER_Y_SORT": True,
+        "SFX_CHANNEL_POOLS": {"ui": 2, "weapons": 12, "spawns": 8, "bosses": 3, "steps": 1},
+        "SFX_MAX_INSTANCES": 4,
+    },
+}
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --config, --preset and --set options to a command line parser.
+
+    Entry points then parse their command line with parse_and_configure(),
+    which applies the options to the settings.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to extend.
+    """
+    group = parser.add_argument_group("configuration")
+    group.add_argument("--config", metavar="PATH",
+                       help=f"JSON file overriding settings (default: {DEFAULT_CONFIG_PATH} if it exists)")
+    group.add_argument("--preset", choices=sorted(PRESETS),
+                       help="quality preset; overrides the preset named in the config file")
+    group.add_argument("--set", metavar="NAME=VALUE", action="append", default=[],
+                       help="override one setting, VALUE as JSON (repeatable), e.g. --set FPS=30")
+
+
+def seed_argument(value: str) -> int:
+    """
+    Argparse type for session seeds, which recordings store as 32-bit unsigned integers.
+
+    Args:
+        value (str): Command line value.
+
+    Returns:
+        int: The seed.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer in [0, 2**32).
+    """
+    try:
+        seed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seed: {value!r}") from None
+    if not 0 <= seed < 2 ** 32:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {2 ** 32 - 1}, got {seed}")
+    return seed
+
+
+def parse_and_configure(parser: argparse.ArgumentParser, argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse a command line and apply its configuration options to the settings.
+
+    Modules copy settings into their own namespace when imported, so entry
+    points call this before importing any module that reads a setting.
+    A bad config file or override is reported as a usage error.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser with the add_config_arguments() options.
+        argv (Optional[List[str]]): Arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: Parsed options.
+    """
+    from src.models import settings
+
+    args = parser.parse_args(argv)
+    try:
+        settings.CONFIG_OVERRIDES = apply_config(vars(settings), args)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def load_overrides(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Collect setting overrides from the preset, the config file and the command line.
+
+    Later sources win: preset < config file < --set. The config file is a JSON
+    object of setting names, plus an optional "preset" entry.
+
+    Args:
+        args (argparse.Namespace): Parsed add_config_arguments() options.
+
+    Returns:
+        Dict[str, Any]: Setting name to raw override value.
+
+    Raises:
+        ValueError: If the config file, preset or an override is malformed.
+    """
+    file_values: Dict[str, Any] = {}
+    path = args.config or DEFAULT_CONFIG_PATH
+    if args.config or os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                file_values = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read config file {path}: {e}") from e
+        if not isinstance(file_values, dict):
+            raise ValueError(f"Config file {path} must contain a JSON object")
+
+    preset = args.preset or file_values.pop("preset", None) or "medium"
+    file_values.pop("preset", None)
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown preset '{preset}', expected one of {', '.join(sorted(PRESETS))}")
+
+    overrides: Dict[str, Any] = dict(PRESETS[preset])
+    overrides.update(file_values)
+    for item in args.set:
+        name, sep, raw = item.partition("=")
+        if not sep:
+            raise ValueError(f"--set expects NAME=VALUE, got '{item}'")
+        try:
+            overrides[name.strip()] = json.loads(raw)
+        except json.JSONDecodeError:
+            overrides[name.strip()] = raw  # bare strings, e.g. --set SUMMON_POLICY=drop
+    return overrides
+
+
+def coerce(name: str, value: Any, default: Any) -> Any:
+    """
+    Convert an override to the type of the setting's default value.
+
+    JSON has no tuples, so lists become tuples where the default is a tuple,
+    and dictionaries are merged into the default so a config can change a
+    single entry (e.g. one SFX channel pool).
+
+    Args:
+        name (str): Setting name, for error messages.
+        value (Any): Override value as read from JSON or the command line.
+        default (Any): Current value of the setting.
+
+    Returns:
+        Any: The converted value.
+
+    Raises:
+        ValueError: If the value does not fit the setting's type.
+    """
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ValueError(f"{name} must be true or false, got {value!r}")
+        return value
+    if isinstance(default, int) and not isinstance(value, bool):
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if isinstance(value, int):
+            return value
+    elif isinstance(default, float) and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    elif isinstance(default, str) and isinstance(value, str):
+        return value
+    elif isinstance(default, dict) and isinstance(value, dict):
+        merged = dict(default)
+        for key, item in value.items():
+            merged[key] = coerce(f"{name}[{key!r}]", item, default[key]) if key in default else item
+        return merged
+    elif isinstance(default, (tuple, list)) and isinstance(value, (tuple, list)):
+        return _to_tuples(value) if isinstance(default, tuple) else list(value)
+    raise ValueError(f"{name} expects a value like {default!r}, got {value!r}")
+
+
+def _to_tuples(value: Any) -> Any:
+    if isinstance(value, (tuple, list)):
+        return tuple(_to_tuples(item) for item in value)
+    return value
+
+
+def apply_config(namespace: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Apply the collected overrides to a settings namespace in place.
+
+    Only existing upper-case settings can be overridden, so a typo in a
+    config file fails loudly instead of being ignored.
+
+    Args:
+        namespace (Dict[str, Any]): Module globals of settings.py.
+        args (argparse.Namespace): Parsed add_config_arguments() options.
+
+    Returns:
+        Dict[str, Any]: The overrides that were applied, after conversion.
+
+    Raises:
+        ValueError: On an unknown setting or a value of the wrong type.
+    """
+    applied: Dict[str, Any] = {}
+    for name, value in load_overrides(args).items():
+        if not name.isupper() or name not in namespace:
+            raise ValueError(f"Unknown setting '{name}'")
+        applied[name] = coerce(name, value, namespace[name])
+    namespace.update(applied)
+    return applied
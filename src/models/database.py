@@ -22,12 +22,17 @@ class SaveManager:
                     level INTEGER,
                     health INTEGER,
                     weapon TEXT,
-                    music_volume REAL
+                    music_volume REAL,
+                    seed INTEGER
                 )
             """)
+            # Saves created before the seed column existed
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(save_data)")]
+            if "seed" not in columns:
+                cursor.execute("ALTER TABLE save_data ADD COLUMN seed INTEGER")
             conn.commit()
 
-    def save_game(self, level: int, health: int, weapon_name: str, music_volume: float) -> None:
+    def save_game(self, level: int, health: int, weapon_name: str, music_volume: float, seed: Optional[int] = None) -> None:
         """
         Save the current game state to the database.
         Clears previous save data before inserting new.
@@ -37,14 +42,15 @@ class SaveManager:
             health (int): Player's health points.
             weapon_name (str): Name of the equipped weapon.
             music_volume (float): Music volume setting.
+            seed (Optional[int]): Session RNG seed.
         """
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM save_data")
             cursor.execute("""
-                INSERT INTO save_data (level, health, weapon, music_volume)
-                VALUES (?, ?, ?, ?)
-            """, (level, health, weapon_name, music_volume))
+                INSERT INTO save_data (level, health, weapon, music_volume, seed)
+                VALUES (?, ?, ?, ?, ?)
+            """, (level, health, weapon_name, music_volume, seed))
             conn.commit()
 
     def load_last_game(self) -> Optional[Dict[str, Any]]:
@@ -53,17 +59,19 @@ class SaveManager:
 
         Returns:
             Optional[Dict[str, Any]]: A dictionary with keys 'level', 'health',
-            'weapon', 'music_volume' if save exists, otherwise None.
+            'weapon', 'music_volume', 'seed' if save exists, otherwise None.
+            'seed' is None for saves made before seeds were stored.
         """
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT level, health, weapon, music_volume FROM save_data LIMIT 1")
+            cursor.execute("SELECT level, health, weapon, music_volume, seed FROM save_data LIMIT 1")
             result = cursor.fetchone()
             if result:
                 return {
                     'level': result[0],
                     'health': result[1],
                     'weapon': result[2],
-                    'music_volume': result[3]
+                    'music_volume': result[3],
+                    'seed': result[4]
                 }
         return None
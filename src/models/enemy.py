@@ -1,6 +1,10 @@
 import pygame
-from typing import Optional, Union
-from src.models.settings import ENEMY_HEALTH, BOSS_HEALTH, SPRITE_DIR
+from typing import Callable, Optional, Union
+from src.models.settings import (
+    ENEMY_HEALTH, BOSS_HEALTH, SPRITE_DIR, SHOOTER_FIRE_INTERVAL, BOSS_FIRE_INTERVAL, BOSS_VOLLEY_SIZE,
+    SUMMONER_INTERVAL, BOSS_SUMMON_INTERVAL, SUMMONER_MINIONS, BOSS_SUMMON_MINIONS
+)
+from src.models.sprite_cache import SpriteCache
 import os
 
 
@@ -11,18 +15,39 @@ class Enemy(pygame.sprite.Sprite):
     Attributes:
         pos (pygame.Vector2): Current position.
         health (int): Current health points.
+        max_health (int): Health points at creation.
         speed (float): Movement speed.
-        image (pygame.Surface): Enemy sprite image.
+        image (pygame.Surface): Enemy sprite image, shared by all enemies of the type.
+        base_image (pygame.Surface): Unmirrored image; `image` is it or its mirrored variant.
+        image_facing (int): Horizontal direction the unmirrored image faces (1 right, -1 left).
+        mask (pygame.Mask): Cached mask of the image for pixel-accurate hits.
         rect (pygame.Rect): Rectangle for positioning and collisions.
+        ai_slot (int): Bucket slot assigned by the AIScheduler (-1 until scheduled).
+        ai_period (int): Ticks between updates in the enemy's current AIScheduler tier.
+        ai_dt (float): Time accumulated while the AIScheduler skipped this enemy.
+        on_death (Optional[Callable[[Enemy], None]]): Called once when the enemy is killed.
+        base_health (int): Health of a new enemy of the type.
+        summoned (bool): Whether a summon created the enemy rather than a wave.
     """
 
+    image_facing: int = 1
+    base_health: int = ENEMY_HEALTH
+    summoned: bool = False
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2], health: int, speed: float, image_path: str) -> None:
         super().__init__()
-        self.image = pygame.image.load(image_path).convert_alpha()
+        self.base_image = SpriteCache.load_image(image_path)
+        self.image = self.base_image
+        self.mask = SpriteCache.get_mask(self.image)
         self.rect = self.image.get_rect(center=pos)
         self.pos = pygame.Vector2(pos)
         self.health = health
+        self.max_health = health
         self.speed = speed
+        self.ai_slot: int = -1
+        self.ai_period: int = 1
+        self.ai_dt: float = 0.0
+        self.on_death: Optional[Callable[["Enemy"], None]] = None
 
     def update(self, player_pos: Union[tuple[float, float], pygame.Vector2], dt: float) -> None:
         """
@@ -36,6 +61,26 @@ class Enemy(pygame.sprite.Sprite):
         if direction.length() != 0:
             self.pos += direction.normalize() * self.speed * dt
             self.rect.center = self.pos
+            if direction.x:
+                self.face(direction.x)
+
+    def face(self, dx: float) -> None:
+        """
+        Mirror the sprite to face its horizontal direction of travel.
+
+        Both variants come from SpriteCache, so this is a lookup and only
+        swaps the image when the facing actually changes.
+
+        Args:
+            dx (float): Horizontal component of the travel direction.
+        """
+        if (dx > 0) == (self.image_facing > 0):
+            image = self.base_image
+        else:
+            image = SpriteCache.get_flipped(self.base_image)
+        if image is not self.image:
+            self.image = image
+            self.mask = SpriteCache.get_mask(image)
 
     def take_damage(self, amount: int) -> None:
         """
@@ -48,87 +93,125 @@ class Enemy(pygame.sprite.Sprite):
         if self.health <= 0:
             self.kill()
 
+    def kill(self) -> None:
+        """
+        Remove the enemy from all groups and notify `on_death` if it was alive.
+
+        The callback is dropped before it runs, so it fires at most once and a
+        dead enemy keeps no reference to whoever tracked it.
+        """
+        was_alive = self.alive()
+        super().kill()
+        callback, self.on_death = self.on_death, None
+        if was_alive and callback is not None:
+            callback(self)
+
 
 # === Regular Enemies ===
 
 class Jumper(Enemy):
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
-        super().__init__(pos, health=ENEMY_HEALTH, speed=250, image_path=os.path.join(SPRITE_DIR, "enemies", "jumper.png"))
+        super().__init__(pos, health=self.base_health, speed=250, image_path=os.path.join(SPRITE_DIR, "enemies", "jumper.png"))
 
 
 class Shooter(Enemy):
     """
     Enemy that can shoot at the player.
+
+    Attributes:
+        volley_size (int): Bullets per shot, spread evenly around the aim direction.
     """
 
+    volley_size: int = 1
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
-        super().__init__(pos, health=ENEMY_HEALTH, speed=120, image_path=os.path.join(SPRITE_DIR, "enemies", "shooter.png"))
+        super().__init__(pos, health=self.base_health, speed=120, image_path=os.path.join(SPRITE_DIR, "enemies", "shooter.png"))
         self.shoot_timer: float = 0
 
-    def update(self, player_pos: Union[tuple[float, float], pygame.Vector2], dt: float) -> None:
+    def update(self, player_pos: Union[tuple[float, float], pygame.Vector2], dt: float) -> Optional[str]:
         """
         Update movement and shooting timer.
 
         Note:
-            Shooting logic is handled externally (e.g. GameController).
+            The shot itself is fired by the level manager's EnemyFireSystem.
 
         Args:
             player_pos (tuple[float, float] | pygame.Vector2): Player's position.
             dt (float): Delta time in seconds.
+
+        Returns:
+            Optional[str]: "shoot" if shooting event triggered, else None.
         """
         super().update(player_pos, dt)
         self.shoot_timer += dt
-        if self.shoot_timer >= 2000:
+        if self.shoot_timer >= SHOOTER_FIRE_INTERVAL:
             self.shoot_timer = 0
-            # Shooting action triggered externally
+            return "shoot"
+        return None
 
 
 class Warrior(Enemy):
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
-        super().__init__(pos, health=ENEMY_HEALTH, speed=180, image_path=os.path.join(SPRITE_DIR, "enemies", "warrior.png"))
+        super().__init__(pos, health=self.base_health, speed=180, image_path=os.path.join(SPRITE_DIR, "enemies", "warrior.png"))
 
 
 class Tank(Enemy):
+    base_health: int = ENEMY_HEALTH * 2
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
-        super().__init__(pos, health=(ENEMY_HEALTH * 2), speed=80, image_path=os.path.join(SPRITE_DIR, "enemies", "tank.png"))
+        super().__init__(pos, health=self.base_health, speed=80, image_path=os.path.join(SPRITE_DIR, "enemies", "tank.png"))
 
 
 class Summoner(Enemy):
     """
     Enemy that periodically summons additional enemies.
+
+    Attributes:
+        minion_class (type): Enemy class created by a summon.
+        summon_count (int): Minions per summon.
     """
 
+    minion_class = Jumper
+    summon_count: int = SUMMONER_MINIONS
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
-        super().__init__(pos, health=ENEMY_HEALTH, speed=100, image_path=os.path.join(SPRITE_DIR, "enemies", "summoner.png"))
+        super().__init__(pos, health=self.base_health, speed=100, image_path=os.path.join(SPRITE_DIR, "enemies", "summoner.png"))
         self.summon_timer: float = 0
 
-    def update(self, player_pos: Union[tuple[float, float], pygame.Vector2], dt: float) -> bool:
+    def update(self, player_pos: Union[tuple[float, float], pygame.Vector2], dt: float) -> Optional[str]:
         """
         Update movement and summon timer.
 
+        Note:
+            The minions are created by the level manager's SummonPipeline.
+
         Args:
             player_pos (tuple[float, float] | pygame.Vector2): Player's position.
             dt (float): Delta time in seconds.
 
         Returns:
-            bool: True if summon event triggered, else False.
+            Optional[str]: "summon" if summon event triggered, else None.
         """
         super().update(player_pos, dt)
         self.summon_timer += dt
-        if self.summon_timer >= 3000:
+        if self.summon_timer >= SUMMONER_INTERVAL:
             self.summon_timer = 0
-            return True
-        return False
+            return "summon"
+        return None
 
 
 # === Bosses ===
 
 class Boss(Enemy):
+    base_health: int = BOSS_HEALTH
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2], image_path: str) -> None:
-        super().__init__(pos, health=BOSS_HEALTH, speed=60, image_path=image_path)
+        super().__init__(pos, health=self.base_health, speed=60, image_path=image_path)
 
 
 class BossShooter(Boss):
+    volley_size: int = BOSS_VOLLEY_SIZE
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
         super().__init__(pos, image_path=os.path.join(SPRITE_DIR, "bosses", "boss_shooter.png"))
         self.shoot_timer: float = 0
@@ -146,7 +229,7 @@ class BossShooter(Boss):
         """
         super().update(player_pos, dt)
         self.shoot_timer += dt
-        if self.shoot_timer >= 1000:
+        if self.shoot_timer >= BOSS_FIRE_INTERVAL:
             self.shoot_timer = 0
             return "shoot"
         return None
@@ -158,6 +241,9 @@ class BossTank(Boss):
 
 
 class BossSummoner(Boss):
+    minion_class = Jumper
+    summon_count: int = BOSS_SUMMON_MINIONS
+
     def __init__(self, pos: Union[tuple[float, float], pygame.Vector2]) -> None:
         super().__init__(pos, image_path=os.path.join(SPRITE_DIR, "bosses", "boss_summoner.png"))
         self.summon_timer: float = 0
@@ -175,7 +261,7 @@ class BossSummoner(Boss):
         """
         super().update(player_pos, dt)
         self.summon_timer += dt
-        if self.summon_timer >= 2500:
+        if self.summon_timer >= BOSS_SUMMON_INTERVAL:
             self.summon_timer = 0
             return "summon"
         return None
@@ -1,6 +1,7 @@
 import pygame
-from typing import Optional, Tuple, Union
-from src.models.settings import PLAYER_SPEED, PLAYER_HEALTH, SPRITE_DIR
+from typing import Callable, Dict, Optional, Tuple, Union
+from src.models.settings import PLAYER_SPEED, PLAYER_HEALTH, SPRITE_DIR, MAP_WALL_COLOR, MAP_WALL_THRESHOLD
+from src.models.sprite_cache import SpriteCache
 from src.models.weapon import Pistol, Rifle, AssaultRifle, PlasmaRifle, GrenadeLauncher
 from src.controllers.audio_controller import AudioManager
 
@@ -12,8 +13,10 @@ class Player(pygame.sprite.Sprite):
     Attributes:
         WEAPON_CLASSES (dict): Mapping of weapon names to their classes.
         image (pygame.Surface): Player sprite image.
+        mask (pygame.Mask): Cached mask of the image, used for map and hit collisions.
         rect (pygame.Rect): Rectangle for positioning and collisions.
-        speed (float): Player movement speed.
+        pos (pygame.Vector2): Exact position of the rect's center; the rect holds it rounded.
+        speed (float): Player movement speed in pixels per second.
         health (int): Player health points.
         weapon (Weapon): Currently equipped weapon.
         last_shot_time (int): Time of last shot in milliseconds.
@@ -21,6 +24,8 @@ class Player(pygame.sprite.Sprite):
         is_moving (bool): Whether the player is currently moving.
         collision_mask (Optional[pygame.Mask]): Mask used for map collision detection.
         collision_surface (Optional[pygame.Surface]): Surface for collision mask debugging.
+        on_death (Optional[Callable[[Player], None]]): Called once when health reaches zero.
+        weapon_damage (Dict[str, int]): Damage overrides by weapon name, applied to every weapon equipped.
     """
 
     WEAPON_CLASSES = {
@@ -31,20 +36,48 @@ class Player(pygame.sprite.Sprite):
         "GrenadeLauncher": GrenadeLauncher
     }
 
-    def __init__(self, pos: Tuple[int, int]) -> None:
+    def __init__(self, pos: Tuple[int, int], weapon_damage: Optional[Dict[str, int]] = None) -> None:
         super().__init__()
-        self.image = pygame.image.load(f"{SPRITE_DIR}/player.png").convert_alpha()
+        self.weapon_damage: Dict[str, int] = dict(weapon_damage or {})
+        self.image = SpriteCache.load_image(f"{SPRITE_DIR}/player.png")
+        self.mask = SpriteCache.get_mask(self.image)
         self.rect = self.image.get_rect(center=pos)
+        self.pos = pygame.Vector2(pos)
 
         self.speed: float = PLAYER_SPEED
         self.health: int = PLAYER_HEALTH
         self.weapon = Pistol()
+        self.weapon.damage = self.weapon_damage.get(self.weapon.name, self.weapon.damage)
         self.last_shot_time: int = 0
         self.shot_cooldown: int = self.weapon.cooldown
         self.is_moving: bool = False
 
         self.collision_mask: Optional[pygame.Mask] = None
         self.collision_surface: Optional[pygame.Surface] = None
+        self.on_death: Optional[Callable[["Player"], None]] = None
+
+    def reset(self, pos: Tuple[int, int]) -> None:
+        """
+        Restore the state of a new game: full health, the starting weapon and position.
+
+        Args:
+            pos (Tuple[int, int]): Starting position.
+        """
+        self.move_to(pos)
+        self.health = PLAYER_HEALTH
+        self.switch_weapon("Pistol")
+        self.last_shot_time = 0
+        self.is_moving = False
+
+    def move_to(self, pos: Union[Tuple[float, float], pygame.Vector2]) -> None:
+        """
+        Place the player at a position without collision checks.
+
+        Args:
+            pos (Tuple[float, float] | pygame.Vector2): New center position.
+        """
+        self.pos.update(pos)
+        self.rect.center = (round(self.pos.x), round(self.pos.y))
 
     def set_collision_mask(self, surface_or_mask: Union[pygame.Surface, pygame.Mask]) -> None:
         """
@@ -54,7 +87,7 @@ class Player(pygame.sprite.Sprite):
             surface_or_mask (Union[pygame.Surface, pygame.Mask]): Surface or mask to create collision mask from.
         """
         if isinstance(surface_or_mask, pygame.Surface):
-            self.collision_mask = pygame.mask.from_threshold(surface_or_mask, (0, 0, 0), (10, 10, 10))
+            self.collision_mask = pygame.mask.from_threshold(surface_or_mask, MAP_WALL_COLOR, MAP_WALL_THRESHOLD)
             self.collision_surface = surface_or_mask
         elif isinstance(surface_or_mask, pygame.Mask):
             self.collision_mask = surface_or_mask
@@ -73,6 +106,9 @@ class Player(pygame.sprite.Sprite):
         """
         Handle player movement with collision checking.
 
+        The exact position is kept in `pos`, so moves shorter than a pixel per
+        frame still add up instead of being truncated by the integer rect.
+
         Args:
             movement_vector (Tuple[float, float]): Movement direction vector (dx, dy).
             dt (float): Time delta in seconds since last update.
@@ -91,14 +127,21 @@ class Player(pygame.sprite.Sprite):
         if dx == 0 and dy == 0:
             return
 
+        step = self.speed * dt
         new_rect = self.rect.copy()
-        new_rect.x += dx * self.speed * dt
+        x = self.pos.x + dx * step
+        new_rect.centerx = round(x)
         if not self.collides_with_map(new_rect):
-            self.rect.x = new_rect.x
+            self.pos.x = x
+            self.rect.centerx = new_rect.centerx
+        else:
+            new_rect.centerx = self.rect.centerx
 
-        new_rect.y += dy * self.speed * dt
+        y = self.pos.y + dy * step
+        new_rect.centery = round(y)
         if not self.collides_with_map(new_rect):
-            self.rect.y = new_rect.y
+            self.pos.y = y
+            self.rect.centery = new_rect.centery
 
     def collides_with_map(self, rect: pygame.Rect) -> bool:
         """
@@ -113,8 +156,7 @@ class Player(pygame.sprite.Sprite):
         if self.collision_mask is None:
             return False
         offset = (int(rect.left), int(rect.top))
-        player_mask = pygame.mask.from_surface(self.image)
-        return self.collision_mask.overlap(player_mask, offset) is not None
+        return self.collision_mask.overlap(self.mask, offset) is not None
 
     def shoot(self, target_pos: Tuple[int, int], current_time: int, projectiles_group: pygame.sprite.Group) -> None:
         """
@@ -131,19 +173,18 @@ class Player(pygame.sprite.Sprite):
 
     def take_damage(self, amount: int) -> None:
         """
-        Reduce player's health by the given amount and handle death.
+        Reduce player's health by the given amount; reaching zero calls `on_death` once.
 
         Args:
             amount (int): Damage amount to apply.
         """
+        if self.health <= 0:
+            return
         self.health -= amount
         if self.health <= 0:
             self.health = 0
-            self.on_death()
-
-    def on_death(self) -> None:
-        """Handle player death event."""
-        print("Player has died")
+            if self.on_death is not None:
+                self.on_death(self)
 
     def switch_weapon(self, weapon_name: str) -> None:
         """
@@ -154,3 +195,4 @@ class Player(pygame.sprite.Sprite):
         """
         if weapon_name in self.WEAPON_CLASSES:
             self.weapon = self.WEAPON_CLASSES[weapon_name]()
+            self.weapon.damage = self.weapon_damage.get(weapon_name, self.weapon.damage)
@@ -1,7 +1,10 @@
 import pygame
 import os
-from typing import Optional
-from src.models.settings import WEAPON_DAMAGE, WEAPON_SPRITES_DIR
+from typing import Optional, Union
+from src.models.settings import (
+    WEAPON_DAMAGE, WEAPON_SPRITES_DIR, ENEMY_PROJECTILE_DAMAGE, ENEMY_PROJECTILE_IMG, ENEMY_PROJECTILE_FRAMES
+)
+from src.models.sprite_cache import SpriteCache
 
 
 class Projectile(pygame.sprite.Sprite):
@@ -10,16 +13,21 @@ class Projectile(pygame.sprite.Sprite):
 
     Attributes:
         pos (pygame.Vector2): Current position of the projectile.
+        base_image (pygame.Surface): Shared unrotated image; `image` is its rotated variant.
         target (pygame.Vector2): Target position for the projectile.
         speed (float): Movement speed of the projectile.
         damage (int): Damage dealt by the projectile.
         velocity (pygame.Vector2): Normalized velocity vector scaled by speed.
+        mask (pygame.Mask): Cached mask of the shared image for pixel-accurate hits.
+        image_angle (float): Direction the unrotated image points in, degrees
+            counterclockwise from the positive x axis.
     """
 
+    image_angle: float = 90
+
     def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float], speed: float, damage: int, image_path: str) -> None:
         super().__init__()
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.rect = self.image.get_rect(center=pos)
+        self.base_image = SpriteCache.load_image(image_path)
         self.pos = pygame.Vector2(pos)
         self.target = pygame.Vector2(target_pos)
         self.speed = speed
@@ -30,31 +38,49 @@ class Projectile(pygame.sprite.Sprite):
             self.velocity = direction.normalize() * speed
         else:
             self.velocity = pygame.Vector2(0, 0)
+        face_velocity(self)
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, bounds: pygame.Rect) -> None:
         """
-        Update projectile position and remove it if it goes outside the screen bounds.
+        Update projectile position and remove it if it leaves the level.
 
         Args:
             dt (float): Delta time since last frame in seconds.
+            bounds (pygame.Rect): Level area in world coordinates.
         """
         self.pos += self.velocity * dt
         self.rect.center = self.pos
 
-        screen_rect = pygame.Rect(0, 0, 1280, 720)
-        if not screen_rect.colliderect(self.rect):
+        if not bounds.colliderect(self.rect):
             self.kill()
 
 
+def face_velocity(projectile: pygame.sprite.Sprite) -> None:
+    """
+    Turn a projectile's image towards its velocity using the shared rotation cache.
+
+    Projectiles fly straight, so this runs once per shot rather than per frame.
+
+    Args:
+        projectile (pygame.sprite.Sprite): Sprite with `base_image`, `image_angle`, `velocity` and `pos`.
+    """
+    angle = 0.0
+    if projectile.velocity.x or projectile.velocity.y:
+        # Screen y points down, so negate it to get a counterclockwise angle
+        angle = pygame.Vector2(projectile.velocity.x, -projectile.velocity.y).as_polar()[1] - projectile.image_angle
+    projectile.image, projectile.rect = SpriteCache.get_rotated_rect(projectile.base_image, angle, projectile.pos)
+    projectile.mask = SpriteCache.get_mask(projectile.image)
+
+
 class Bullet(Projectile):
     """Projectile subclass representing a pistol bullet."""
 
-    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float]) -> None:
+    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float], damage: Optional[int] = None) -> None:
         super().__init__(
             pos,
             target_pos,
             speed=600,
-            damage=WEAPON_DAMAGE["Pistol"],
+            damage=damage if damage is not None else WEAPON_DAMAGE["Pistol"],
             image_path=os.path.join(WEAPON_SPRITES_DIR, "bullet.png")
         )
 
@@ -62,12 +88,12 @@ class Bullet(Projectile):
 class RifleBullet(Projectile):
     """Projectile subclass representing a rifle bullet."""
 
-    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float]) -> None:
+    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float], damage: Optional[int] = None) -> None:
         super().__init__(
             pos,
             target_pos,
             speed=800,
-            damage=WEAPON_DAMAGE["Rifle"],
+            damage=damage if damage is not None else WEAPON_DAMAGE["Rifle"],
             image_path=os.path.join(WEAPON_SPRITES_DIR, "bullet.png")
         )
 
@@ -75,12 +101,12 @@ class RifleBullet(Projectile):
 class PlasmaBolt(Projectile):
     """Projectile subclass representing a plasma rifle bolt."""
 
-    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float]) -> None:
+    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float], damage: Optional[int] = None) -> None:
         super().__init__(
             pos,
             target_pos,
             speed=500,
-            damage=WEAPON_DAMAGE["PlasmaRifle"],
+            damage=damage if damage is not None else WEAPON_DAMAGE["PlasmaRifle"],
             image_path=os.path.join(WEAPON_SPRITES_DIR, "plasma_bolt.png")
         )
 
@@ -88,26 +114,77 @@ class PlasmaBolt(Projectile):
 class Grenade(Projectile):
     """Projectile subclass representing a grenade."""
 
-    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float]) -> None:
+    def __init__(self, pos: tuple[float, float], target_pos: tuple[float, float], damage: Optional[int] = None) -> None:
         super().__init__(
             pos,
             target_pos,
             speed=400,
-            damage=WEAPON_DAMAGE["GrenadeLauncher"],
+            damage=damage if damage is not None else WEAPON_DAMAGE["GrenadeLauncher"],
             image_path=os.path.join(WEAPON_SPRITES_DIR, "grenade.png")
         )
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, bounds: pygame.Rect) -> None:
         """
         Update grenade position.
 
         Note:
             Future implementation may include timed explosion or collision detection.
         """
-        super().update(dt)
+        super().update(dt, bounds)
+
+
+class EnemyProjectile(pygame.sprite.Sprite):
+    """
+    Hostile projectile fired by enemies at the player.
+
+    Instances are preallocated and recycled by EnemyFireSystem, so launch()
+    takes the place of the constructor for every shot.
+
+    Attributes:
+        pos (pygame.Vector2): Current position of the projectile.
+        velocity (pygame.Vector2): Velocity in pixels per second.
+        damage (int): Damage dealt to the player on hit.
+        mask (pygame.Mask): Cached mask of the shared image.
+    """
+
+    # The flame's head is at the bottom of the strip frame
+    image_angle: float = -90
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.base_image = SpriteCache.load_frame(ENEMY_PROJECTILE_IMG, 0, ENEMY_PROJECTILE_FRAMES)
+        self.image = self.base_image
+        self.mask = SpriteCache.get_mask(self.image)
+        self.rect = self.image.get_rect()
+        self.pos = pygame.Vector2()
+        self.velocity = pygame.Vector2()
+        self.damage = ENEMY_PROJECTILE_DAMAGE
+
+    def launch(self, pos: Union[tuple[float, float], pygame.Vector2], velocity: pygame.Vector2) -> None:
+        """
+        Place the projectile for a new shot.
+
+        Args:
+            pos (tuple[float, float] | pygame.Vector2): Starting position.
+            velocity (pygame.Vector2): Velocity in pixels per second.
+        """
+        self.pos.update(pos)
+        self.velocity.update(velocity)
+        face_velocity(self)
+
+    def update(self, dt: float) -> None:
+        """
+        Move the projectile. Leaving the level is handled by EnemyFireSystem.
+
+        Args:
+            dt (float): Delta time since last frame in seconds.
+        """
+        self.pos += self.velocity * dt
+        self.rect.center = self.pos
 
 
-def create_projectile(weapon_name: str, pos: tuple[float, float], target_pos: tuple[float, float]) -> Optional[Projectile]:
+def create_projectile(weapon_name: str, pos: tuple[float, float], target_pos: tuple[float, float],
+                      damage: Optional[int] = None) -> Optional[Projectile]:
     """
     Factory function to create a projectile based on weapon name.
 
@@ -115,18 +192,19 @@ def create_projectile(weapon_name: str, pos: tuple[float, float], target_pos: tu
         weapon_name (str): Name of the weapon.
         pos (tuple[float, float]): Starting position of the projectile.
         target_pos (tuple[float, float]): Target position.
+        damage (Optional[int]): Damage dealt; defaults to WEAPON_DAMAGE of the weapon.
 
     Returns:
         Optional[Projectile]: Instance of a Projectile subclass or None if unknown weapon.
     """
     if weapon_name == "Pistol":
-        return Bullet(pos, target_pos)
+        return Bullet(pos, target_pos, damage)
     elif weapon_name == "Rifle":
-        return RifleBullet(pos, target_pos)
+        return RifleBullet(pos, target_pos, damage)
     elif weapon_name == "PlasmaRifle":
-        return PlasmaBolt(pos, target_pos)
+        return PlasmaBolt(pos, target_pos, damage)
     elif weapon_name == "GrenadeLauncher":
-        return Grenade(pos, target_pos)
+        return Grenade(pos, target_pos, damage)
     elif weapon_name == "AssaultRifle":
-        return Bullet(pos, target_pos)  # Same bullet, but used for burst fire
+        return Bullet(pos, target_pos, damage)  # Same bullet, but used for burst fire
     return None
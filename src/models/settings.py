@@ -4,9 +4,10 @@ import os
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+MAX_FRAME_MS = 250  # longest gameplay step; slower frames (stalls, window drags) slow the game down instead
 
 # Player
-PLAYER_SPEED = 5
+PLAYER_SPEED = 300  # pixels per second
 PLAYER_HEALTH = 3
 
 # Enemies and bosses
@@ -15,7 +16,13 @@ BOSS_HEALTH = 100
 
 # Levels
 WAVES_PER_LEVEL = 5
-ENEMY_SCALE_FACTOR = 1.5  # increase the number of enemies every 3 levels
+ENEMY_SCALE_FACTOR = 1.5  # increase the number of enemies every 3 levels (levels 1-3 are boss-only)
+ENEMY_SPAWN_INTERVAL = 1.0  # seconds between enemy spawns within a wave
+CONTACT_DAMAGE = 1  # damage an enemy deals to the player on contact (the enemy dies)
+
+# Map collision: near-black pixels of a map image are walls
+MAP_WALL_COLOR = (0, 0, 0)
+MAP_WALL_THRESHOLD = (10, 10, 10)
 
 # Ways to assets
 ASSET_DIR = "assets"
@@ -36,6 +43,46 @@ MAP_IMG = [
 # Sound
 DEFAULT_MUSIC_VOLUME = 0.5
 DEFAULT_SFX_VOLUME = 0.7
+MUSIC_CROSSFADE_MS = 800
+MUSIC_CACHE_SIZE = 3  # decoded music tracks kept in memory
+
+# Sound effect voices: mixer channels reserved per category, and how many
+# copies of one sound may play at once before the oldest is restarted
+SFX_CHANNEL_POOLS = {
+    "ui": 2,
+    "weapons": 8,
+    "spawns": 6,
+    "bosses": 2,
+    "steps": 1
+}
+SFX_PRIORITIES = {
+    "steps": 0,
+    "spawns": 1,
+    "weapons": 2,
+    "ui": 3,
+    "bosses": 3
+}
+SFX_MAX_INSTANCES = 3
+
+# Sound effects loaded at startup, in load order: (mixer category, sound name, file in SFX_DIR).
+# Sounds needed on the first menu frame come first, boss sounds last.
+SFX_MANIFEST = [
+    ("ui", "click", "click.wav"),
+    ("weapons", "Pistol", "pistol.wav"),
+    ("steps", "steps", "steps.wav"),
+    ("weapons", "Rifle", "rifle.wav"),
+    ("weapons", "AssaultRifle", "pistol.wav"),
+    ("weapons", "PlasmaRifle", "plasma.wav"),
+    ("weapons", "GrenadeLauncher", "rlaunch.wav"),
+    ("spawns", "jumper", "jumper.wav"),
+    ("spawns", "shooter", "shooter.wav"),
+    ("spawns", "warrior", "warrior.wav"),
+    ("spawns", "tank", "tank.wav"),
+    ("spawns", "summoner", "summoner.wav"),
+    ("bosses", "ShooterBoss", "boss_shooter.wav"),
+    ("bosses", "TankBoss", "boss_tank.wav"),
+    ("bosses", "SummonerBoss", "boss_summoner.wav")
+]
 
 # Weapons
 WEAPON_DAMAGE = {
@@ -46,5 +93,71 @@ WEAPON_DAMAGE = {
     "GrenadeLauncher": 5
 }
 
+# Rendering
+RENDER_BACKEND = "software"  # "software" (Surface blits) or "sdl2" (pygame._sdl2 textures; falls back to software)
+SDL2_RENDER_DRIVER = ""  # SDL render driver for the sdl2 backend, e.g. "software" or "opengl"; empty picks the best
+RENDER_Y_SORT = False  # draw characters by their bottom edge instead of spawn order
+
+# Dynamic resolution: the world is drawn at a lower scale and stretched to the
+# window when frames take longer than the 1000 / FPS budget
+DYNAMIC_RESOLUTION = True
+RESOLUTION_SCALES = (1.0, 0.75, 0.625, 0.5)  # render scales, full resolution first
+RESOLUTION_WINDOW = 30  # frames averaged per decision
+RESOLUTION_UP_RATIO = 0.85  # scale up when the frame time projected to the next scale is below this share of the budget
+RESOLUTION_COOLDOWN = 60  # frames to wait after a change before scaling up (doubles on oscillation)
+
+# Pause overlay
+PAUSE_DIM_ALPHA = 180  # darkness of the frozen gameplay frame behind the pause menu
+PAUSE_BLUR_FACTOR = 4  # downscale factor used to blur the frozen frame (1 disables blurring)
+
+# Sprite rotation
+ROTATION_STEPS = 64  # quantised angles per image in the rotation cache
+
+# Enemy fire
+SHOOTER_FIRE_INTERVAL = 2.0  # seconds between Shooter shots
+BOSS_FIRE_INTERVAL = 1.5  # seconds between BossShooter volleys
+BOSS_VOLLEY_SIZE = 12  # bullets in a BossShooter ring
+ENEMY_PROJECTILE_SPEED = 250
+ENEMY_PROJECTILE_DAMAGE = 1  # the smallest hit; PLAYER_HEALTH is 3
+ENEMY_PROJECTILE_POOL_SIZE = 512  # preallocated hostile bullets; shots beyond this are dropped
+ENEMY_PROJECTILE_IMG = os.path.join(WEAPON_SPRITES_DIR, "flameball.png")
+ENEMY_PROJECTILE_FRAMES = 4  # frames in the ENEMY_PROJECTILE_IMG strip
+
+# AI level of detail: (max distance outside the camera view in px, update every N ticks).
+# The last tier must be unlimited (None).
+AI_LOD_TIERS = (
+    (200, 1),  # on screen or close to it: every tick
+    (500, 2),
+    (None, 4),
+)
+
+# Summons
+SUMMONER_INTERVAL = 3.0  # seconds between Summoner summons
+BOSS_SUMMON_INTERVAL = 4.0  # seconds between BossSummoner summons
+SUMMONER_MINIONS = 1  # minions per Summoner summon
+BOSS_SUMMON_MINIONS = 2  # minions per BossSummoner summon
+ENTITY_BUDGET = 60  # live enemies + bosses allowed on a level before the summon policy applies
+SUMMON_POLICY = "queue"  # over budget: "queue" (spawn later), "drop" or "merge" (add health to a live minion)
+
 # Database
 DB_PATH = "saves/game_save.db"
+
+# Diagnostics
+TELEMETRY_ENABLED = True  # record per-level performance summaries (query with python -m src.tools.telemetry)
+TELEMETRY_DB_PATH = "saves/telemetry.db"
+STARTUP_LOG_PATH = "saves/startup.log"
+# Leak diagnostics: tracemalloc snapshots and instance counts at every level start (slow; off in normal play)
+LEAK_DIAGNOSTICS = False
+LEAK_TOP_DIFFS = 10  # allocation sites logged per level transition
+LEAK_WARMUP_LEVELS = 1  # level starts that fill one-off caches before the baseline is taken
+LEAK_MAX_GROWTH_KB = 1024  # traced heap growth since the baseline that counts as a leak
+LEAK_MAX_INSTANCE_GROWTH = {  # allowed growth of instances the level does not account for
+    "Enemy": 0,
+    "Projectile": 0,
+    "Surface": 32,
+    "Mask": 32,
+}
+
+# Operator overrides from the config file, --preset and --set, filled in by
+# src.models.config.parse_and_configure() before the game modules are imported
+CONFIG_OVERRIDES = {}
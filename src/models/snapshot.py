@@ -0,0 +1,329 @@
+import struct
+from typing import Any, Dict, List, Tuple
+import pygame
+from src.models.enemy import (
+    Enemy, Jumper, Shooter, Warrior, Tank, Summoner, BossShooter, BossTank, BossSummoner
+)
+from src.models.projectile import Projectile, Bullet, RifleBullet, PlasmaBolt, Grenade, face_velocity
+
+# Snapshot layout (all little-endian):
+#   header             magic, version, level, wave and AI state, record counts
+#   rng                state of the level RNG
+#   player             one record
+#   pending spawns     enemy type ids still queued by the wave
+#   pending summons    minions queued by the summon pipeline
+#   enemies            fixed-size records, then bosses with the same layout
+#   projectiles        fixed-size records
+#   enemy projectiles  fixed-size records
+#
+# Positions, velocities and timers are doubles, like the floats they come
+# from, so a restored world steps exactly like the one that was encoded.
+#
+# Type tables are append-only: the index of a class is its id on disk, so new
+# types must go at the end and existing entries must never be reordered.
+
+SNAPSHOT_MAGIC = b"DSWS"
+SNAPSHOT_VERSION = 2
+
+ENEMY_TYPES: Tuple[type, ...] = (Jumper, Shooter, Warrior, Tank, Summoner, BossShooter, BossTank, BossSummoner)
+PROJECTILE_TYPES: Tuple[type, ...] = (Bullet, RifleBullet, PlasmaBolt, Grenade)
+WEAPON_NAMES: Tuple[str, ...] = ("Pistol", "Rifle", "AssaultRifle", "PlasmaRifle", "GrenadeLauncher")
+
+# magic, version, level, wave, boss index, flags, seed, wave spawn timer, wave kills,
+# AI tick, AI next slot, then the counts of the pending spawn, pending summon,
+# enemy, boss, projectile and enemy projectile records
+_HEADER = struct.Struct("<4sHHHHBIdHIIHHHHHH")
+_RNG = struct.Struct("<625IBd")          # Mersenne Twister words and position, has gauss_next, gauss_next
+_PLAYER = struct.Struct("<ddhBi")        # x, y, health, weapon id, last shot time (ms)
+_PENDING_SPAWN = struct.Struct("<B")     # type id
+_PENDING_SUMMON = struct.Struct("<Bdd")  # type id, x, y
+_ENEMY = struct.Struct("<BddhhdBiBd")    # type id, x, y, health, max health, action timer, flags, AI slot, period, dt
+_PROJECTILE = struct.Struct("<Bddddh")   # type id, x, y, vx, vy, damage
+_ENEMY_PROJECTILE = struct.Struct("<ddddh")  # x, y, vx, vy, damage
+
+# Header flags
+_FLAG_BOSS_SPAWNED = 0x01
+
+# Enemy flags
+_FLAG_SUMMONED = 0x01
+_FLAG_MIRRORED = 0x02
+
+_ENEMY_IDS = {cls: idx for idx, cls in enumerate(ENEMY_TYPES)}
+_PROJECTILE_IDS = {cls: idx for idx, cls in enumerate(PROJECTILE_TYPES)}
+_WEAPON_IDS = {name: idx for idx, name in enumerate(WEAPON_NAMES)}
+
+# Enemy timers that drive shooting and summoning; at most one is present per type
+_TIMER_ATTRS = ("shoot_timer", "summon_timer")
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot buffer is malformed or from an unsupported version."""
+
+
+def _enemy_timer(enemy: Enemy) -> float:
+    for attr in _TIMER_ATTRS:
+        if hasattr(enemy, attr):
+            return getattr(enemy, attr)
+    return 0.0
+
+
+def _pack_enemies(buffer: bytearray, offset: int, enemies: List[Enemy]) -> int:
+    pack_into = _ENEMY.pack_into
+    size = _ENEMY.size
+    for enemy in enemies:
+        flags = 0
+        if enemy.summoned:
+            flags |= _FLAG_SUMMONED
+        if enemy.image is not enemy.base_image:
+            flags |= _FLAG_MIRRORED
+        pack_into(buffer, offset, _ENEMY_IDS[type(enemy)], enemy.pos.x, enemy.pos.y, enemy.health,
+                  enemy.max_health, _enemy_timer(enemy), flags, enemy.ai_slot, enemy.ai_period, enemy.ai_dt)
+        offset += size
+    return offset
+
+
+def encode_world(player: Any, level_manager: Any) -> bytes:
+    """
+    Encode the runtime world into a compact binary snapshot.
+
+    Args:
+        player (Player): The player sprite.
+        level_manager (LevelManager): Level manager owning waves, bosses and projectiles.
+
+    Returns:
+        bytes: Snapshot buffer suitable for decode_world().
+    """
+    wave_manager = level_manager.wave_manager
+    pending_spawns = wave_manager.enemies_to_spawn
+    pending_summons = level_manager.summons.pending
+    enemies = level_manager.enemy_group.sprites()
+    bosses = level_manager.boss_group.sprites()
+    projectiles = level_manager.projectiles.sprites()
+    enemy_projectiles = level_manager.enemy_fire.group.sprites()
+
+    buffer = bytearray(
+        _HEADER.size
+        + _RNG.size
+        + _PLAYER.size
+        + _PENDING_SPAWN.size * len(pending_spawns)
+        + _PENDING_SUMMON.size * len(pending_summons)
+        + _ENEMY.size * (len(enemies) + len(bosses))
+        + _PROJECTILE.size * len(projectiles)
+        + _ENEMY_PROJECTILE.size * len(enemy_projectiles)
+    )
+
+    _HEADER.pack_into(
+        buffer, 0,
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        level_manager.current_level,
+        wave_manager.current_wave,
+        level_manager.boss_index,
+        _FLAG_BOSS_SPAWNED if level_manager.boss_spawned else 0,
+        level_manager.seed,
+        wave_manager.spawn_timer,
+        wave_manager.killed_count,
+        level_manager.ai_scheduler.tick,
+        level_manager.ai_scheduler.next_slot,
+        len(pending_spawns),
+        len(pending_summons),
+        len(enemies),
+        len(bosses),
+        len(projectiles),
+        len(enemy_projectiles),
+    )
+    offset = _HEADER.size
+
+    _, words, gauss_next = level_manager.rng.getstate()
+    _RNG.pack_into(buffer, offset, *words, gauss_next is not None, gauss_next or 0.0)
+    offset += _RNG.size
+
+    weapon_name = player.weapon.name if player.weapon else WEAPON_NAMES[0]
+    _PLAYER.pack_into(
+        buffer, offset,
+        player.pos.x, player.pos.y,
+        player.health, _WEAPON_IDS[weapon_name], player.last_shot_time,
+    )
+    offset += _PLAYER.size
+
+    for enemy in pending_spawns:
+        _PENDING_SPAWN.pack_into(buffer, offset, _ENEMY_IDS[type(enemy)])
+        offset += _PENDING_SPAWN.size
+    for minion_class, (x, y) in pending_summons:
+        _PENDING_SUMMON.pack_into(buffer, offset, _ENEMY_IDS[minion_class], x, y)
+        offset += _PENDING_SUMMON.size
+
+    offset = _pack_enemies(buffer, offset, enemies)
+    offset = _pack_enemies(buffer, offset, bosses)
+
+    pack_into = _PROJECTILE.pack_into
+    size = _PROJECTILE.size
+    for proj in projectiles:
+        pack_into(buffer, offset, _PROJECTILE_IDS[type(proj)], proj.pos.x, proj.pos.y, proj.velocity.x, proj.velocity.y, proj.damage)
+        offset += size
+
+    pack_into = _ENEMY_PROJECTILE.pack_into
+    size = _ENEMY_PROJECTILE.size
+    for bullet in enemy_projectiles:
+        pack_into(buffer, offset, bullet.pos.x, bullet.pos.y, bullet.velocity.x, bullet.velocity.y, bullet.damage)
+        offset += size
+
+    return bytes(buffer)
+
+
+def decode_world(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a snapshot buffer into plain records.
+
+    Args:
+        data (bytes): Buffer produced by encode_world().
+
+    Returns:
+        Dict[str, Any]: Dictionary with keys 'version', 'level', 'wave', 'boss_index',
+        'boss_spawned', 'seed', 'spawn_timer', 'killed', 'ai_tick', 'ai_next_slot',
+        'rng' (a random.Random state), 'player', 'pending_spawns' (enemy type ids),
+        'pending_summons', 'enemies', 'bosses', 'projectiles' and 'enemy_projectiles'.
+        Entity records are tuples laid out like their struct formats.
+
+    Raises:
+        SnapshotError: If the buffer is truncated, has a bad magic or an unknown version.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise SnapshotError("Snapshot is truncated")
+
+    (magic, version, level, wave, boss_index, flags, seed, spawn_timer, killed, ai_tick, ai_next_slot,
+     n_spawns, n_summons, n_enemies, n_bosses, n_projectiles, n_enemy_projectiles) = _HEADER.unpack_from(view, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a world snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+
+    expected = (
+        _HEADER.size
+        + _RNG.size
+        + _PLAYER.size
+        + _PENDING_SPAWN.size * n_spawns
+        + _PENDING_SUMMON.size * n_summons
+        + _ENEMY.size * (n_enemies + n_bosses)
+        + _PROJECTILE.size * n_projectiles
+        + _ENEMY_PROJECTILE.size * n_enemy_projectiles
+    )
+    if len(view) != expected:
+        raise SnapshotError(f"Snapshot size mismatch: expected {expected} bytes, got {len(view)}")
+
+    offset = _HEADER.size
+    *words, has_gauss, gauss_next = _RNG.unpack_from(view, offset)
+    offset += _RNG.size
+    player = _PLAYER.unpack_from(view, offset)
+    offset += _PLAYER.size
+
+    def records(layout: struct.Struct, count: int) -> List[Tuple]:
+        nonlocal offset
+        end = offset + layout.size * count
+        result = list(layout.iter_unpack(view[offset:end]))
+        offset = end
+        return result
+
+    pending_spawns = [type_id for type_id, in records(_PENDING_SPAWN, n_spawns)]
+    return {
+        'version': version,
+        'level': level,
+        'wave': wave,
+        'boss_index': boss_index,
+        'boss_spawned': bool(flags & _FLAG_BOSS_SPAWNED),
+        'seed': seed,
+        'spawn_timer': spawn_timer,
+        'killed': killed,
+        'ai_tick': ai_tick,
+        'ai_next_slot': ai_next_slot,
+        'rng': (3, tuple(words), gauss_next if has_gauss else None),
+        'player': player,
+        'pending_spawns': pending_spawns,
+        'pending_summons': records(_PENDING_SUMMON, n_summons),
+        'enemies': records(_ENEMY, n_enemies),
+        'bosses': records(_ENEMY, n_bosses),
+        'projectiles': records(_PROJECTILE, n_projectiles),
+        'enemy_projectiles': records(_ENEMY_PROJECTILE, n_enemy_projectiles),
+    }
+
+
+def _build_enemy(record: Tuple[int, float, float, int, int, float, int, int, int, float]) -> Enemy:
+    type_id, x, y, health, max_health, timer, flags, ai_slot, ai_period, ai_dt = record
+    enemy = ENEMY_TYPES[type_id]((x, y))
+    enemy.health = health
+    enemy.max_health = max_health
+    for attr in _TIMER_ATTRS:
+        if hasattr(enemy, attr):
+            setattr(enemy, attr, timer)
+    if flags & _FLAG_SUMMONED:
+        enemy.summoned = True
+    if flags & _FLAG_MIRRORED:
+        enemy.face(-enemy.image_facing)
+    enemy.ai_slot = ai_slot
+    enemy.ai_period = ai_period
+    enemy.ai_dt = ai_dt
+    return enemy
+
+
+def _build_projectile(record: Tuple[int, float, float, float, float, int]) -> Projectile:
+    type_id, x, y, vx, vy, damage = record
+    proj = PROJECTILE_TYPES[type_id]((x, y), (x + vx, y + vy))
+    proj.velocity = pygame.Vector2(vx, vy)
+    face_velocity(proj)
+    proj.damage = damage
+    return proj
+
+
+def restore_world(snapshot: Dict[str, Any], player: Any, level_manager: Any) -> None:
+    """
+    Restore a decoded snapshot into the live player and level manager.
+
+    The level is restarted (map and collision mask reloaded, the player given
+    the new mask), then the RNG, wave, spawn and summon queues, AI schedule,
+    enemies, bosses and both kinds of projectiles are replaced by the
+    snapshot contents.
+
+    Args:
+        snapshot (Dict[str, Any]): Result of decode_world().
+        player (Player): Player sprite to update in place.
+        level_manager (LevelManager): Level manager to restore into.
+    """
+    level_manager.seed = snapshot['seed']
+    level_manager.boss_index = snapshot['boss_index']
+    level_manager.start_level(snapshot['level'])
+    level_manager.rng.setstate(snapshot['rng'])
+
+    wave_manager = level_manager.wave_manager
+    wave_manager.current_wave = snapshot['wave']
+    wave_manager.enemies_to_spawn = [ENEMY_TYPES[type_id]((0, 0)) for type_id in snapshot['pending_spawns']]
+    wave_manager.spawn_timer = snapshot['spawn_timer']
+
+    for record in snapshot['enemies']:
+        wave_manager.track(_build_enemy(record))
+    wave_manager.killed_count = snapshot['killed']
+    for record in snapshot['bosses']:
+        wave_manager.boss_group.add(_build_enemy(record))
+    level_manager.boss_spawned = snapshot['boss_spawned']
+
+    level_manager.summons.pending.extend(
+        (ENEMY_TYPES[type_id], (x, y)) for type_id, x, y in snapshot['pending_summons']
+    )
+    level_manager.ai_scheduler.tick = snapshot['ai_tick']
+    level_manager.ai_scheduler.next_slot = snapshot['ai_next_slot']
+
+    level_manager.projectiles.empty()
+    for record in snapshot['projectiles']:
+        level_manager.projectiles.add(_build_projectile(record))
+    for x, y, vx, vy, damage in snapshot['enemy_projectiles']:
+        bullet = level_manager.enemy_fire.spawn((x, y), pygame.Vector2(vx, vy))
+        if bullet is None:
+            raise SnapshotError("Snapshot has more enemy projectiles than the pool holds")
+        bullet.damage = damage
+
+    x, y, health, weapon_id, last_shot_time = snapshot['player']
+    player.set_collision_mask(level_manager.get_collision_mask())
+    player.move_to((x, y))
+    player.health = health
+    player.switch_weapon(WEAPON_NAMES[weapon_id])
+    player.last_shot_time = last_shot_time
@@ -0,0 +1,197 @@
+import pygame
+import weakref
+from typing import Dict, List, Optional, Tuple
+from src.models.settings import ROTATION_STEPS
+
+
+class SpriteCache:
+    """
+    Shared sprite images and their collision masks.
+
+    Every sprite of a type uses the same image surface, loaded once per path,
+    and the mask for a surface is built once on first use. Rotated variants
+    are quantised to ROTATION_STEPS angles and mirrored variants are cached
+    too, so turning a sprite costs a lookup instead of a transform. Sprites
+    must treat cached images as read-only.
+
+    Attributes:
+        images (Dict[str, pygame.Surface]): Converted images by file path.
+    """
+
+    images: Dict[str, pygame.Surface] = {}
+    frames: Dict[Tuple[str, int], pygame.Surface] = {}
+    _masks: "weakref.WeakKeyDictionary[pygame.Surface, pygame.Mask]" = weakref.WeakKeyDictionary()
+    _rotations: "weakref.WeakKeyDictionary[pygame.Surface, List[Optional[pygame.Surface]]]" = weakref.WeakKeyDictionary()
+    _flipped: "weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface]" = weakref.WeakKeyDictionary()
+    _scaled: "weakref.WeakKeyDictionary[pygame.Surface, Dict[float, pygame.Surface]]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def load_image(cls, path: str) -> pygame.Surface:
+        """
+        Load an image with per-pixel alpha, or return the already loaded surface.
+
+        Args:
+            path (str): Image file path.
+
+        Returns:
+            pygame.Surface: The shared image surface.
+        """
+        image = cls.images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            cls.images[path] = image
+        return image
+
+    @classmethod
+    def load_frame(cls, path: str, index: int, frame_count: int) -> pygame.Surface:
+        """
+        Return one frame of a horizontal sprite strip as a shared subsurface.
+
+        Args:
+            path (str): Image file path of the strip.
+            index (int): Frame index, from the left.
+            frame_count (int): Number of equally wide frames in the strip.
+
+        Returns:
+            pygame.Surface: The shared frame surface.
+        """
+        frame = cls.frames.get((path, index))
+        if frame is None:
+            strip = cls.load_image(path)
+            width = strip.get_width() // frame_count
+            frame = strip.subsurface((index * width, 0, width, strip.get_height()))
+            cls.frames[(path, index)] = frame
+        return frame
+
+    @classmethod
+    def get_mask(cls, image: pygame.Surface) -> pygame.Mask:
+        """
+        Return the collision mask for an image, building it on first use.
+
+        Args:
+            image (pygame.Surface): Image surface, normally one from load_image().
+
+        Returns:
+            pygame.Mask: Mask of the image's opaque pixels.
+        """
+        mask = cls._masks.get(image)
+        if mask is None:
+            mask = pygame.mask.from_surface(image)
+            cls._masks[image] = mask
+        return mask
+
+    @classmethod
+    def get_rotated(cls, image: pygame.Surface, angle: float) -> pygame.Surface:
+        """
+        Return the image rotated counterclockwise by the nearest quantised angle.
+
+        Each variant is rendered on first use and shared by every sprite using the image.
+        Angle 0 is the image itself; it is not stored, since a cache entry referencing
+        its own key would keep the weakly keyed entry alive forever.
+
+        Args:
+            image (pygame.Surface): Unrotated image, normally one from load_image().
+            angle (float): Rotation in degrees, counterclockwise.
+
+        Returns:
+            pygame.Surface: The shared rotated surface.
+        """
+        index = round(angle * ROTATION_STEPS / 360) % ROTATION_STEPS
+        if index == 0:
+            return image
+        variants = cls._rotations.get(image)
+        if variants is None:
+            variants = [None] * ROTATION_STEPS
+            cls._rotations[image] = variants
+        rotated = variants[index]
+        if rotated is None:
+            rotated = pygame.transform.rotate(image, index * 360 / ROTATION_STEPS)
+            variants[index] = rotated
+        return rotated
+
+    @classmethod
+    def get_rotated_rect(cls, image: pygame.Surface, angle: float, center: Tuple[float, float]) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Return the nearest rotated variant and its rect centred on a position.
+
+        Args:
+            image (pygame.Surface): Unrotated image.
+            angle (float): Rotation in degrees, counterclockwise.
+            center (Tuple[float, float]): Center of the sprite.
+
+        Returns:
+            Tuple[pygame.Surface, pygame.Rect]: Rotated surface and its centred rect.
+        """
+        rotated = cls.get_rotated(image, angle)
+        return rotated, rotated.get_rect(center=center)
+
+    @classmethod
+    def get_flipped(cls, image: pygame.Surface) -> pygame.Surface:
+        """
+        Return the horizontally mirrored image.
+
+        Args:
+            image (pygame.Surface): Image to mirror.
+
+        Returns:
+            pygame.Surface: The shared mirrored surface.
+        """
+        flipped = cls._flipped.get(image)
+        if flipped is None:
+            flipped = pygame.transform.flip(image, True, False)
+            cls._flipped[image] = flipped
+        return flipped
+
+    @classmethod
+    def get_scaled(cls, image: pygame.Surface, scale: float) -> pygame.Surface:
+        """
+        Return the image resized by a render scale.
+
+        Nearest-neighbour scaling keeps the pixel art sharp and is cheap
+        enough to fill the cache on the first frame at a new scale.
+
+        Args:
+            image (pygame.Surface): Image to resize.
+            scale (float): Size factor, one of a small set such as RESOLUTION_SCALES.
+
+        Returns:
+            pygame.Surface: The shared resized surface.
+        """
+        variants = cls._scaled.get(image)
+        if variants is None:
+            variants = cls._scaled[image] = {}
+        scaled = variants.get(scale)
+        if scaled is None:
+            width, height = image.get_size()
+            scaled = pygame.transform.scale(image, (max(1, round(width * scale)), max(1, round(height * scale))))
+            variants[scale] = scaled
+        return scaled
+
+    @classmethod
+    def cached_instances(cls) -> Dict[str, int]:
+        """
+        Count the distinct surfaces and masks the cache holds, for leak diagnostics.
+
+        Returns:
+            Dict[str, int]: 'Surface' and 'Mask' counts.
+        """
+        surfaces = {id(image) for image in cls.images.values()}
+        surfaces.update(id(frame) for frame in cls.frames.values())
+        for variants in cls._rotations.values():
+            surfaces.update(id(variant) for variant in variants if variant is not None)
+        surfaces.update(id(flipped) for flipped in cls._flipped.values())
+        for variants in cls._scaled.values():
+            surfaces.update(id(scaled) for scaled in variants.values())
+        return {"Surface": len(surfaces), "Mask": len(cls._masks)}
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop all cached images and masks.
+        """
+        cls.images.clear()
+        cls.frames.clear()
+        cls._masks.clear()
+        cls._rotations.clear()
+        cls._flipped.clear()
+        cls._scaled.clear()
@@ -0,0 +1,203 @@
+import sqlite3
+import os
+import time
+from src.models.settings import TELEMETRY_DB_PATH
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Columns of telemetry_levels written by record_level, in insert order
+LEVEL_COLUMNS = (
+    "level", "outcome", "duration_s", "frames", "load_ms",
+    "frame_mean_ms", "frame_p50_ms", "frame_p95_ms", "frame_p99_ms", "frame_max_ms",
+    "work_mean_ms", "work_p95_ms", "work_p99_ms",
+    "peak_enemies", "peak_projectiles", "peak_enemy_projectiles", "min_render_scale",
+    "gc_collections", "gc_pause_ms", "gc_max_pause_ms",
+)
+
+
+class TelemetryStore:
+    """
+    Stores per-level performance summaries in SQLite.
+
+    A session row describes the machine and configuration of one run of the
+    game; each finished level adds one telemetry_levels row plus its
+    frame-time histogram, written together in a single transaction. The
+    database is a sibling of the save file so telemetry never touches
+    save data.
+
+    Attributes:
+        path (str): Database file path.
+    """
+
+    def __init__(self, path: str = TELEMETRY_DB_PATH) -> None:
+        """
+        Initialize the database and ensure the telemetry tables exist.
+
+        Args:
+            path (str): Database file path.
+        """
+        self.path = path
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the database directory and tables if they don't exist."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with sqlite3.connect(self.path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS telemetry_sessions (
+                    id INTEGER PRIMARY KEY,
+                    started_at TEXT,
+                    platform TEXT,
+                    pygame_version TEXT,
+                    render_backend TEXT,
+                    screen_width INTEGER,
+                    screen_height INTEGER,
+                    fps INTEGER,
+                    seed INTEGER,
+                    config TEXT
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS telemetry_levels (
+                    id INTEGER PRIMARY KEY,
+                    session_id INTEGER REFERENCES telemetry_sessions(id),
+                    finished_at TEXT,
+                    level INTEGER,
+                    outcome TEXT,
+                    duration_s REAL,
+                    frames INTEGER,
+                    load_ms REAL,
+                    frame_mean_ms REAL,
+                    frame_p50_ms REAL,
+                    frame_p95_ms REAL,
+                    frame_p99_ms REAL,
+                    frame_max_ms REAL,
+                    work_mean_ms REAL,
+                    work_p95_ms REAL,
+                    work_p99_ms REAL,
+                    peak_enemies INTEGER,
+                    peak_projectiles INTEGER,
+                    peak_enemy_projectiles INTEGER,
+                    min_render_scale REAL,
+                    gc_collections INTEGER,
+                    gc_pause_ms REAL,
+                    gc_max_pause_ms REAL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS telemetry_frame_histogram (
+                    level_id INTEGER REFERENCES telemetry_levels(id),
+                    bucket_ms REAL,
+                    frames INTEGER
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_telemetry_levels_session ON telemetry_levels(session_id)")
+            conn.commit()
+
+    def start_session(self, info: Dict[str, Any]) -> int:
+        """
+        Insert a session row.
+
+        Args:
+            info (Dict[str, Any]): Values for the telemetry_sessions columns (except id and started_at).
+
+        Returns:
+            int: The new session id.
+        """
+        with sqlite3.connect(self.path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO telemetry_sessions
+                    (started_at, platform, pygame_version, render_backend, screen_width, screen_height, fps, seed, config)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                time.strftime("%Y-%m-%d %H:%M:%S"), info.get("platform"), info.get("pygame_version"),
+                info.get("render_backend"), info.get("screen_width"), info.get("screen_height"),
+                info.get("fps"), info.get("seed"), info.get("config"),
+            ))
+            conn.commit()
+            return cursor.lastrowid
+
+    def record_level(self, session_id: int, summary: Dict[str, Any], histogram: Sequence[Tuple[float, int]]) -> int:
+        """
+        Write one level summary and its frame-time histogram in a single transaction.
+
+        Args:
+            session_id (int): Session the level belongs to.
+            summary (Dict[str, Any]): Values for LEVEL_COLUMNS.
+            histogram (Sequence[Tuple[float, int]]): (bucket lower edge in ms, frame count) for non-empty buckets.
+
+        Returns:
+            int: The new level row id.
+        """
+        columns = ", ".join(LEVEL_COLUMNS)
+        placeholders = ", ".join("?" for _ in LEVEL_COLUMNS)
+        with sqlite3.connect(self.path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"INSERT INTO telemetry_levels (session_id, finished_at, {columns}) VALUES (?, ?, {placeholders})",
+                (session_id, time.strftime("%Y-%m-%d %H:%M:%S"), *(summary.get(name) for name in LEVEL_COLUMNS)),
+            )
+            level_id = cursor.lastrowid
+            cursor.executemany(
+                "INSERT INTO telemetry_frame_histogram (level_id, bucket_ms, frames) VALUES (?, ?, ?)",
+                [(level_id, bucket, count) for bucket, count in histogram],
+            )
+            conn.commit()
+            return level_id
+
+    def sessions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Return the most recent sessions with their level count and worst p95 frame time.
+
+        Args:
+            limit (int): Maximum number of sessions.
+
+        Returns:
+            List[Dict[str, Any]]: Newest first.
+        """
+        with sqlite3.connect(self.path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                SELECT s.*, COUNT(l.id) AS levels, MAX(l.frame_p95_ms) AS worst_p95_ms,
+                       MAX(l.peak_enemies) AS peak_enemies
+                FROM telemetry_sessions s LEFT JOIN telemetry_levels l ON l.session_id = s.id
+                GROUP BY s.id ORDER BY s.id DESC LIMIT ?
+            """, (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def levels(self, session_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return level summaries, optionally of one session only.
+
+        Args:
+            session_id (Optional[int]): Session to filter by. Defaults to all sessions.
+
+        Returns:
+            List[Dict[str, Any]]: Level rows in the order they were recorded.
+        """
+        with sqlite3.connect(self.path) as conn:
+            conn.row_factory = sqlite3.Row
+            if session_id is None:
+                rows = conn.execute("SELECT * FROM telemetry_levels ORDER BY id").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM telemetry_levels WHERE session_id = ? ORDER BY id", (session_id,)
+                ).fetchall()
+        return [dict(row) for row in rows]
+
+    def histogram(self, level_id: int) -> List[Tuple[float, int]]:
+        """
+        Return the frame-time histogram of one level.
+
+        Args:
+            level_id (int): Level row id.
+
+        Returns:
+            List[Tuple[float, int]]: (bucket lower edge in ms, frame count), ascending.
+        """
+        with sqlite3.connect(self.path) as conn:
+            return conn.execute(
+                "SELECT bucket_ms, frames FROM telemetry_frame_histogram WHERE level_id = ? ORDER BY bucket_ms",
+                (level_id,),
+            ).fetchall()
@@ -1,7 +1,8 @@
 import pygame
 from typing import Tuple
 from src.models.projectile import create_projectile
-from src.models.settings import WEAPON_SPRITES_DIR
+from src.models.settings import WEAPON_DAMAGE, WEAPON_SPRITES_DIR
+from src.models.sprite_cache import SpriteCache
 from src.controllers.audio_controller import AudioManager
 
 
@@ -14,7 +15,7 @@ class Weapon:
         damage (int): Damage dealt per shot.
         cooldown (int): Cooldown time in milliseconds.
         projectile_type (str): Type of projectile this weapon fires.
-        icon (pygame.Surface): Weapon icon image.
+        icon (pygame.Surface): Weapon icon image, shared by all weapons of the type.
     """
 
     def __init__(self, name: str, damage: int, cooldown: int, projectile_type: str) -> None:
@@ -22,7 +23,7 @@ class Weapon:
         self.damage = damage
         self.cooldown = cooldown  # cooldown in milliseconds
         self.projectile_type = projectile_type
-        self.icon = pygame.image.load(f"{WEAPON_SPRITES_DIR}/{name.lower()}_icon.png").convert_alpha()
+        self.icon = SpriteCache.load_image(f"{WEAPON_SPRITES_DIR}/{name.lower()}_icon.png")
 
     def fire(self, start_pos: Tuple[int, int], target_pos: Tuple[int, int], projectiles_group: pygame.sprite.Group) -> None:
         """
@@ -33,7 +34,7 @@ class Weapon:
             target_pos (Tuple[int, int]): Target position to aim at.
             projectiles_group (pygame.sprite.Group): Group to which the new projectile will be added.
         """
-        projectile = create_projectile(self.name, start_pos, target_pos)
+        projectile = create_projectile(self.name, start_pos, target_pos, self.damage)
         if projectile:
             projectiles_group.add(projectile)
             AudioManager.play_weapon_sfx(self.name)
@@ -41,12 +42,12 @@ class Weapon:
 
 class Pistol(Weapon):
     def __init__(self) -> None:
-        super().__init__(name="Pistol", damage=1, cooldown=400, projectile_type="Bullet")
+        super().__init__(name="Pistol", damage=WEAPON_DAMAGE["Pistol"], cooldown=400, projectile_type="Bullet")
 
 
 class Rifle(Weapon):
     def __init__(self) -> None:
-        super().__init__(name="Rifle", damage=3, cooldown=700, projectile_type="RifleBullet")
+        super().__init__(name="Rifle", damage=WEAPON_DAMAGE["Rifle"], cooldown=700, projectile_type="RifleBullet")
 
 
 class AssaultRifle(Weapon):
@@ -55,7 +56,7 @@ class AssaultRifle(Weapon):
     """
 
     def __init__(self) -> None:
-        super().__init__(name="AssaultRifle", damage=1, cooldown=150, projectile_type="Bullet")
+        super().__init__(name="AssaultRifle", damage=WEAPON_DAMAGE["AssaultRifle"], cooldown=150, projectile_type="Bullet")
         self.shots_per_burst = 3
 
     def fire(self, start_pos: Tuple[int, int], target_pos: Tuple[int, int], projectiles_group: pygame.sprite.Group) -> None:
@@ -68,7 +69,7 @@ class AssaultRifle(Weapon):
             projectiles_group (pygame.sprite.Group): Group to which the new projectiles will be added.
         """
         for i in range(self.shots_per_burst):
-            projectile = create_projectile(self.name, start_pos, target_pos)
+            projectile = create_projectile(self.name, start_pos, target_pos, self.damage)
             if projectile:
                 # Slight positional offset to simulate spread
                 projectile.rect.x += i * 2
@@ -79,9 +80,9 @@ class AssaultRifle(Weapon):
 
 class PlasmaRifle(Weapon):
     def __init__(self) -> None:
-        super().__init__(name="PlasmaRifle", damage=4, cooldown=600, projectile_type="PlasmaBolt")
+        super().__init__(name="PlasmaRifle", damage=WEAPON_DAMAGE["PlasmaRifle"], cooldown=600, projectile_type="PlasmaBolt")
 
 
 class GrenadeLauncher(Weapon):
     def __init__(self) -> None:
-        super().__init__(name="GrenadeLauncher", damage=5, cooldown=1000, projectile_type="Grenade")
+        super().__init__(name="GrenadeLauncher", damage=WEAPON_DAMAGE["GrenadeLauncher"], cooldown=1000, projectile_type="Grenade")
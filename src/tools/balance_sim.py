@@ -0,0 +1,280 @@
+"""
+Headless balance simulator: many independent bot runs on a process pool.
+
+Every run plays LevelManager/WaveManager with a scripted bot at a fixed tick
+rate, so results depend only on the seed and the parameters. Runs are spread
+over one worker process per core and aggregated per parameter set and level.
+
+Swept parameters are passed to each run's LevelManager and Player; nothing
+global is changed. Levels 1-3 have no regular enemies, only the boss, so the
+wave parameters (ENEMY_SCALE_FACTOR, WAVES_PER_LEVEL, ENEMY_SPAWN_INTERVAL)
+only affect level 4 and later: sweeping them with --levels below 4 is
+rejected, levels 1-3 report the same results for every value, and the tool
+exits with status 1 if no run got as far as level 4.
+
+Usage:
+    python -m src.tools.balance_sim --runs 64 --levels 6 \\
+        --grid ENEMY_SCALE_FACTOR=1.0,1.5,2.0 --grid WAVES_PER_LEVEL=3,5 \\
+        --grid WEAPON_DAMAGE.Pistol=1,2 [--processes N] [--json results.json]
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+from src.models.config import add_config_arguments, parse_and_configure, seed_argument
+from src.tools.headless import init_headless
+from src.tools.replay import percentile
+
+# Grid parameter -> WaveManager keyword argument
+WAVE_PARAMETERS = {
+    "ENEMY_SCALE_FACTOR": "enemy_scale_factor",
+    "WAVES_PER_LEVEL": "waves_per_level",
+    "ENEMY_SPAWN_INTERVAL": "spawn_interval",
+}
+# First level with regular enemy waves (calculate_enemy_count is 0 before it)
+FIRST_WAVE_LEVEL = 4
+
+
+def parse_grid(specs: List[str]) -> List[Dict[str, float]]:
+    """
+    Expand `NAME=v1,v2,...` specs into the cartesian product of parameter sets.
+
+    Args:
+        specs (List[str]): Grid specs from the command line.
+
+    Returns:
+        List[Dict[str, float]]: One dict per parameter combination.
+    """
+    names, values = [], []
+    for spec in specs:
+        name, _, raw = spec.partition("=")
+        if not raw or (name not in WAVE_PARAMETERS and not name.startswith("WEAPON_DAMAGE.")):
+            raise argparse.ArgumentTypeError(f"bad grid spec: {spec!r}")
+        names.append(name)
+        values.append([float(v) for v in raw.split(",")])
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def split_params(params: Dict[str, float]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Split a parameter set into WaveManager keyword arguments and weapon damage overrides.
+
+    Args:
+        params (Dict[str, float]): Parameter name to value.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, int]]: Wave parameters and damage by weapon name.
+    """
+    wave_params: Dict[str, Any] = {}
+    weapon_damage: Dict[str, int] = {}
+    for name, value in params.items():
+        if name.startswith("WEAPON_DAMAGE."):
+            weapon_damage[name.split(".", 1)[1]] = int(value)
+        elif name == "WAVES_PER_LEVEL":
+            wave_params[WAVE_PARAMETERS[name]] = int(value)
+        else:
+            wave_params[WAVE_PARAMETERS[name]] = value
+    return wave_params, weapon_damage
+
+
+def init_worker(overrides: Dict[str, Any]) -> None:
+    """
+    Pool initializer: configure the settings like the parent process, then pygame.
+
+    Args:
+        overrides (Dict[str, Any]): The parent's applied CONFIG_OVERRIDES.
+    """
+    from src.models import settings
+
+    vars(settings).update(overrides)
+    settings.CONFIG_OVERRIDES = overrides
+    init_headless()
+
+
+def simulate_run(task: Tuple[Dict[str, float], int, int, float]) -> Dict[str, Any]:
+    """
+    Play one run with the bot until it dies, times out or finishes max_levels.
+
+    Args:
+        task (tuple): (params, seed, max_levels, level_timeout seconds).
+
+    Returns:
+        Dict[str, Any]: 'params', 'seed' and per-level metric dicts in 'levels'.
+    """
+    params, seed, max_levels, level_timeout = task
+    wave_params, weapon_damage = split_params(params)
+
+    from src.controllers.gameplay import update_gameplay
+    from src.controllers.input_handler import InputHandler
+    from src.controllers.level_manager import LevelManager
+    from src.models.player import Player
+    from src.models.settings import FPS
+    from src.tools.bot import BotPlayer
+
+    level_manager = LevelManager(seed=seed, wave_params=wave_params)
+    level_manager.start_level(1)
+    player = Player(pos=(400, 300), weapon_damage=weapon_damage)
+    player.set_collision_mask(level_manager.get_collision_mask())
+    input_handler = InputHandler()
+    bot = BotPlayer()
+
+    dt_ms = 1000 // FPS
+    game_time = 0
+    levels: List[Dict[str, Any]] = []
+
+    for level in range(1, max_levels + 1):
+        level_start = game_time
+        health_start = player.health
+        peak_enemies = peak_projectiles = peak_hostile = 0
+        cleared = False
+
+        while game_time - level_start < level_timeout * 1000:
+            bot.control(input_handler, player, level_manager)
+            game_time += dt_ms
+            update_gameplay(player, level_manager, input_handler, dt_ms / 1000, game_time)
+
+            peak_enemies = max(peak_enemies, len(level_manager.enemy_group) + len(level_manager.boss_group))
+            peak_projectiles = max(peak_projectiles, len(level_manager.projectiles))
+            peak_hostile = max(peak_hostile, len(level_manager.enemy_fire.group))
+            if player.health <= 0:
+                break
+            if level_manager.current_level != level:
+                player.set_collision_mask(level_manager.get_collision_mask())
+                cleared = True
+                break
+
+        levels.append({
+            'level': level,
+            'cleared': cleared,
+            'died': player.health <= 0,
+            'time_to_clear': (game_time - level_start) / 1000 if cleared else None,
+            'damage_taken': health_start - player.health,
+            'peak_enemies': peak_enemies,
+            'peak_projectiles': peak_projectiles,
+            'peak_hostile': peak_hostile,
+        })
+        if not cleared:
+            break
+
+    return {'params': params, 'seed': seed, 'levels': levels}
+
+
+def aggregate(results: List[Dict[str, Any]]) -> Dict[Tuple, Dict[int, Dict[str, float]]]:
+    """
+    Aggregate run results per parameter set and level.
+
+    Args:
+        results (List[Dict[str, Any]]): Output of simulate_run.
+
+    Returns:
+        Dict[Tuple, Dict[int, Dict[str, float]]]: Sorted parameter items -> level -> statistics.
+    """
+    grouped: Dict[Tuple, Dict[int, List[Dict[str, Any]]]] = {}
+    for result in results:
+        key = tuple(sorted(result['params'].items()))
+        for record in result['levels']:
+            grouped.setdefault(key, {}).setdefault(record['level'], []).append(record)
+
+    report: Dict[Tuple, Dict[int, Dict[str, float]]] = {}
+    for key, per_level in grouped.items():
+        report[key] = {}
+        for level, records in sorted(per_level.items()):
+            times = [r['time_to_clear'] for r in records if r['cleared']]
+            damage = [r['damage_taken'] for r in records]
+            report[key][level] = {
+                'runs': len(records),
+                'clear_rate': len(times) / len(records),
+                'deaths': sum(r['died'] for r in records),
+                'ttc_mean': sum(times) / len(times) if times else 0.0,
+                'ttc_p50': percentile(times, 50),
+                'ttc_p95': percentile(times, 95),
+                'damage_mean': sum(damage) / len(damage),
+                'peak_enemies': max(r['peak_enemies'] for r in records),
+                'peak_projectiles': max(r['peak_projectiles'] for r in records),
+                'peak_hostile': max(r['peak_hostile'] for r in records),
+            }
+    return report
+
+
+def format_report(report: Dict[Tuple, Dict[int, Dict[str, float]]]) -> str:
+    """
+    Format the aggregated report as one table per parameter set.
+
+    Args:
+        report (Dict[Tuple, Dict[int, Dict[str, float]]]): Output of aggregate().
+
+    Returns:
+        str: Printable report.
+    """
+    lines = []
+    for key, per_level in report.items():
+        lines.append("params: " + (", ".join(f"{name}={value:g}" for name, value in key) or "defaults"))
+        lines.append(f"{'level':>5} {'runs':>5} {'clear':>6} {'deaths':>6} {'ttc mean':>9} "
+                     f"{'ttc p50':>8} {'ttc p95':>8} {'damage':>7} {'peak en':>8} {'peak proj':>9} {'peak hostile':>12}")
+        for level, s in per_level.items():
+            lines.append(f"{level:5d} {s['runs']:5d} {s['clear_rate']:6.0%} {s['deaths']:6d} "
+                         f"{s['ttc_mean']:9.1f} {s['ttc_p50']:8.1f} {s['ttc_p95']:8.1f} "
+                         f"{s['damage_mean']:7.1f} {s['peak_enemies']:8d} {s['peak_projectiles']:9d} {s['peak_hostile']:12d}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate bot runs to tune game balance.")
+    parser.add_argument("--runs", type=int, default=16, help="runs per parameter set")
+    parser.add_argument("--levels", type=int, default=5, help="maximum levels per run")
+    parser.add_argument("--level-timeout", type=float, default=300.0, help="game seconds before a level counts as failed")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2",
+                        help="parameter values to sweep (ENEMY_SCALE_FACTOR, WAVES_PER_LEVEL, "
+                             "ENEMY_SPAWN_INTERVAL, WEAPON_DAMAGE.<weapon>)")
+    parser.add_argument("--seed", type=seed_argument, default=0, help="seed of the first run")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--json", help="also write raw per-run results to this file")
+    add_config_arguments(parser)
+    args = parse_and_configure(parser, argv)
+
+    try:
+        grid = parse_grid(args.grid)
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        parser.error(str(e))
+    if args.seed + args.runs > 2 ** 32:
+        parser.error(f"--seed {args.seed} leaves no room for {args.runs} consecutive run seeds")
+    swept = sorted({name for params in grid for name in params if name in WAVE_PARAMETERS})
+    if swept and args.levels < FIRST_WAVE_LEVEL:
+        parser.error(f"{', '.join(swept)} only affect level {FIRST_WAVE_LEVEL} and later "
+                     f"(levels 1-3 are boss-only); use --levels {FIRST_WAVE_LEVEL} or more")
+
+    # The same seeds for every parameter set, so sets are compared on identical runs
+    tasks = [(params, args.seed + run, args.levels, args.level_timeout)
+             for params in grid for run in range(args.runs)]
+
+    start = time.perf_counter()
+    from src.models.settings import CONFIG_OVERRIDES
+    pool = multiprocessing.Pool(processes=args.processes, initializer=init_worker, initargs=(CONFIG_OVERRIDES,))
+    results = list(pool.imap_unordered(simulate_run, tasks, chunksize=1))
+    # SDL handles SIGTERM in the workers, so Pool.terminate() would hang; let them exit
+    pool.close()
+    pool.join()
+    elapsed = time.perf_counter() - start
+
+    print(format_report(aggregate(results)))
+    print(f"{len(tasks)} runs on {args.processes} processes in {elapsed:.1f}s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    reached = max((record['level'] for result in results for record in result['levels']), default=0)
+    if swept and reached < FIRST_WAVE_LEVEL:
+        print(f"warning: no run reached level {FIRST_WAVE_LEVEL}, so the {', '.join(swept)} sweep "
+              f"compared nothing (furthest level: {reached})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
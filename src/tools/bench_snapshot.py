@@ -0,0 +1,88 @@
+"""
+Throughput benchmark and round-trip check for world snapshots.
+
+Usage:
+    python -m src.tools.bench_snapshot [--enemies N] [--projectiles N] [--iterations N]
+"""
+import argparse
+import random
+import sys
+import time
+from src.models.config import add_config_arguments, parse_and_configure
+from src.tools.headless import init_headless
+
+
+def build_world(enemy_count: int, projectile_count: int):
+    """
+    Build a player and a level manager populated with entities of every type.
+
+    Args:
+        enemy_count (int): Number of regular enemies to add.
+        projectile_count (int): Number of projectiles to add.
+
+    Returns:
+        tuple: (player, level_manager)
+    """
+    from src.controllers.level_manager import LevelManager
+    from src.models.player import Player
+    from src.models.snapshot import ENEMY_TYPES, PROJECTILE_TYPES
+
+    rng = random.Random(0)
+    level_manager = LevelManager(seed=0)
+    level_manager.start_level(1)
+    player = Player(pos=(640, 360))
+
+    regular = [cls for cls in ENEMY_TYPES if not cls.__name__.startswith("Boss")]
+    for _ in range(enemy_count):
+        level_manager.wave_manager.track(rng.choice(regular)((rng.uniform(0, 1280), rng.uniform(0, 720))))
+    level_manager.boss_group.add(ENEMY_TYPES[-1]((640, 100)))
+
+    for _ in range(projectile_count):
+        pos = (rng.uniform(0, 1280), rng.uniform(0, 720))
+        target = (rng.uniform(0, 1280), rng.uniform(0, 720))
+        level_manager.projectiles.add(rng.choice(PROJECTILE_TYPES)(pos, target))
+
+    return player, level_manager
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark world snapshot encoding and decoding.")
+    parser.add_argument("--enemies", type=int, default=200)
+    parser.add_argument("--projectiles", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=2000)
+    add_config_arguments(parser)
+    args = parse_and_configure(parser, argv)
+
+    init_headless()
+    from src.models.snapshot import encode_world, decode_world, restore_world
+
+    player, level_manager = build_world(args.enemies, args.projectiles)
+
+    # Round trip: encode -> decode -> restore -> encode must be byte-identical
+    data = encode_world(player, level_manager)
+    restore_world(decode_world(data), player, level_manager)
+    if encode_world(player, level_manager) != data:
+        print("Round-trip mismatch", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        encode_world(player, level_manager)
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        decode_world(data)
+    decode_time = time.perf_counter() - start
+
+    print(f"snapshot size: {len(data)} bytes "
+          f"({args.enemies} enemies, {args.projectiles} projectiles)")
+    print(f"encode: {encode_time / args.iterations * 1e6:.1f} us/snapshot "
+          f"({args.iterations / encode_time:.0f}/s)")
+    print(f"decode: {decode_time / args.iterations * 1e6:.1f} us/snapshot "
+          f"({args.iterations / decode_time:.0f}/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import math
+import pygame
+from typing import Any
+
+# The eight movement directions (and standing still) the bot chooses from
+DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+# Step (px) of the wall check along a direction
+WALL_STEP = 8
+
+
+class BotPlayer:
+    """
+    Scripted player for headless runs: aims at the nearest enemy or boss,
+    holds the fire button while any target is alive, and moves to dodge.
+
+    Every tick the bot adds up where it would like to go: sideways out of the
+    path of hostile bullets about to pass close by, away from enemies that
+    get too near, and around its target so it is never a still target. It
+    then takes the one of the eight input directions closest to that wish
+    that does not run into a wall.
+
+    Drives the game only through InputHandler.apply_state, so it exercises
+    the same gameplay path as a human player.
+
+    Attributes:
+        DANGER_RADIUS (float): Bullets passing closer than this (px) are dodged.
+        DANGER_TIME (float): How far ahead bullet paths are checked (seconds).
+        KEEP_DISTANCE (float): Enemies closer than this (px) are backed away from.
+        THREAT_DISTANCE (float): Regular enemies closer than this (px) are shot before the boss.
+        WALL_LOOKAHEAD (float): Distance (px) a direction must be free of walls.
+        WALL_DISTANCE (float): Walls closer than this (px) are steered away from.
+        orbit (int): Direction of the circling move around the target, 1 or -1.
+        movement (tuple[int, int]): Movement chosen on the previous tick.
+    """
+
+    DANGER_RADIUS: float = 60.0
+    DANGER_TIME: float = 1.0
+    KEEP_DISTANCE: float = 300.0
+    THREAT_DISTANCE: float = 250.0
+    WALL_LOOKAHEAD: float = 40.0
+    WALL_DISTANCE: float = 120.0
+
+    def __init__(self) -> None:
+        self.orbit: int = 1
+        self.movement: tuple[int, int] = (0, 0)
+
+    def control(self, input_handler: Any, player: Any, level_manager: Any) -> None:
+        """
+        Set this tick's input state.
+
+        Args:
+            input_handler (InputHandler): Handler to write the bot's input into.
+            player (Player): The controlled player.
+            level_manager (LevelManager): Source of enemy, boss and bullet positions.
+        """
+        pos = pygame.Vector2(player.rect.center)
+        nearest = None
+        nearest_dist = 0.0
+        wish = pygame.Vector2()
+        for group in (level_manager.enemy_group, level_manager.boss_group):
+            for enemy in group:
+                offset = pos - enemy.pos
+                dist = offset.length()
+                if group is level_manager.enemy_group and (nearest is None or dist < nearest_dist):
+                    nearest, nearest_dist = enemy, dist
+                if 0 < dist < self.KEEP_DISTANCE:
+                    wish += offset / dist * (self.KEEP_DISTANCE - dist) / self.KEEP_DISTANCE * 2
+
+        # Minions only distract from the boss until they come close
+        target = nearest
+        if level_manager.boss_group and (nearest is None or nearest_dist > self.THREAT_DISTANCE):
+            target = next(iter(level_manager.boss_group))
+
+        for bullet in level_manager.enemy_fire.group:
+            speed_sq = bullet.velocity.length_squared()
+            if speed_sq == 0:
+                continue
+            # Time and point of the bullet's closest approach; a bullet that
+            # already passed is closest now, and still dangerous while near
+            t = max(0.0, (pos - bullet.pos).dot(bullet.velocity) / speed_sq)
+            if t > self.DANGER_TIME:
+                continue
+            miss = pos - (bullet.pos + bullet.velocity * t)
+            miss_dist = miss.length()
+            if miss_dist >= self.DANGER_RADIUS:
+                continue
+            if miss_dist < 1:
+                miss = bullet.velocity.rotate(90 * self.orbit)
+            weight = (self.DANGER_RADIUS - miss_dist) / self.DANGER_RADIUS / (t + 0.25)
+            wish += miss.normalize() * weight * 4
+
+        # Stay off the walls, where enemies and bullets corner the bot
+        for dx, dy in DIRECTIONS:
+            if (dx or dy) and not self.path_is_free(player, dx, dy, self.WALL_DISTANCE):
+                wish -= pygame.Vector2(dx, dy).normalize() * 0.5
+
+        # Keep going the same way unless there is a reason to turn
+        wish += pygame.Vector2(self.movement) * 0.3
+
+        if target is not None:
+            around = pos - target.pos
+            if around.length_squared():
+                wish += around.normalize().rotate(90 * self.orbit) * 0.5
+
+        movement = self.choose_direction(wish, player)
+        self.movement = movement
+        if movement == (0, 0) and wish.length_squared():
+            # Cornered while circling: go round the other way
+            self.orbit = -self.orbit
+
+        if target is None:
+            input_handler.apply_state(movement, input_handler.mouse_pos, False)
+        else:
+            input_handler.apply_state(movement, (int(target.pos.x), int(target.pos.y)), True)
+
+    def choose_direction(self, wish: pygame.Vector2, player: Any) -> tuple[int, int]:
+        """
+        Pick the input direction closest to the wished move that is free of walls.
+
+        Args:
+            wish (pygame.Vector2): Wished move; its length does not matter.
+            player (Player): The controlled player, for map collision checks.
+
+        Returns:
+            tuple[int, int]: Movement vector with components -1, 0 or 1.
+        """
+        if wish.length_squared() < 1e-6:
+            return 0, 0
+        best, best_score = (0, 0), 0.0
+        for dx, dy in DIRECTIONS:
+            if dx == 0 and dy == 0:
+                continue
+            score = (wish.x * dx + wish.y * dy) / math.hypot(dx, dy)
+            if score <= best_score:
+                continue
+            if self.path_is_free(player, dx, dy, self.WALL_LOOKAHEAD):
+                best, best_score = (dx, dy), score
+        return best
+
+    def path_is_free(self, player: Any, dx: int, dy: int, distance: float) -> bool:
+        """
+        Check the next pixels in a direction for walls.
+
+        The path is checked in small steps, so thin walls are not jumped over.
+
+        Args:
+            player (Player): The controlled player.
+            dx (int): Horizontal direction, -1, 0 or 1.
+            dy (int): Vertical direction, -1, 0 or 1.
+            distance (float): How far to check (px).
+
+        Returns:
+            bool: True if the player can move that far in that direction.
+        """
+        for step in range(WALL_STEP, int(distance) + 1, WALL_STEP):
+            if player.collides_with_map(player.rect.move(dx * step, dy * step)):
+                return False
+        return True
@@ -0,0 +1,27 @@
+import os
+import pygame
+
+
+def init_headless(windowed: bool = False) -> pygame.Surface:
+    """
+    Initialize pygame for tools that run the game logic without a real window.
+
+    Sprites load their images with convert_alpha(), which needs a display mode,
+    so a tiny display is created on SDL's dummy video driver. Audio goes to the
+    dummy driver as well, so sound effects can be loaded and played silently.
+
+    Args:
+        windowed (bool): Open a real window at the configured size instead.
+
+    Returns:
+        pygame.Surface: The display surface.
+    """
+    from src.models.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    if not windowed:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    if windowed:
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return pygame.display.set_mode((1, 1))
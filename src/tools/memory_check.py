@@ -0,0 +1,158 @@
+"""
+Memory-growth check over a multi-level headless run.
+
+The bot plays LevelManager through several levels at a fixed tick rate (it
+cannot die, so the run always reaches the last level). Every --check-every
+game seconds the run collects garbage and checks that each live Enemy
+instance is still accounted for by the level: in the enemy or boss group, or
+in the wave's spawn queue. Killed enemies that are still referenced from
+somewhere are reported as leaked. At every level start a LeakDetector logs
+the traced heap, live Enemy/Projectile/Surface/Mask counts and the
+allocation sites that grew.
+
+Usage:
+    python -m src.tools.memory_check [--levels 6] [--seed 0] [--max-growth-kb 1024] [--check-every 1.0]
+
+Exits with status 1 if an enemy leaked, a level was not cleared, or the
+leak detector's growth limits (LEAK_* settings) were exceeded.
+"""
+import argparse
+import gc
+import sys
+from typing import Any, Dict, List
+from src.models.config import add_config_arguments, parse_and_configure, seed_argument
+from src.tools.headless import init_headless
+
+
+def count_enemies(level_manager: Any) -> Dict[str, int]:
+    """
+    Count live Enemy instances and those the level still accounts for.
+
+    Args:
+        level_manager (LevelManager): Level manager of the run.
+
+    Returns:
+        Dict[str, int]: 'live', 'accounted' and 'leaked' enemy counts.
+    """
+    from src.models.enemy import Enemy
+
+    gc.collect()
+    live = sum(1 for obj in gc.get_objects() if isinstance(obj, Enemy))
+    accounted = level_manager.held_instances()["Enemy"]
+    return {'live': live, 'accounted': accounted, 'leaked': live - accounted}
+
+
+def run(levels: int, seed: int, level_timeout: float, check_every: float, leak_detector: Any) -> List[Dict[str, Any]]:
+    """
+    Play `levels` levels with the bot, checking for leaked enemies as it goes.
+
+    Args:
+        levels (int): Levels to clear.
+        seed (int): Session seed.
+        level_timeout (float): Game seconds before a level counts as stuck.
+        check_every (float): Game seconds between leak checks.
+        leak_detector (LeakDetector): Takes a checkpoint at every level start.
+
+    Returns:
+        List[Dict[str, Any]]: One result per level played: 'level', 'cleared',
+            'game_time' at its end and 'max_leaked', the worst leak seen during it.
+    """
+    from src.controllers.gameplay import update_gameplay
+    from src.controllers.input_handler import InputHandler
+    from src.controllers.level_manager import LevelManager
+    from src.models.player import Player
+    from src.models.settings import FPS
+    from src.tools.bot import BotPlayer
+
+    level_manager = LevelManager(seed=seed, leak_detector=leak_detector)
+    level_manager.start_level(1)
+    player = Player(pos=(400, 300))
+    player.health = 10 ** 9
+    player.set_collision_mask(level_manager.get_collision_mask())
+    input_handler = InputHandler()
+    bot = BotPlayer()
+
+    dt_ms = 1000 // FPS
+    check_ticks = max(1, round(check_every * 1000 / dt_ms))
+    game_time = 0
+    results: List[Dict[str, Any]] = []
+
+    for _ in range(levels):
+        level = level_manager.current_level
+        level_start = game_time
+        tick = 0
+        max_leaked = 0
+        while level_manager.current_level == level and game_time - level_start < level_timeout * 1000:
+            bot.control(input_handler, player, level_manager)
+            game_time += dt_ms
+            update_gameplay(player, level_manager, input_handler, dt_ms / 1000, game_time)
+            tick += 1
+            if tick % check_ticks == 0:
+                max_leaked = max(max_leaked, count_enemies(level_manager)['leaked'])
+        cleared = level_manager.current_level != level
+        player.set_collision_mask(level_manager.get_collision_mask())
+        results.append({'level': level, 'cleared': cleared, 'game_time': game_time / 1000, 'max_leaked': max_leaked})
+        if not cleared:
+            break
+    # The detector checkpoints a level on its first update
+    level_manager.update(0.0)
+    return results
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """
+    Format the per-level results as a table.
+
+    Args:
+        results (List[Dict[str, Any]]): Output of run().
+
+    Returns:
+        str: Printable table.
+    """
+    lines = [f"{'level':>5} {'ended at s':>10} {'max leaked':>10}"]
+    for r in results:
+        note = "" if r['cleared'] else "  (timed out)"
+        lines.append(f"{r['level']:5d} {r['game_time']:10.1f} {r['max_leaked']:10d}{note}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check that a multi-level headless run does not leak memory.")
+    parser.add_argument("--levels", type=int, default=6, help="levels to play")
+    parser.add_argument("--seed", type=seed_argument, default=0)
+    parser.add_argument("--level-timeout", type=float, default=300.0, help="game seconds before a level counts as stuck")
+    parser.add_argument("--max-growth-kb", type=float,
+                        help="allowed traced heap growth since the baseline level (default LEAK_MAX_GROWTH_KB)")
+    parser.add_argument("--check-every", type=float, default=1.0, help="game seconds between leak checks")
+    add_config_arguments(parser)
+    args = parse_and_configure(parser, argv)
+
+    init_headless()
+    from src.controllers.leak_detector import LeakDetector
+    from src.models.settings import LEAK_TOP_DIFFS, LEAK_WARMUP_LEVELS, LEAK_MAX_GROWTH_KB, LEAK_MAX_INSTANCE_GROWTH
+
+    leak_detector = LeakDetector(
+        top=LEAK_TOP_DIFFS,
+        max_growth_kb=args.max_growth_kb if args.max_growth_kb is not None else LEAK_MAX_GROWTH_KB,
+        max_instance_growth=LEAK_MAX_INSTANCE_GROWTH,
+        warmup=LEAK_WARMUP_LEVELS,
+        log=sys.stdout,
+    )
+    results = run(args.levels, args.seed, args.level_timeout, args.check_every, leak_detector)
+    print(leak_detector.report())
+    print(format_results(results))
+    leak_detector.close()
+
+    failures = leak_detector.failures()
+    leaked = max(r['max_leaked'] for r in results)
+    if leaked > 0:
+        failures.append(f"up to {leaked} killed enemies still referenced during the run")
+    if not results[-1]['cleared']:
+        failures.append(f"level {results[-1]['level']} not cleared within {args.level_timeout:.0f} game seconds")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Replay a recorded input log and report frame times.
+
+Every New Game or Continue of the recorded run is a session; the replay
+restarts the level for each one and reports how it ended, so a death that
+comes earlier than in the recording shows the replay diverged.
+
+Record with `python main.py --record session.dsir`, then:
+    python -m src.tools.replay session.dsir [--windowed] [--realtime] [--profile]
+"""
+import argparse
+import sys
+import time
+from typing import List
+import pygame
+from src.models.config import add_config_arguments, parse_and_configure
+from src.tools.headless import init_headless
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Return the pct-th percentile of samples (nearest-rank).
+
+    Args:
+        samples (List[float]): Sample values, need not be sorted.
+        pct (float): Percentile in the range 0-100.
+
+    Returns:
+        float: Percentile value, or 0.0 for an empty list.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded input session.")
+    parser.add_argument("recording", help="file written by main.py --record")
+    parser.add_argument("--windowed", action="store_true", help="render into a real window")
+    parser.add_argument("--realtime", action="store_true", help="pace ticks at the recorded speed")
+    parser.add_argument("--profile", action="store_true", help="print per-section timings and AI LOD counters")
+    add_config_arguments(parser)
+    args = parse_and_configure(parser, argv)
+
+    screen = init_headless(windowed=args.windowed)
+    if not args.windowed:
+        from src.models.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from src.controllers.input_handler import InputHandler
+    from src.controllers.input_recorder import InputReplayer
+    from src.controllers.level_manager import LevelManager
+    from src.controllers.gameplay import update_gameplay
+    from src.controllers.frame_profiler import FrameProfiler
+    from src.models.player import Player
+    from src.views.game_view import GameView
+
+    replayer = InputReplayer.load(args.recording)
+    if not replayer.sessions:
+        print(f"{args.recording}: no recorded sessions", file=sys.stderr)
+        return 1
+    input_handler = InputHandler()
+    profiler = FrameProfiler(enabled=args.profile)
+    first = replayer.sessions[0]
+    level_manager = LevelManager(seed=first.seed, profiler=profiler)
+    level_manager.start_level(first.level)
+    player = Player(pos=(screen.get_width() // 2, screen.get_height() // 2))
+    died_at: List[int] = []  # game time of each death
+    player.on_death = lambda _player: died_at.append(game_time)
+    game_view = GameView(
+        screen=screen,
+        map=level_manager.get_map_surface(),
+        player=player,
+        enemies=level_manager.get_sprite_groups()["enemies"],
+        projectiles=level_manager.get_projectile_group(),
+        boss=level_manager.get_entities()["boss"],
+        enemy_projectiles=level_manager.get_enemy_projectile_group()
+    )
+
+    clock = pygame.time.Clock()
+    frame_times: List[float] = []
+    game_time = 0
+    played_ms = 0
+
+    while replayer.next_session() is not None:
+        # Every session restarts a level like New Game or Continue did, after a death or quit
+        session = replayer.session
+        if session is not first:
+            level_manager.seed = session.seed
+            level_manager.start_level(session.level)
+        session.start.apply(level_manager, player)
+        player.set_collision_mask(level_manager.get_collision_mask())
+        game_view.update_map_image(level_manager.get_map_surface())
+        game_time = session.start.game_time
+        deaths = len(died_at)
+
+        while not replayer.finished:
+            if args.windowed:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return 1
+
+            start = time.perf_counter()
+            dt_ms = replayer.apply_next(input_handler)
+            game_time += dt_ms
+            played_ms += dt_ms
+            with profiler.section("update"):
+                update_gameplay(player, level_manager, input_handler, dt_ms / 1000, game_time)
+
+            if game_view.map is not level_manager.get_map_surface():
+                # A new level was started by the level manager
+                game_view.update_map_image(level_manager.get_map_surface())
+                player.set_collision_mask(level_manager.get_collision_mask())
+            game_view.enemies = level_manager.get_sprite_groups()["enemies"]
+            game_view.projectiles = level_manager.get_projectile_group()
+            game_view.boss = level_manager.get_entities()["boss"]
+            with profiler.section("draw"):
+                game_view.draw()
+            profiler.end_frame()
+            if args.windowed:
+                pygame.display.flip()
+            frame_times.append((time.perf_counter() - start) * 1000)
+
+            if args.realtime:
+                clock.tick(1000 / dt_ms if dt_ms else 0)
+
+        # The game stops recording at a death, so one before the last tick means the replay diverged
+        ending = "died" if len(died_at) > deaths else "ended alive"
+        if len(died_at) > deaths and died_at[deaths] != game_time:
+            ending = f"died {(game_time - died_at[deaths]) / 1000:.1f}s before the recording ended (diverged)"
+        print(f"session {replayer.sessions.index(session) + 1}/{len(replayer.sessions)}: level {session.level} -> "
+              f"{level_manager.current_level}, {len(session.ticks)} ticks, {ending}")
+
+    pygame.quit()
+
+    print(f"ticks: {len(frame_times)}  game time: {played_ms / 1000:.1f}s")
+    if frame_times:
+        print(f"frame ms: mean {sum(frame_times) / len(frame_times):.2f}  "
+              f"p50 {percentile(frame_times, 50):.2f}  p95 {percentile(frame_times, 95):.2f}  "
+              f"p99 {percentile(frame_times, 99):.2f}  max {max(frame_times):.2f}")
+    print(f"final player: pos {player.rect.center}  health {player.health}")
+    if args.profile:
+        print(profiler.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""
+Soak test: play the campaign for a fixed wall-clock time and check that frame
+time and memory stay flat.
+
+The bot (which cannot die) plays levels 1..--levels through LevelManager's
+normal progression: cleared waves, boss, next level. It then restarts the
+cycle at level 1 and repeats until --duration seconds have passed. Levels
+are seeded per level number, so every cycle replays the same spawns. Each
+level's frame time is therefore compared with the same level in an earlier
+cycle, and the growing enemy counts of later levels do not show up as
+drift. Frames are updated and drawn into an off-screen surface unless
+--no-render is given.
+
+Every --sample-every seconds the frame time and the process RSS are
+sampled for the timeline (see --json). RSS is also recorded as each cycle
+starts, at the same point of the level loading, because loading a map
+swings RSS by several MB. Drift is the change along a least-squares fit,
+from the baseline cycle (the first complete one after --warmup) to the
+last one, so a single noisy cycle does not decide the result:
+- frame time: each level's mean frame time relative to the same level in
+  the baseline cycle, averaged over the levels;
+- RSS: the RSS at cycle start, over wall-clock time.
+
+Usage:
+    python -m src.tools.soak [--duration 600] [--levels 6] [--sample-every 5] \\
+        [--max-frame-drift-pct 10] [--max-rss-drift-mb 16] [--json soak.json]
+
+Exits with status 1 if a limit was exceeded or a level got stuck, and 2 if
+the run was too short to measure drift.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import pygame
+from src.models.config import add_config_arguments, parse_and_configure, seed_argument
+from src.tools.headless import init_headless
+from src.tools.replay import percentile
+
+
+def rss_mb() -> float:
+    """
+    Return the resident set size of this process in MiB.
+
+    Reads /proc on Linux and GetProcessMemoryInfo on Windows; elsewhere the
+    peak RSS from getrusage is the best available approximation.
+
+    Returns:
+        float: Resident memory in MiB.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage",
+                )
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize / 2 ** 20
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float]:
+    """
+    Least-squares line through the points.
+
+    Args:
+        xs (Sequence[float]): X values.
+        ys (Sequence[float]): Y values, same length as xs.
+
+    Returns:
+        Tuple[float, float]: (slope, intercept); a flat line through the mean if all xs are equal.
+    """
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if not var_x:
+        return 0.0, mean_y
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+    return slope, mean_y - slope * mean_x
+
+
+def soak(duration: float, levels: int, seed: int, sample_every: float, level_timeout: float,
+         render: bool) -> Dict[str, Any]:
+    """
+    Play level cycles with the bot until `duration` wall-clock seconds have passed.
+
+    Args:
+        duration (float): Wall-clock seconds to run.
+        levels (int): Levels per cycle.
+        seed (int): Session seed.
+        sample_every (float): Wall-clock seconds between samples.
+        level_timeout (float): Game seconds before a level counts as stuck.
+        render (bool): Draw every frame with GameView into an off-screen surface.
+
+    Returns:
+        Dict[str, Any]: 'samples' (t, cycle, level, frame mean/p95/max, rss_mb),
+            'cycles' (per cycle: start time, RSS at start, whether complete, per-level frame
+            count and total ms) and 'stuck' (the level that timed out, or None).
+    """
+    from src.controllers.gameplay import update_gameplay
+    from src.controllers.input_handler import InputHandler
+    from src.controllers.level_manager import LevelManager
+    from src.models.player import Player
+    from src.models.settings import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+    from src.tools.bot import BotPlayer
+    from src.views.game_view import GameView
+
+    level_manager = LevelManager(seed=seed)
+    level_manager.start_level(1)
+    start_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    player = Player(pos=start_pos)
+    player.health = 10 ** 9
+    player.set_collision_mask(level_manager.get_collision_mask())
+    input_handler = InputHandler()
+    bot = BotPlayer()
+    game_view: Optional[GameView] = None
+    if render:
+        game_view = GameView(
+            screen=pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(),
+            map=level_manager.get_map_surface(),
+            player=player,
+            enemies=level_manager.get_sprite_groups()["enemies"],
+            projectiles=level_manager.get_projectile_group(),
+            boss=level_manager.get_entities()["boss"],
+            enemy_projectiles=level_manager.get_enemy_projectile_group(),
+        )
+
+    dt_ms = 1000 // FPS
+    game_time = 0
+    samples: List[Dict[str, Any]] = []
+    cycles: List[Dict[str, Any]] = []
+    interval: List[float] = []  # frame times since the last sample
+    stuck: Optional[int] = None
+
+    started = time.perf_counter()
+    next_sample = started + sample_every
+    end = started + duration
+    cycle = 0
+    while stuck is None and time.perf_counter() < end:
+        if cycle:
+            # Same boss order and start position every cycle, so cycles replay the same levels
+            level_manager.boss_index = 0
+            level_manager.start_level(1)
+            player.move_to(start_pos)
+            player.set_collision_mask(level_manager.get_collision_mask())
+            # The bot keeps steering state; a fresh one plays the cycle the same way again
+            bot = BotPlayer()
+        cycle_stats: Dict[str, Any] = {'cycle': cycle, 'start': time.perf_counter() - started,
+                                       'rss_mb': rss_mb(), 'complete': False, 'levels': {}}
+        cycles.append(cycle_stats)
+
+        for level in range(1, levels + 1):
+            frames = 0
+            total = 0.0
+            level_start = game_time
+            while level_manager.current_level == level:
+                now = time.perf_counter()
+                if now >= end:
+                    break
+                if game_time - level_start >= level_timeout * 1000:
+                    stuck = level
+                    break
+                if now >= next_sample and interval:
+                    samples.append({
+                        't': now - started, 'cycle': cycle, 'level': level,
+                        'frame_mean_ms': sum(interval) / len(interval),
+                        'frame_p95_ms': percentile(interval, 95),
+                        'frame_max_ms': max(interval),
+                        'rss_mb': rss_mb(),
+                    })
+                    interval.clear()
+                    next_sample = now + sample_every
+
+                frame_start = time.perf_counter()
+                bot.control(input_handler, player, level_manager)
+                game_time += dt_ms
+                update_gameplay(player, level_manager, input_handler, dt_ms / 1000, game_time)
+                if game_view:
+                    if game_view.map is not level_manager.get_map_surface():
+                        game_view.update_map_image(level_manager.get_map_surface())
+                    game_view.enemies = level_manager.get_sprite_groups()["enemies"]
+                    game_view.projectiles = level_manager.get_projectile_group()
+                    game_view.boss = level_manager.get_entities()["boss"]
+                    game_view.draw()
+                frame_ms = (time.perf_counter() - frame_start) * 1000
+                interval.append(frame_ms)
+                frames += 1
+                total += frame_ms
+
+            if level_manager.current_level != level:
+                player.set_collision_mask(level_manager.get_collision_mask())
+                cycle_stats['levels'][level] = {'frames': frames, 'total_ms': total}
+            else:
+                break
+        else:
+            cycle_stats['complete'] = True
+        cycle += 1
+
+    return {'samples': samples, 'cycles': cycles, 'stuck': stuck}
+
+
+def analyze(result: Dict[str, Any], warmup: float) -> Dict[str, Any]:
+    """
+    Compute frame time and RSS drift statistics of a soak run.
+
+    The baseline is the first complete cycle that started after the warmup,
+    or the first complete cycle if none did. Drift is the rise of a
+    least-squares line over the cycles from the baseline to the last one.
+
+    Args:
+        result (Dict[str, Any]): Output of soak().
+        warmup (float): Seconds at the start that fill caches and are not used as the baseline.
+
+    Returns:
+        Dict[str, Any]: 'baseline_cycle', 'last_cycle', 'per_level' (level -> baseline and last
+            mean ms), 'frame_drift_pct', 'frame_trend_pct_per_cycle', 'rss_drift_mb' and
+            'rss_slope_mb_per_hour'; a statistic is None when the run is too short to measure it.
+    """
+    stats: Dict[str, Any] = {
+        'baseline_cycle': None, 'last_cycle': None, 'per_level': {},
+        'frame_drift_pct': None, 'frame_trend_pct_per_cycle': None,
+        'rss_drift_mb': None, 'rss_slope_mb_per_hour': None,
+    }
+
+    complete = [c for c in result['cycles'] if c['complete']]
+    if len(complete) < 2:
+        return stats
+    after_warmup = [c for c in complete[:-1] if c['start'] >= warmup]
+    baseline = after_warmup[0] if after_warmup else complete[0]
+    last = complete[-1]
+    stats['baseline_cycle'], stats['last_cycle'] = baseline['cycle'], last['cycle']
+
+    def mean(cycle: Dict[str, Any], level: int) -> float:
+        entry = cycle['levels'][level]
+        return entry['total_ms'] / entry['frames']
+
+    levels = sorted(baseline['levels'])
+    for level in levels:
+        stats['per_level'][level] = {'baseline_ms': mean(baseline, level), 'last_ms': mean(last, level)}
+    # Levels weigh equally, so a short boss-only level counts as much as a crowded one
+    measured = [c for c in complete if c['cycle'] >= baseline['cycle']]
+    ratios = [sum(mean(c, level) / mean(baseline, level) for level in levels) / len(levels) for c in measured]
+    slope, _ = linear_fit([c['cycle'] for c in measured], ratios)
+    stats['frame_trend_pct_per_cycle'] = slope * 100
+    stats['frame_drift_pct'] = slope * (last['cycle'] - baseline['cycle']) * 100
+
+    # Every started cycle has its RSS reading, including an unfinished last one
+    measured = [c for c in result['cycles'] if c['cycle'] >= baseline['cycle']]
+    if len(measured) >= 3:
+        slope, _ = linear_fit([c['start'] for c in measured], [c['rss_mb'] for c in measured])
+        stats['rss_slope_mb_per_hour'] = slope * 3600
+        stats['rss_drift_mb'] = slope * (measured[-1]['start'] - measured[0]['start'])
+    return stats
+
+
+def format_report(result: Dict[str, Any], stats: Dict[str, Any]) -> str:
+    """
+    Format the per-cycle summary and the drift statistics.
+
+    Args:
+        result (Dict[str, Any]): Output of soak().
+        stats (Dict[str, Any]): Output of analyze().
+
+    Returns:
+        str: Printable report.
+    """
+    lines = [f"{'cycle':>5} {'start s':>8} {'levels':>6} {'frames':>8} {'mean ms':>8} {'rss MB':>8}"]
+    for c in result['cycles']:
+        frames = sum(entry['frames'] for entry in c['levels'].values())
+        total = sum(entry['total_ms'] for entry in c['levels'].values())
+        note = " (baseline)" if c['cycle'] == stats['baseline_cycle'] else "" if c['complete'] else " (incomplete)"
+        lines.append(f"{c['cycle']:5d} {c['start']:8.0f} {len(c['levels']):6d} {frames:8d} "
+                     f"{total / frames if frames else 0:8.3f} {c['rss_mb']:8.1f}{note}")
+
+    if stats['frame_drift_pct'] is None:
+        lines.append("drift: not measured (needs two complete cycles)")
+        return "\n".join(lines)
+    lines.append(f"frame time, cycle {stats['last_cycle']} against baseline cycle {stats['baseline_cycle']}:")
+    for level, entry in stats['per_level'].items():
+        change = (entry['last_ms'] / entry['baseline_ms'] - 1) * 100
+        lines.append(f"  level {level:3d}: {entry['baseline_ms']:7.3f} -> {entry['last_ms']:7.3f} ms ({change:+5.1f}%)")
+    lines.append(f"frame time drift: {stats['frame_drift_pct']:+.1f}% "
+                 f"({stats['frame_trend_pct_per_cycle']:+.2f}% per cycle)")
+    if stats['rss_drift_mb'] is None:
+        lines.append("RSS drift: not measured (needs three cycles from the baseline)")
+    else:
+        lines.append(f"RSS drift: {stats['rss_drift_mb']:+.1f} MB ({stats['rss_slope_mb_per_hour']:+.1f} MB/hour)")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Soak test: check that frame time and memory stay flat over a long run.")
+    parser.add_argument("--duration", type=float, default=600.0, help="wall-clock seconds to run")
+    parser.add_argument("--levels", type=int, default=6, help="levels per cycle")
+    parser.add_argument("--seed", type=seed_argument, default=0)
+    parser.add_argument("--sample-every", type=float, default=5.0, help="wall-clock seconds between samples")
+    parser.add_argument("--warmup", type=float, default=30.0, help="seconds excluded from the RSS fit and the frame baseline")
+    parser.add_argument("--level-timeout", type=float, default=300.0, help="game seconds before a level counts as stuck")
+    parser.add_argument("--no-render", action="store_true", help="update only, without drawing frames")
+    parser.add_argument("--max-frame-drift-pct", type=float, default=10.0, help="allowed frame time drift in percent")
+    parser.add_argument("--max-rss-drift-mb", type=float, default=16.0, help="allowed RSS drift in MB")
+    parser.add_argument("--json", help="also write samples, cycles and statistics to this file")
+    add_config_arguments(parser)
+    args = parse_and_configure(parser, argv)
+
+    init_headless()
+    result = soak(args.duration, args.levels, args.seed, args.sample_every, args.level_timeout, not args.no_render)
+    stats = analyze(result, args.warmup)
+    print(format_report(result, stats))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**result, 'stats': stats}, f, indent=2)
+
+    failures = []
+    if result['stuck'] is not None:
+        failures.append(f"level {result['stuck']} not cleared within {args.level_timeout:.0f} game seconds")
+    if stats['frame_drift_pct'] is not None and stats['frame_drift_pct'] > args.max_frame_drift_pct:
+        failures.append(f"frame time drifted {stats['frame_drift_pct']:+.1f}% (limit {args.max_frame_drift_pct:g}%)")
+    if stats['rss_drift_mb'] is not None and stats['rss_drift_mb'] > args.max_rss_drift_mb:
+        failures.append(f"RSS drifted {stats['rss_drift_mb']:+.1f} MB (limit {args.max_rss_drift_mb:g} MB)")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if failures:
+        return 1
+    if stats['frame_drift_pct'] is None or stats['rss_drift_mb'] is None:
+        print("INCONCLUSIVE: run too short to measure drift; increase --duration", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
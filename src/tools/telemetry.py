@@ -0,0 +1,179 @@
+"""
+Query the per-level performance telemetry recorded by the game.
+
+Usage:
+    python -m src.tools.telemetry sessions [--limit 20]
+    python -m src.tools.telemetry levels [SESSION]
+    python -m src.tools.telemetry compare SESSION_A SESSION_B
+    python -m src.tools.telemetry histogram LEVEL_ID
+
+Sessions and levels are identified by the ids the listings print. Add
+--db PATH to read a telemetry database collected on another machine.
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+from src.models.config import add_config_arguments, parse_and_configure
+from src.models.telemetry import TelemetryStore
+
+# Level statistics compared between sessions: (column, label, higher is worse)
+COMPARED_COLUMNS = (
+    ("frame_p50_ms", "p50 ms", True),
+    ("frame_p95_ms", "p95 ms", True),
+    ("frame_p99_ms", "p99 ms", True),
+    ("work_p95_ms", "work p95", True),
+    ("load_ms", "load ms", True),
+    ("gc_max_pause_ms", "gc max ms", True),
+    ("peak_enemies", "peak en", False),
+    ("peak_enemy_projectiles", "peak hostile", False),
+)
+
+
+def format_sessions(sessions: List[Dict[str, Any]]) -> str:
+    """
+    Format the session listing.
+
+    Args:
+        sessions (List[Dict[str, Any]]): Output of TelemetryStore.sessions().
+
+    Returns:
+        str: Printable table.
+    """
+    lines = [f"{'id':>4} {'started':19} {'backend':8} {'screen':>9} {'fps':>4} {'levels':>6} "
+             f"{'worst p95':>9} {'peak en':>7}  platform"]
+    for s in sessions:
+        worst = s['worst_p95_ms']
+        lines.append(f"{s['id']:4d} {s['started_at']:19} {s['render_backend'] or '':8} "
+                     f"{s['screen_width']:>4}x{s['screen_height']:<4} {s['fps']:4d} {s['levels']:6d} "
+                     f"{worst if worst is not None else 0:9.1f} {s['peak_enemies'] or 0:7d}  {s['platform']}")
+        if s['config'] and s['config'] != "{}":
+            lines.append(f"{'':5}config: {s['config']}")
+    return "\n".join(lines)
+
+
+def format_levels(levels: List[Dict[str, Any]]) -> str:
+    """
+    Format level summaries as a table.
+
+    Args:
+        levels (List[Dict[str, Any]]): Output of TelemetryStore.levels().
+
+    Returns:
+        str: Printable table.
+    """
+    lines = [f"{'id':>5} {'sess':>4} {'level':>5} {'outcome':8} {'secs':>6} {'frames':>7} {'load ms':>8} "
+             f"{'mean':>6} {'p50':>6} {'p95':>6} {'p99':>6} {'max':>7} {'work p95':>8} "
+             f"{'peak en':>7} {'peak proj':>9} {'peak hostile':>12} {'scale':>5} {'gc':>4} {'gc ms':>7} {'gc max':>7}"]
+    for l in levels:
+        lines.append(f"{l['id']:5d} {l['session_id']:4d} {l['level']:5d} {l['outcome']:8} {l['duration_s']:6.0f} "
+                     f"{l['frames']:7d} {l['load_ms']:8.1f} {l['frame_mean_ms']:6.1f} {l['frame_p50_ms']:6.1f} "
+                     f"{l['frame_p95_ms']:6.1f} {l['frame_p99_ms']:6.1f} {l['frame_max_ms']:7.1f} {l['work_p95_ms']:8.1f} "
+                     f"{l['peak_enemies']:7d} {l['peak_projectiles']:9d} {l['peak_enemy_projectiles']:12d} "
+                     f"{l['min_render_scale']:5.2f} {l['gc_collections']:4d} {l['gc_pause_ms']:7.1f} {l['gc_max_pause_ms']:7.1f}")
+    return "\n".join(lines)
+
+
+def summarize_by_level(levels: List[Dict[str, Any]]) -> Dict[int, Dict[str, float]]:
+    """
+    Combine a session's level rows per level number: the worst value of each compared column.
+
+    Args:
+        levels (List[Dict[str, Any]]): Level rows of one session.
+
+    Returns:
+        Dict[int, Dict[str, float]]: Level number -> column -> worst value.
+    """
+    summary: Dict[int, Dict[str, float]] = {}
+    for row in levels:
+        per_level = summary.setdefault(row['level'], {})
+        for column, _, _ in COMPARED_COLUMNS:
+            per_level[column] = max(per_level.get(column, row[column]), row[column])
+    return dict(sorted(summary.items()))
+
+
+def format_comparison(a: Dict[int, Dict[str, float]], b: Dict[int, Dict[str, float]], id_a: int, id_b: int) -> str:
+    """
+    Format per-level values of two sessions side by side with the relative change.
+
+    Args:
+        a (Dict[int, Dict[str, float]]): summarize_by_level() of the baseline session.
+        b (Dict[int, Dict[str, float]]): summarize_by_level() of the session compared to it.
+        id_a (int): Baseline session id.
+        id_b (int): Compared session id.
+
+    Returns:
+        str: Printable table; changes of 10% or more for the worse are marked with '!'.
+    """
+    lines = [f"session {id_b} relative to session {id_a}"]
+    lines.append(f"{'level':>5} " + " ".join(f"{label:>22}" for _, label, _ in COMPARED_COLUMNS))
+    for level in sorted(set(a) | set(b)):
+        cells = []
+        for column, _, higher_is_worse in COMPARED_COLUMNS:
+            if level not in a or level not in b:
+                value = (b.get(level) or a.get(level))[column]
+                cells.append(f"{'only in ' + str(id_b if level in b else id_a):>13} {value:8.1f}")
+                continue
+            before, after = a[level][column], b[level][column]
+            change = (after - before) / before if before else 0.0
+            worse = change >= 0.1 if higher_is_worse else False
+            cells.append(f"{before:7.1f}->{after:7.1f} {change:+5.0%}{'!' if worse else ' '}")
+        lines.append(f"{level:5d} " + " ".join(f"{cell:>22}" for cell in cells))
+    return "\n".join(lines)
+
+
+def format_histogram(histogram: List[Any], width: int = 50) -> str:
+    """
+    Format a frame-time histogram as text bars.
+
+    Args:
+        histogram (List[Any]): Output of TelemetryStore.histogram().
+        width (int): Length of the longest bar.
+
+    Returns:
+        str: One line per non-empty bucket.
+    """
+    tallest = max((count for _, count in histogram), default=0) or 1
+    return "\n".join(f"{bucket:7.1f} ms {count:7d} {'#' * max(1, round(width * count / tallest))}"
+                     for bucket, count in histogram)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Query recorded performance telemetry.")
+    parser.add_argument("--db", help="telemetry database (default TELEMETRY_DB_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    sessions = commands.add_parser("sessions", help="list recent sessions")
+    sessions.add_argument("--limit", type=int, default=20)
+    levels = commands.add_parser("levels", help="per-level summaries")
+    levels.add_argument("session", type=int, nargs="?", help="only this session")
+    compare = commands.add_parser("compare", help="compare two sessions level by level")
+    compare.add_argument("session_a", type=int, help="baseline session")
+    compare.add_argument("session_b", type=int)
+    histogram = commands.add_parser("histogram", help="frame-time histogram of one level")
+    histogram.add_argument("level_id", type=int)
+    add_config_arguments(parser)
+    args = parse_and_configure(parser, argv)
+    if args.db is None:
+        from src.models.settings import TELEMETRY_DB_PATH
+        args.db = TELEMETRY_DB_PATH
+
+    if not os.path.exists(args.db):
+        parser.error(f"no telemetry database at {args.db}")
+    store = TelemetryStore(args.db)
+
+    if args.command == "sessions":
+        print(format_sessions(store.sessions(args.limit)))
+    elif args.command == "levels":
+        print(format_levels(store.levels(args.session)))
+    elif args.command == "compare":
+        a, b = store.levels(args.session_a), store.levels(args.session_b)
+        if not a or not b:
+            parser.error(f"session {args.session_a if not a else args.session_b} has no recorded levels")
+        print(format_comparison(summarize_by_level(a), summarize_by_level(b), args.session_a, args.session_b))
+    else:
+        print(format_histogram(store.histogram(args.level_id)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import pygame
+from typing import Callable, List
+from src.views.ui_elements import Button
+from src.models.settings import FONT_PATH, PAUSE_DIM_ALPHA
+
+
+class GameOverMenu:
+    """
+    Screen shown when the player dies, over the dimmed last gameplay frame.
+
+    Like the pause menu, the background is captured and dimmed once by open()
+    and then blitted opaquely every frame.
+
+    Attributes:
+        screen (pygame.Surface): Surface to draw the menu on.
+        bg (pygame.Surface): Pre-composed background: the frozen frame, dimmed.
+        on_new_game (Callable): Callback to start a new game.
+        on_quit_to_menu (Callable): Callback to quit to main menu.
+        buttons (List[Button]): List of buttons in the menu.
+    """
+
+    def __init__(self, screen: pygame.Surface, on_new_game: Callable, on_quit_to_menu: Callable) -> None:
+        self.screen = screen
+        self.bg = pygame.Surface(screen.get_size()).convert()
+        self.bg.fill((0, 0, 0))
+        self._shade = pygame.Surface(screen.get_size()).convert()
+        self._shade.fill((40, 0, 0))
+        self._shade.set_alpha(PAUSE_DIM_ALPHA)
+
+        self.on_new_game = on_new_game
+        self.on_quit_to_menu = on_quit_to_menu
+
+        center_x = screen.get_width() // 2
+        start_y = 320
+        gap = 70
+
+        self.buttons: List[Button] = [
+            Button("New Game", (center_x, start_y), self.on_new_game),
+            Button("Quit to Menu", (center_x, start_y + gap), self.on_quit_to_menu),
+        ]
+
+        self._title_font = pygame.font.Font(FONT_PATH, 48)
+        self._label_font = pygame.font.Font(FONT_PATH, 24)
+        self.title = self._title_font.render("Game Over", True, (255, 255, 255))
+        self.title_rect = self.title.get_rect(center=(center_x, 150))
+        self.level_label = self._label_font.render("", True, (255, 255, 255))
+        self.level_rect = self.level_label.get_rect(center=(center_x, 210))
+
+    def open(self, level: int) -> None:
+        """
+        Freeze the frame currently on the screen as the background and show the level reached.
+
+        Call once when the player dies, after the last gameplay frame was drawn.
+
+        Args:
+            level (int): Level the player died on.
+        """
+        self.bg.blit(self.screen, (0, 0))
+        self.bg.blit(self._shade, (0, 0))
+        self.level_label = self._label_font.render(f"Reached level {level}", True, (255, 255, 255))
+        self.level_rect = self.level_label.get_rect(center=(self.screen.get_width() // 2, 210))
+
+    def draw(self) -> None:
+        """
+        Draw the game over screen.
+        """
+        self.screen.blit(self.bg, (0, 0))
+        self.screen.blit(self.title, self.title_rect)
+        self.screen.blit(self.level_label, self.level_rect)
+        for button in self.buttons:
+            button.draw(self.screen)
+
+    def handle_events(self, events: List[pygame.event.Event]) -> None:
+        """
+        Handle button clicks.
+
+        Args:
+            events (List[pygame.event.Event]): List of pygame events to process.
+        """
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                for button in self.buttons:
+                    button.handle_event(event)
@@ -1,6 +1,15 @@
 import pygame
-from typing import Optional, List, Union
-from src.models.settings import FONT_PATH
+from typing import Dict, Optional, List, Union
+from src.models.settings import FONT_PATH, RENDER_Y_SORT
+from src.controllers.latency_tracker import LatencyTracker
+from src.controllers.resolution_scaler import ResolutionScaler
+from src.views.render_list import RenderList
+from src.views.hud import Hud
+from src.views.sdl2_backend import Sdl2Backend
+
+# Render list layers, drawn bottom to top
+LAYER_ACTORS = 0
+LAYER_PROJECTILES = 1
 
 
 class GameView:
@@ -13,14 +22,23 @@ class GameView:
         player (pygame.sprite.Sprite): Player object.
         enemies (List[pygame.sprite.Sprite]): List of enemy objects.
         projectiles (List[pygame.sprite.Sprite]): List of projectile objects.
+        enemy_projectiles (List[pygame.sprite.Sprite]): List of hostile projectile objects.
         boss (Optional[pygame.sprite.Sprite]): Boss object if present.
         font (pygame.font.Font): Font for rendering UI text.
-        boss_hp_bar_rect (pygame.Rect): Rectangle defining boss health bar position and size.
+        hud (Hud): Cached health, weapon and boss bar layer.
         camera_offset (pygame.Vector2): Offset for camera scrolling.
         screen_width (int): Width of the game screen.
         screen_height (int): Height of the game screen.
         map_width (int): Width of the level map.
         map_height (int): Height of the level map.
+        latency_tracker (Optional[LatencyTracker]): Source for the latency overlay.
+        show_latency (bool): Whether the latency overlay is drawn.
+        render_list (RenderList): Batches entity blits into one Surface.blits call per frame.
+        scaler (Optional[ResolutionScaler]): Chooses the world render scale; None renders at full resolution.
+        backend (Optional[Sdl2Backend]): Texture renderer to draw through instead of the screen surface.
+        render_scale (float): Scale the current frame's world is drawn at.
+        render_target (Union[pygame.Surface, Sdl2Backend]): Where the frame is drawn; the screen
+            (or the backend) at full scale, a smaller surface below it.
     """
 
     def __init__(
@@ -31,16 +49,20 @@ class GameView:
         enemies: List[pygame.sprite.Sprite],
         projectiles: List[pygame.sprite.Sprite],
         boss: Optional[pygame.sprite.Sprite] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
+        enemy_projectiles: Optional[List[pygame.sprite.Sprite]] = None,
+        scaler: Optional[ResolutionScaler] = None,
+        backend: Optional[Sdl2Backend] = None,
     ) -> None:
         self.screen = screen
         self.map = map
         self.player = player
         self.enemies = enemies
         self.projectiles = projectiles
+        self.enemy_projectiles = enemy_projectiles if enemy_projectiles is not None else []
         self.boss = boss
 
         self.font = pygame.font.Font(FONT_PATH, 24)
-        self.boss_hp_bar_rect = pygame.Rect(20, 20, 300, 25)
         self.camera_offset = pygame.Vector2(0, 0)
 
         self.screen_width = screen.get_width()
@@ -48,17 +70,52 @@ class GameView:
         self.map_width = self.map.get_width()
         self.map_height = self.map.get_height()
 
+        self.latency_tracker = latency_tracker
+        self.show_latency: bool = False
+        self.render_list = RenderList(2, y_sort=RENDER_Y_SORT)
+        self.hud = Hud((self.screen_width, self.screen_height), self.font)
+
+        self.scaler = scaler
+        self.backend = backend
+        self.render_scale: float = 1.0
+        self.render_target: Union[pygame.Surface, Sdl2Backend] = backend or screen
+        self._scaled_maps: Dict[float, pygame.Surface] = {}
+
     def draw(self) -> None:
         """
         Draw the entire game scene including map, entities, and UI.
+
+        Below full render scale the map and entities are drawn into a smaller
+        target that is stretched to the screen; the UI is always drawn at
+        full resolution on top. With the SDL2 backend everything is drawn
+        as textures at full scale, and the frame is shown by the backend.
         """
-        self.screen.fill((0, 0, 0))
         self.update_camera()
+        self.set_render_scale(self.scaler.scale if self.scaler and not self.backend else 1.0)
 
+        self.render_target.fill((0, 0, 0))
         self.draw_map()
         self.draw_entities()
+        if self.render_scale != 1.0:
+            pygame.transform.scale(self.render_target, (self.screen_width, self.screen_height), self.screen)
         self.draw_ui()
 
+    def set_render_scale(self, scale: float) -> None:
+        """
+        Switch the world render target to the given scale.
+
+        Args:
+            scale (float): Fraction of the screen resolution to render the world at.
+        """
+        if scale == self.render_scale:
+            return
+        self.render_scale = scale
+        if scale == 1.0:
+            self.render_target = self.backend or self.screen
+        else:
+            size = (round(self.screen_width * scale), round(self.screen_height * scale))
+            self.render_target = pygame.Surface(size).convert(self.screen)
+
     def update_camera(self) -> None:
         """
         Update the camera offset based on the player's position,
@@ -72,55 +129,82 @@ class GameView:
 
     def draw_map(self) -> None:
         """
-        Draw the level map on the screen with camera offset applied.
+        Draw the level map on the render target with camera offset applied.
         """
-        self.screen.blit(self.map, (-self.camera_offset.x, -self.camera_offset.y))
+        scale = self.render_scale
+        if scale == 1.0:
+            self.render_target.blit(self.map, (-self.camera_offset.x, -self.camera_offset.y))
+            return
+
+        scaled_map = self._scaled_maps.get(scale)
+        if scaled_map is None:
+            size = (round(self.map_width * scale), round(self.map_height * scale))
+            scaled_map = self._scaled_maps[scale] = pygame.transform.smoothscale(self.map, size)
+        self.render_target.blit(scaled_map, (-int(self.camera_offset.x * scale), -int(self.camera_offset.y * scale)))
 
     def draw_entities(self) -> None:
         """
-        Draw player, enemies, and projectiles on the screen
+        Draw player, enemies, boss and projectiles on the render target
         with camera offset applied.
+
+        Visible sprites are collected into the render list (characters
+        below projectiles) and drawn with a single Surface.blits call.
         """
-        self.screen.blit(self.player.image, self.player.rect.topleft - self.camera_offset)
+        view = pygame.Rect(int(self.camera_offset.x), int(self.camera_offset.y), self.screen_width, self.screen_height)
+        render_list = self.render_list
+        scale = self.render_scale
 
-        for enemy in self.enemies:
-            self.screen.blit(enemy.image, enemy.rect.topleft - self.camera_offset)
+        render_list.add_sprites(LAYER_ACTORS, (self.player,), view, scale)
+        render_list.add_sprites(LAYER_ACTORS, self.enemies, view, scale)
+        if self.boss:
+            render_list.add_sprites(LAYER_ACTORS, (self.boss,), view, scale)
+        render_list.add_sprites(LAYER_PROJECTILES, self.projectiles, view, scale)
+        render_list.add_sprites(LAYER_PROJECTILES, self.enemy_projectiles, view, scale)
 
-        for proj in self.projectiles:
-            self.screen.blit(proj.image, proj.rect.topleft - self.camera_offset)
+        render_list.submit(self.render_target)
 
     def draw_ui(self) -> None:
         """
-        Draw UI elements such as player health and boss health bar.
-        """
-        self.draw_health()
-        if self.boss:
-            self.draw_boss_hp()
+        Draw UI elements such as player health, weapon and boss health bar.
 
-    def draw_health(self) -> None:
+        The HUD re-renders only widgets whose values changed and is
+        composed onto the screen with a single blit.
         """
-        Draw player's health on the screen as text.
-        """
-        health_text = self.font.render(f"Health: {self.player.health}", True, (255, 0, 0))
-        self.screen.blit(health_text, (20, self.screen.get_height() - 40))
+        self.hud.update(self.player, self.boss)
+        self.hud.draw(self.backend or self.screen)
+        if self.show_latency and self.latency_tracker:
+            self.draw_latency()
 
-    def draw_boss_hp(self) -> None:
+    def draw_latency(self) -> None:
         """
-        Draw the boss health bar with current health ratio.
+        Draw input latency statistics and a histogram (5 ms buckets up to 100 ms)
+        in the top-right corner.
+
+        The panel is drawn into its own surface each frame, so it also
+        works as a fresh texture with the SDL2 backend.
         """
-        pygame.draw.rect(self.screen, (255, 255, 255), self.boss_hp_bar_rect, 2)
-        hp_ratio = self.boss.health / self.boss.max_health
-        inner_width = int(self.boss_hp_bar_rect.width * hp_ratio)
-        inner_rect = pygame.Rect(
-            self.boss_hp_bar_rect.x,
-            self.boss_hp_bar_rect.y,
-            inner_width,
-            self.boss_hp_bar_rect.height,
+        stats = self.latency_tracker.summary()
+        panel_surface = pygame.Surface((300, 130))
+        panel = panel_surface.get_rect()
+        pygame.draw.rect(panel_surface, (255, 255, 255), panel, 1)
+
+        text = self.font.render(
+            f"Latency p50 {stats['p50']:.0f}  p95 {stats['p95']:.0f}  p99 {stats['p99']:.0f} ms",
+            True, (255, 255, 255),
         )
-        pygame.draw.rect(self.screen, (255, 0, 0), inner_rect)
+        panel_surface.blit(text, (panel.x + 8, panel.y + 6))
+
+        tracker = self.latency_tracker
+        per_bucket = max(1, int(5 / tracker.bin_ms))
+        buckets = [sum(tracker.bins[i:i + per_bucket]) for i in range(0, per_bucket * 20, per_bucket)]
+        tallest = max(buckets) or 1
+        bar_width = (panel.width - 16) // len(buckets)
+        base_y = panel.bottom - 8
+        for i, count in enumerate(buckets):
+            height = int(80 * count / tallest)
+            pygame.draw.rect(panel_surface, (255, 0, 0), (panel.x + 8 + i * bar_width, base_y - height, bar_width - 2, height))
 
-        boss_text = self.font.render("Boss", True, (255, 255, 255))
-        self.screen.blit(boss_text, (self.boss_hp_bar_rect.x, self.boss_hp_bar_rect.y - 30))
+        (self.backend or self.screen).blit(panel_surface, (self.screen_width - 320, 20))
 
     def update_map_image(self, new_map: pygame.Surface) -> None:
         """
@@ -130,5 +214,6 @@ class GameView:
             new_map (pygame.Surface): New tilemap or level surface.
         """
         self.map = new_map
+        self._scaled_maps.clear()
         self.map_width = self.map.get_width()
         self.map_height = self.map.get_height()
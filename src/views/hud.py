@@ -0,0 +1,103 @@
+import pygame
+import weakref
+from typing import Any, List, Optional, Tuple
+
+
+class Hud:
+    """
+    Heads-up display whose widgets are redrawn only when their value changes.
+
+    Each widget (player health, weapon icon, boss health bar) is a small
+    transparent surface remembered together with the value it shows.
+    update() re-renders just the widgets whose value changed, and draw()
+    composes all visible widgets onto the screen with one blits call. Small
+    per-widget surfaces keep both the steady-state blit and a re-render
+    cheap; a single screen-sized layer would either blend the whole screen
+    every frame or, RLE-encoded, re-encode it on every boss hit. A changed
+    widget gets a new surface, so caches keyed by surface (the SDL2
+    backend's textures) see the change.
+
+    Attributes:
+        font (pygame.font.Font): Font for the widget texts.
+        health_pos (Tuple[int, int]): Position of the health text.
+        weapon_pos (Tuple[int, int]): Position of the weapon icon.
+        boss_pos (Tuple[int, int]): Position of the boss widget ("Boss" label above the bar).
+        boss_hp_bar_rect (pygame.Rect): Boss health bar outline, relative to the boss widget.
+    """
+
+    ICON_SIZE: Tuple[int, int] = (125, 50)
+
+    def __init__(self, size: Tuple[int, int], font: pygame.font.Font) -> None:
+        _, height = size
+        self.font = font
+
+        self.health_pos = (20, height - 40)
+        self.weapon_pos = (20, height - 40 - self.ICON_SIZE[1] - 8)
+        self.boss_pos = (20, 18)
+        self.boss_hp_bar_rect = pygame.Rect(0, 32, 300, 25)
+        self._boss_label = font.render("Boss", True, (255, 255, 255))
+
+        self._health: Optional[int] = None
+        self._icon: Optional[pygame.Surface] = None
+        self._boss: Optional[Tuple[int, int]] = None
+        self._health_surface: Optional[pygame.Surface] = None
+        self._weapon_surface: Optional[pygame.Surface] = None
+        self._boss_surface: Optional[pygame.Surface] = None
+        self._batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._scaled_icons: "weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface]" = weakref.WeakKeyDictionary()
+
+    def update(self, player: Any, boss: Optional[Any]) -> None:
+        """
+        Re-render the widgets whose displayed value changed.
+
+        Args:
+            player (Player): Source of health and the current weapon icon.
+            boss (Optional[Boss]): Current boss, or None to hide the boss bar.
+        """
+        changed = False
+        if player.health != self._health:
+            self._health = player.health
+            self._health_surface = self.font.render(f"Health: {player.health}", True, (255, 0, 0))
+            changed = True
+
+        icon = player.weapon.icon
+        if icon is not self._icon:
+            self._icon = icon
+            self._weapon_surface = self._scaled_icon(icon)
+            changed = True
+
+        boss_state = (boss.health, boss.max_health) if boss else None
+        if boss_state != self._boss:
+            self._boss = boss_state
+            self._boss_surface = self._render_boss(*boss_state) if boss_state else None
+            changed = True
+
+        if changed:
+            self._batch = [(self._health_surface, self.health_pos), (self._weapon_surface, self.weapon_pos)]
+            if self._boss_surface is not None:
+                self._batch.append((self._boss_surface, self.boss_pos))
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Blit the visible widgets in one call.
+
+        Args:
+            screen (pygame.Surface): Target surface, or anything with a compatible blits().
+        """
+        screen.blits(self._batch, doreturn=False)
+
+    def _scaled_icon(self, icon: pygame.Surface) -> pygame.Surface:
+        scaled = self._scaled_icons.get(icon)
+        if scaled is None:
+            scaled = pygame.transform.smoothscale(icon, self.ICON_SIZE)
+            self._scaled_icons[icon] = scaled
+        return scaled
+
+    def _render_boss(self, health: int, max_health: int) -> pygame.Surface:
+        bar = self.boss_hp_bar_rect
+        surface = pygame.Surface((bar.width, bar.bottom), pygame.SRCALPHA)
+        surface.blit(self._boss_label, (0, 0))
+        hp_ratio = max(0.0, min(1.0, health / max_health)) if max_health else 0.0
+        pygame.draw.rect(surface, (255, 0, 0), (bar.x, bar.y, int(bar.width * hp_ratio), bar.height))
+        pygame.draw.rect(surface, (255, 255, 255), bar, 2)
+        return surface
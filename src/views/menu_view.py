@@ -17,6 +17,8 @@ class MainMenu:
         on_quit (Callable): Callback for quitting the game.
         buttons (List[Button]): List of menu buttons.
         volume_slider (Slider): Slider controlling music volume.
+        title_text (pygame.Surface): Pre-rendered game title.
+        volume_label (pygame.Surface): Pre-rendered slider label.
     """
 
     def __init__(
@@ -43,6 +45,10 @@ class MainMenu:
 
         self.volume_slider = Slider((center_x - 100, 460), 200, AudioManager.get_music_volume())
 
+        # Static text is rendered once instead of loading the font every frame
+        self.title_text = pygame.font.Font(FONT_PATH, 200).render("DemonShock", True, (200, 0, 0))
+        self.volume_label = pygame.font.Font(FONT_PATH, 38).render("Music Volume", True, (255, 255, 255))
+
     def draw(self) -> None:
         """
         Draw the main menu including background, buttons, and volume slider.
@@ -61,32 +67,33 @@ class MainMenu:
         """
         Draw the game title on the screen.
         """
-        title_font = pygame.font.Font(FONT_PATH, 200)
-        title_text = title_font.render("DemonShock", True, (200, 0, 0))
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 120))
-        self.screen.blit(title_text, title_rect)
+        title_rect = self.title_text.get_rect(center=(self.screen.get_width() // 2, 120))
+        self.screen.blit(self.title_text, title_rect)
 
     def draw_volume_label(self) -> None:
         """
         Draw the label for the volume slider above it, centered horizontally.
         """
-        font = pygame.font.Font(FONT_PATH, 38)
-        text = font.render("Music Volume", True, (255, 255, 255))
-        text_rect = text.get_rect()
+        text_rect = self.volume_label.get_rect()
         text_rect.centerx = self.volume_slider.x + self.volume_slider.width // 2
         text_rect.bottom = self.volume_slider.y - 5
-        self.screen.blit(text, text_rect)
+        self.screen.blit(self.volume_label, text_rect)
 
     def handle_events(self, event_list: List[pygame.event.Event]) -> None:
         """
-        Handle events for buttons and volume slider and update music volume.
+        Handle events for buttons and volume slider and update music volume if it changed.
 
         Args:
             event_list (List[pygame.event.Event]): List of pygame events to process.
         """
+        previous_volume = self.volume_slider.value
         for event in event_list:
-            for button in self.buttons:
-                button.handle_event(event)
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                for button in self.buttons:
+                    button.handle_event(event)
 
             self.volume_slider.handle_event(event)
+
+        # Only touch the mixer when the slider actually moved
+        if self.volume_slider.value != previous_volume:
             AudioManager.set_music_volume(self.volume_slider.value)
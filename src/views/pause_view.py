@@ -2,16 +2,20 @@ import pygame
 from typing import Callable, List
 from src.views.ui_elements import Button, Slider
 from src.controllers.audio_controller import AudioManager
-from src.models.settings import FONT_PATH
+from src.models.settings import FONT_PATH, PAUSE_DIM_ALPHA, PAUSE_BLUR_FACTOR
 
 
 class PauseMenu:
     """
     Pause menu UI with buttons and volume slider.
 
+    The gameplay frame behind the menu is captured once by open(), blurred and
+    dimmed a single time, and then blitted opaquely every frame, so the
+    background neither keeps darkening nor costs an alpha blend per frame.
+
     Attributes:
         screen (pygame.Surface): Surface to draw the menu on.
-        bg (pygame.Surface): Semi-transparent background overlay.
+        bg (pygame.Surface): Pre-composed background: the frozen frame, blurred and dimmed.
         on_resume (Callable): Callback to resume the game.
         on_save (Callable): Callback to save the game.
         on_quit_to_menu (Callable): Callback to quit to main menu.
@@ -27,9 +31,11 @@ class PauseMenu:
         on_quit_to_menu: Callable,
     ) -> None:
         self.screen = screen
-        self.bg = pygame.Surface(screen.get_size())
-        self.bg.set_alpha(180)
+        self.bg = pygame.Surface(screen.get_size()).convert()
         self.bg.fill((0, 0, 0))
+        self._shade = pygame.Surface(screen.get_size()).convert()
+        self._shade.fill((0, 0, 0))
+        self._shade.set_alpha(PAUSE_DIM_ALPHA)
 
         self.on_resume = on_resume
         self.on_save = on_save
@@ -51,15 +57,35 @@ class PauseMenu:
             AudioManager.get_music_volume(),
         )
 
+        title_font = pygame.font.Font(FONT_PATH, 36)
+        self.title = title_font.render("Pause", True, (255, 255, 255))
+        self.title_rect = self.title.get_rect(center=(center_x, 150))
+        label_font = pygame.font.Font(FONT_PATH, 24)
+        self.volume_label = label_font.render("Music Volume", True, (255, 255, 255))
+
+    def open(self) -> None:
+        """
+        Freeze the frame currently on the screen as the menu background.
+
+        Call once when the game enters the pause state, before the menu is drawn.
+        """
+        frame = self.screen
+        if PAUSE_BLUR_FACTOR > 1:
+            width, height = frame.get_size()
+            small = pygame.transform.smoothscale(
+                frame, (max(1, width // PAUSE_BLUR_FACTOR), max(1, height // PAUSE_BLUR_FACTOR))
+            )
+            pygame.transform.smoothscale(small, (width, height), self.bg)
+        else:
+            self.bg.blit(frame, (0, 0))
+        self.bg.blit(self._shade, (0, 0))
+
     def draw(self) -> None:
         """
         Draw the pause menu on the screen.
         """
         self.screen.blit(self.bg, (0, 0))
-        font = pygame.font.Font(FONT_PATH, 36)
-        title = font.render("Pause", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 150))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(self.title, self.title_rect)
 
         for button in self.buttons:
             button.draw(self.screen)
@@ -71,20 +97,23 @@ class PauseMenu:
         """
         Draw the label for the volume slider.
         """
-        font = pygame.font.Font(FONT_PATH, 24)
-        text = font.render("Music Volume", True, (255, 255, 255))
-        self.screen.blit(text, (self.volume_slider.x, self.volume_slider.y - 30))
+        self.screen.blit(self.volume_label, (self.volume_slider.x, self.volume_slider.y - 30))
 
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         """
-        Handle events for buttons and volume slider, and update music volume.
+        Handle events for buttons and volume slider, and update music volume if it changed.
 
         Args:
             events (List[pygame.event.Event]): List of pygame events to process.
         """
+        previous_volume = self.volume_slider.value
         for event in events:
-            for button in self.buttons:
-                button.handle_event(event)
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                for button in self.buttons:
+                    button.handle_event(event)
 
             self.volume_slider.handle_event(event)
+
+        # Only touch the mixer when the slider actually moved
+        if self.volume_slider.value != previous_volume:
             AudioManager.set_music_volume(self.volume_slider.value)
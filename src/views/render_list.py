@@ -0,0 +1,71 @@
+import pygame
+from itertools import chain
+from typing import Iterable, List, Tuple
+from src.models.sprite_cache import SpriteCache
+
+
+class RenderList:
+    """
+    Per-frame list of blits, grouped into layers and submitted in one call.
+
+    Views add sprites layer by layer; sprites outside the view are culled and
+    camera-relative destinations are computed as plain tuples. submit() then
+    hands every (image, dest) pair to a single Surface.blits call, drawing
+    the layers in index order. With `y_sort`, entries inside a layer are
+    drawn by the bottom edge of their image, so lower sprites overlap
+    higher ones. A `scale` below 1 queues cached downscaled images at scaled
+    positions for drawing into a reduced-resolution render target.
+
+    Attributes:
+        layers (List[List[Tuple[pygame.Surface, Tuple[int, int]]]]): Queued blits per layer.
+        y_sort (bool): Sort each layer by the bottom edge before drawing.
+        last_count (int): Number of blits submitted by the last submit().
+    """
+
+    def __init__(self, layer_count: int, y_sort: bool = False) -> None:
+        self.layers: List[List[Tuple[pygame.Surface, Tuple[int, int]]]] = [[] for _ in range(layer_count)]
+        self.y_sort = y_sort
+        self.last_count: int = 0
+
+    def add_sprites(self, layer: int, sprites: Iterable[pygame.sprite.Sprite], view: pygame.Rect, scale: float = 1.0) -> None:
+        """
+        Queue the sprites that overlap the view.
+
+        Args:
+            layer (int): Layer index; higher layers are drawn on top.
+            sprites (Iterable[pygame.sprite.Sprite]): Sprites with `image` and `rect` in map coordinates.
+            view (pygame.Rect): Visible area in map coordinates; its topleft is the camera offset.
+            scale (float): Render scale of the target surface.
+        """
+        entries = self.layers[layer]
+        ox, oy = view.topleft
+        visible = view.colliderect
+        if scale == 1.0:
+            for sprite in sprites:
+                rect = sprite.rect
+                if visible(rect):
+                    entries.append((sprite.image, (rect.x - ox, rect.y - oy)))
+            return
+
+        scaled = SpriteCache.get_scaled
+        for sprite in sprites:
+            rect = sprite.rect
+            if visible(rect):
+                entries.append((scaled(sprite.image, scale), (int((rect.x - ox) * scale), int((rect.y - oy) * scale))))
+
+    def submit(self, surface: pygame.Surface) -> None:
+        """
+        Draw all queued blits with one Surface.blits call and clear the list.
+
+        Args:
+            surface (pygame.Surface): Target surface.
+        """
+        if self.y_sort:
+            for entries in self.layers:
+                entries.sort(key=lambda entry: entry[1][1] + entry[0].get_height())
+        batch = list(chain.from_iterable(self.layers))
+        if batch:
+            surface.blits(batch, doreturn=False)
+        self.last_count = len(batch)
+        for entries in self.layers:
+            entries.clear()
@@ -0,0 +1,148 @@
+import sys
+import pygame
+import weakref
+from typing import Iterable, Optional, Sequence, Tuple
+
+try:
+    from pygame._sdl2 import video
+except ImportError:  # pygame built without the SDL2 video bindings
+    video = None
+
+
+class Sdl2Backend:
+    """
+    Render backend built on pygame._sdl2.video (Window, Renderer, Texture).
+
+    It offers the part of the Surface interface the views draw with (fill,
+    blit and blits), so GameView, RenderList and Hud draw through it
+    unchanged. Each image is uploaded to a texture once, on first use, and
+    the texture is cached per surface. Images must therefore be read-only
+    once drawn, as SpriteCache images already are; a widget whose content
+    changes has to be drawn from a new surface. Screens that are still
+    composed in software (the menus) are uploaded as one texture per frame
+    by present_surface().
+
+    Attributes:
+        size (Tuple[int, int]): Window size in pixels.
+        window (video.Window): The game window.
+        renderer (video.Renderer): Renderer drawing into the window.
+    """
+
+    def __init__(self, size: Tuple[int, int], title: str, driver: str = "") -> None:
+        self.size = size
+        self.window = video.Window(title, size)
+        index = -1
+        if driver:
+            names = [info.name for info in video.get_drivers()]
+            if driver not in names:
+                self.window.destroy()
+                raise ValueError(f"unknown render driver '{driver}', available: {', '.join(names)}")
+            index = names.index(driver)
+        try:
+            self.renderer = video.Renderer(self.window, index=index, accelerated=-1)
+        except pygame.error:
+            self.window.destroy()
+            raise
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, video.Texture]" = weakref.WeakKeyDictionary()
+        self._frame: Optional[video.Texture] = None
+
+    @classmethod
+    def create(cls, size: Tuple[int, int], title: str, driver: str = "") -> Optional["Sdl2Backend"]:
+        """
+        Create the backend, or return None so the caller falls back to software rendering.
+
+        Args:
+            size (Tuple[int, int]): Window size in pixels.
+            title (str): Window title.
+            driver (str): SDL render driver name (e.g. "software", "opengl"); empty picks the best one.
+
+        Returns:
+            Optional[Sdl2Backend]: The backend, or None if SDL2 rendering is unavailable.
+        """
+        if video is None:
+            print("SDL2 render backend unavailable in this pygame build, using software rendering", file=sys.stderr)
+            return None
+        try:
+            return cls(size, title, driver)
+        except (pygame.error, ValueError) as e:
+            print(f"SDL2 render backend unavailable ({e}), using software rendering", file=sys.stderr)
+            return None
+
+    def texture(self, image: pygame.Surface) -> "video.Texture":
+        """
+        Return the texture for an image, uploading it on first use.
+
+        Args:
+            image (pygame.Surface): Read-only image.
+
+        Returns:
+            video.Texture: The cached texture.
+        """
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = video.Texture.from_surface(self.renderer, image)
+            self._textures[image] = texture
+        return texture
+
+    def fill(self, color: Sequence[int]) -> None:
+        """
+        Clear the frame to a color.
+
+        Args:
+            color (Sequence[int]): RGB color.
+        """
+        self.renderer.draw_color = (*color[:3], 255)
+        self.renderer.clear()
+
+    def blit(self, image: pygame.Surface, dest: Sequence[float]) -> None:
+        """
+        Draw an image at a position.
+
+        Args:
+            image (pygame.Surface): Read-only image.
+            dest (Sequence[float]): Top-left position.
+        """
+        self.texture(image).draw(dstrect=(int(dest[0]), int(dest[1])))
+
+    def blits(self, blit_sequence: Iterable[Tuple[pygame.Surface, Sequence[float]]], doreturn: bool = True) -> None:
+        """
+        Draw a sequence of (image, position) pairs, like Surface.blits.
+
+        The renderer batches the copies itself. Unlike Surface.blits no
+        rectangles are returned; `doreturn` is accepted for compatibility.
+
+        Args:
+            blit_sequence (Iterable[Tuple[pygame.Surface, Sequence[float]]]): Images and top-left positions.
+            doreturn (bool): Ignored.
+        """
+        texture = self.texture
+        for image, dest in blit_sequence:
+            texture(image).draw(dstrect=(int(dest[0]), int(dest[1])))
+
+    def present(self) -> None:
+        """
+        Show the frame drawn through this backend.
+        """
+        self.renderer.present()
+
+    def present_surface(self, surface: pygame.Surface) -> None:
+        """
+        Upload a software-composed screen and show it.
+
+        Args:
+            surface (pygame.Surface): Screen-sized surface, e.g. a menu frame.
+        """
+        if self._frame is None:
+            self._frame = video.Texture(self.renderer, self.size, streaming=True)
+        self._frame.update(surface)
+        self._frame.draw()
+        self.renderer.present()
+
+    def read_pixels(self, surface: pygame.Surface) -> None:
+        """
+        Copy the frame drawn so far into a surface. Call before present().
+
+        Args:
+            surface (pygame.Surface): Screen-sized destination surface.
+        """
+        self.renderer.to_surface(surface)
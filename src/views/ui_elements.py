@@ -1,6 +1,7 @@
 import pygame
 from typing import Callable, Tuple
 from src.models.settings import FONT_PATH
+from src.controllers.audio_controller import AudioManager
 
 
 class Button:
@@ -59,6 +60,7 @@ class Button:
         """
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
+                AudioManager.play_sfx("click")
                 self.callback()
 
 
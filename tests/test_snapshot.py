@@ -0,0 +1,147 @@
+"""
+Round-trip tests for world snapshots.
+
+A world is played for a while by the balance bot, encoded and restored into
+a fresh player and level manager. The restored world must encode to the same
+bytes and then step exactly like the original under the same inputs.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import unittest
+from src.tools.headless import init_headless
+
+FPS_DT_MS = 16
+STEP_TICKS = 300
+
+
+def setUpModule() -> None:
+    init_headless()
+
+
+def play(seed: int, level: int, boss_index: int, ticks: int, summon_budget: int = 0, summon_policy: str = "queue"):
+    """
+    Start a level and let the bot play it.
+
+    Args:
+        seed (int): LevelManager seed.
+        level (int): Level to start.
+        boss_index (int): Boss order position, so the level gets the wanted boss.
+        ticks (int): Ticks to play.
+        summon_budget (int): Entity budget of the summon pipeline; 0 keeps the setting.
+        summon_policy (str): Over-budget policy of the summon pipeline.
+
+    Returns:
+        tuple: (player, level_manager, input_handler, bot, game_time)
+    """
+    from src.controllers.gameplay import update_gameplay
+    from src.controllers.input_handler import InputHandler
+    from src.controllers.level_manager import LevelManager
+    from src.models.player import Player
+    from src.tools.bot import BotPlayer
+
+    level_manager = LevelManager(seed=seed)
+    if summon_budget:
+        level_manager.summons.budget = summon_budget
+    level_manager.summons.policy = summon_policy
+    level_manager.boss_index = boss_index
+    level_manager.start_level(level)
+    player = Player(pos=(400, 300))
+    player.set_collision_mask(level_manager.get_collision_mask())
+    input_handler = InputHandler()
+    bot = BotPlayer()
+    game_time = 0
+    for _ in range(ticks):
+        bot.control(input_handler, player, level_manager)
+        game_time += FPS_DT_MS
+        update_gameplay(player, level_manager, input_handler, FPS_DT_MS / 1000, game_time)
+    return player, level_manager, input_handler, bot, game_time
+
+
+def restore_copy(data: bytes, summon_budget: int = 0, summon_policy: str = "queue"):
+    """
+    Restore a snapshot into a new player and a level manager with a different seed.
+
+    Args:
+        data (bytes): Snapshot from encode_world().
+        summon_budget (int): Entity budget of the summon pipeline; 0 keeps the setting.
+        summon_policy (str): Over-budget policy of the summon pipeline.
+
+    Returns:
+        tuple: (player, level_manager)
+    """
+    from src.controllers.level_manager import LevelManager
+    from src.models.player import Player
+    from src.models.snapshot import decode_world, restore_world
+
+    level_manager = LevelManager(seed=12345)
+    if summon_budget:
+        level_manager.summons.budget = summon_budget
+    level_manager.summons.policy = summon_policy
+    level_manager.start_level(5)
+    player = Player(pos=(100, 100))
+    restore_world(decode_world(data), player, level_manager)
+    return player, level_manager
+
+
+class SnapshotRoundTripTest(unittest.TestCase):
+    # (seed, level, boss index, ticks, summon budget, summon policy): enemy fire
+    # from the ShooterBoss, queued and merged summons from the SummonerBoss
+    # (a budget of 2 leaves room for one minion next to the boss), and wave enemies
+    SCENARIOS = (
+        (7, 1, 0, 600, 0, "queue"),
+        (11, 3, 2, 520, 2, "queue"),
+        (11, 3, 2, 520, 2, "merge"),
+        (3, 4, 0, 600, 0, "queue"),
+    )
+
+    def check_round_trip(self, seed: int, level: int, boss_index: int, ticks: int, summon_budget: int,
+                         summon_policy: str) -> None:
+        from src.controllers.gameplay import update_gameplay
+        from src.models.snapshot import encode_world
+
+        player, level_manager, input_handler, bot, game_time = play(seed, level, boss_index, ticks,
+                                                                    summon_budget, summon_policy)
+        data = encode_world(player, level_manager)
+        copy_player, copy_manager = restore_copy(data, summon_budget, summon_policy)
+        self.assertEqual(encode_world(copy_player, copy_manager), data)
+
+        for tick in range(STEP_TICKS):
+            # The bot decides from the original world; both worlds get the same input
+            bot.control(input_handler, player, level_manager)
+            game_time += FPS_DT_MS
+            update_gameplay(player, level_manager, input_handler, FPS_DT_MS / 1000, game_time)
+            update_gameplay(copy_player, copy_manager, input_handler, FPS_DT_MS / 1000, game_time)
+            self.assertEqual(encode_world(copy_player, copy_manager), encode_world(player, level_manager),
+                             f"worlds diverged {tick + 1} ticks after the restore")
+
+    def test_restored_world_steps_like_the_original(self) -> None:
+        for scenario in self.SCENARIOS:
+            with self.subTest(seed=scenario[0], level=scenario[1], policy=scenario[5]):
+                self.check_round_trip(*scenario)
+
+    def test_snapshot_covers_enemy_fire_and_summons(self) -> None:
+        from src.models.snapshot import decode_world, encode_world
+
+        player, level_manager, *_ = play(*self.SCENARIOS[0])
+        self.assertTrue(decode_world(encode_world(player, level_manager))['enemy_projectiles'])
+
+        player, level_manager, *_ = play(*self.SCENARIOS[1])
+        snapshot = decode_world(encode_world(player, level_manager))
+        self.assertTrue(snapshot['pending_summons'])
+        self.assertTrue(any(record[6] & 0x01 for record in snapshot['enemies']))
+
+    def test_rejects_other_versions(self) -> None:
+        from src.models.snapshot import SnapshotError, decode_world, encode_world
+
+        player, level_manager, *_ = play(7, 1, 0, 1)
+        data = bytearray(encode_world(player, level_manager))
+        data[4] = 1
+        with self.assertRaises(SnapshotError):
+            decode_world(bytes(data))
+        with self.assertRaises(SnapshotError):
+            decode_world(bytes(data[:-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()